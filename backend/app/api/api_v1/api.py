@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import auth, categories, items, reservations, rentals
+from app.api.api_v1.endpoints import auth, categories, items, reservations, rentals, audit_logs
 
 api_router = APIRouter()
 
@@ -19,5 +19,8 @@ api_router.include_router(reservations.router, prefix="/reservations", tags=["
 # 대여 관리 라우터
 api_router.include_router(rentals.router, prefix="/rentals", tags=["대여"])
 
+# 감사 로그 조회 라우터
+api_router.include_router(audit_logs.router, prefix="/audit-logs", tags=["감사 로그"])
+
 # TODO: 추후 다른 엔드포인트들 추가
 # api_router.include_router(admin.router, prefix="/admin", tags=["관리자"])
\ No newline at end of file
@@ -0,0 +1,109 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import datetime
+
+from app.core.responses import json_list_response
+from app.db.database import get_db_session, DBSession
+from app.schemas.audit_log import AuditLogExportFormat, AuditLogFilter, AuditLogList
+from app.services.async_service import AsyncAuditLogService
+from app.services.audit_log_service import stream_export
+from app.api.deps import get_current_admin_user
+from app.models.user import User
+
+router = APIRouter()
+
+_EXPORT_MEDIA_TYPES = {
+    AuditLogExportFormat.NDJSON: "application/x-ndjson",
+    AuditLogExportFormat.CSV: "text/csv",  # charset=utf-8은 StreamingResponse가 붙임
+}
+
+
+@router.get("", response_model=AuditLogList, summary="감사 로그 조회")
+async def get_audit_logs(
+    limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    user_id: Optional[int] = Query(None, description="작업한 사용자 ID 필터"),
+    action: Optional[str] = Query(None, description="작업 필터 (예: RENTAL_RETURNED)"),
+    table_name: Optional[str] = Query(None, description="대상 테이블 필터 (예: rentals)"),
+    record_id: Optional[int] = Query(None, description="대상 레코드 ID 필터"),
+    date_from: Optional[datetime] = Query(None, description="시작 시각 (포함)"),
+    date_to: Optional[datetime] = Query(None, description="종료 시각 (미포함)"),
+    db: DBSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    감사 로그를 최신순으로 조회합니다.
+
+    **관리자 권한이 필요합니다.**
+
+    - **limit**: 조회할 개수 (최대 1000개)
+    - **cursor**: 이전 응답의 next_cursor (깊은 페이지도 일정한 속도로 조회)
+    - **user_id, action, table_name, record_id**: 일치 조건 필터
+    - **date_from, date_to**: 기간 필터 (timezone이 없으면 UTC)
+
+    보존 기간이 지나 보관 파일로 옮겨진 로그도 함께 조회됩니다.
+    특정 대여의 처리 이력은 `table_name=rentals&record_id={id}`로 조회합니다.
+    """
+    filters = AuditLogFilter(
+        user_id=user_id,
+        action=action,
+        table_name=table_name,
+        record_id=record_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    try:
+        return json_list_response(
+            await AsyncAuditLogService.get_audit_logs(db=db, filters=filters, limit=limit, cursor=cursor),
+            "audit_logs"
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"감사 로그 조회 중 오류 발생: {str(e)}"
+        )
+
+
+@router.get("/export", summary="감사 로그 내보내기")
+async def export_audit_logs(
+    export_format: AuditLogExportFormat = Query(
+        AuditLogExportFormat.NDJSON, alias="format", description="내보내기 형식 (ndjson, csv)"
+    ),
+    user_id: Optional[int] = Query(None, description="작업한 사용자 ID 필터"),
+    action: Optional[str] = Query(None, description="작업 필터 (예: RENTAL_RETURNED)"),
+    table_name: Optional[str] = Query(None, description="대상 테이블 필터 (예: rentals)"),
+    record_id: Optional[int] = Query(None, description="대상 레코드 ID 필터"),
+    date_from: Optional[datetime] = Query(None, description="시작 시각 (포함)"),
+    date_to: Optional[datetime] = Query(None, description="종료 시각 (미포함)"),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    조건에 맞는 감사 로그 전체를 오래된 순으로 파일로 내려받습니다.
+
+    **관리자 권한이 필요합니다.**
+
+    - **format**: `ndjson` (한 줄에 JSON 하나) 또는 `csv`
+    - 필터는 감사 로그 조회와 같습니다.
+
+    조회한 로그를 바로 스트리밍하므로 수백만 건도 서버 메모리 사용량이 일정합니다.
+    """
+    filters = AuditLogFilter(
+        user_id=user_id,
+        action=action,
+        table_name=table_name,
+        record_id=record_id,
+        date_from=date_from,
+        date_to=date_to
+    )
+    filename = f"audit_logs-{datetime.utcnow():%Y%m%d%H%M%S}.{export_format.value}"
+    return StreamingResponse(
+        stream_export(filters, export_format),
+        media_type=_EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,22 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
 from typing import Optional
+from pydantic import TypeAdapter
 
-from app.db.database import get_db
+from app.core.response_cache import response_cache, CATEGORIES, ITEM_CATALOG
+from app.db.database import get_db_session, DBSession
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryList
-from app.services.category_service import CategoryService
+from app.services.async_service import AsyncCategoryService
 from app.api.deps import get_current_user, get_current_admin_user
 from app.models.user import User
 
 router = APIRouter()
 
+_CATEGORY_LIST = TypeAdapter(CategoryList)
+
 
 @router.get("", response_model=CategoryList, summary="카테고리 목록 조회")
-def get_categories(
+async def get_categories(
+    request: Request,
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
     include_inactive: bool = Query(False, description="비활성 카테고리 포함 여부"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -25,17 +29,26 @@ def get_categories(
     - **skip**: 건너뛸 개수 (페이지네이션)
     - **limit**: 조회할 개수 (최대 1000개)
     - **include_inactive**: 비활성 카테고리 포함 여부 (관리자만 가능)
+    
+    응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다.
     """
     # 일반 사용자는 비활성 카테고리 조회 불가
     if include_inactive and not current_user.is_admin:
         include_inactive = False
     
     try:
-        return CategoryService.get_categories(
-            db=db, 
-            skip=skip, 
-            limit=limit, 
-            include_inactive=include_inactive
+        return await response_cache.respond(
+            request,
+            "categories",
+            [CATEGORIES, ITEM_CATALOG],
+            _CATEGORY_LIST,
+            lambda: AsyncCategoryService.get_categories(
+                db=db, 
+                skip=skip, 
+                limit=limit, 
+                include_inactive=include_inactive
+            ),
+            scope="admin" if current_user.is_admin else "user"
         )
     except Exception as e:
         raise HTTPException(
@@ -44,10 +57,33 @@ def get_categories(
         )
 
 
+@router.get("/statistics", response_model=dict, summary="카테고리 통계 조회")
+async def get_category_statistics(
+    db: DBSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    카테고리 통계 정보를 조회합니다.
+    
+    **관리자 권한이 필요합니다.**
+    
+    다음 정보를 포함합니다:
+    - 전체/활성 카테고리 개수
+    - 카테고리별 품목 개수
+    """
+    try:
+        return await AsyncCategoryService.get_category_statistics(db=db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"카테고리 통계 조회 중 오류 발생: {str(e)}"
+        )
+
+
 @router.get("/{category_id}", response_model=CategoryResponse, summary="특정 카테고리 조회")
-def get_category(
+async def get_category(
     category_id: int,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -56,7 +92,7 @@ def get_category(
     - **category_id**: 조회할 카테고리 ID
     """
     try:
-        category = CategoryService.get_category(db=db, category_id=category_id)
+        category = await AsyncCategoryService.get_category(db=db, category_id=category_id)
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -81,10 +117,10 @@ def get_category(
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED, summary="카테고리 생성")
-def create_category(
+async def create_category(
     category_data: CategoryCreate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -99,7 +135,7 @@ def create_category(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        return CategoryService.create_category(
+        return await AsyncCategoryService.create_category(
             db=db,
             category_data=category_data,
             user_id=current_admin.id,
@@ -118,11 +154,11 @@ def create_category(
 
 
 @router.put("/{category_id}", response_model=CategoryResponse, summary="카테고리 수정")
-def update_category(
+async def update_category(
     category_id: int,
     category_data: CategoryUpdate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -139,7 +175,7 @@ def update_category(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        category = CategoryService.update_category(
+        category = await AsyncCategoryService.update_category(
             db=db,
             category_id=category_id,
             category_data=category_data,
@@ -169,10 +205,10 @@ def update_category(
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT, summary="카테고리 삭제")
-def delete_category(
+async def delete_category(
     category_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -188,7 +224,7 @@ def delete_category(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        success = CategoryService.delete_category(
+        success = await AsyncCategoryService.delete_category(
             db=db,
             category_id=category_id,
             user_id=current_admin.id,
@@ -214,26 +250,3 @@ def delete_category(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"카테고리 삭제 중 오류 발생: {str(e)}"
         )
-
-
-@router.get("/statistics", response_model=dict, summary="카테고리 통계 조회")
-def get_category_statistics(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin_user)
-):
-    """
-    카테고리 통계 정보를 조회합니다.
-    
-    **관리자 권한이 필요합니다.**
-    
-    다음 정보를 포함합니다:
-    - 전체/활성 카테고리 개수
-    - 카테고리별 품목 개수
-    """
-    try:
-        return CategoryService.get_category_statistics(db=db)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"카테고리 통계 조회 중 오류 발생: {str(e)}"
-        )
\ No newline at end of file
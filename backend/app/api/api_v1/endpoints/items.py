@@ -1,25 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
 from typing import Optional
+from pydantic import TypeAdapter
 
-from app.db.database import get_db
+from app.core.response_cache import response_cache, CATEGORIES, ITEMS, item_version
+from app.core.responses import json_list_response, json_response
+from app.db.database import get_db_session, DBSession
 from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse, ItemList, ItemFilter, ItemStatus
-from app.services.item_service import ItemService
+from app.services.async_service import AsyncItemService, AsyncReservationService
+from app.services.reservation_service import expiry_horizon
 from app.api.deps import get_current_user, get_current_admin_user
 from app.models.user import User
 
 router = APIRouter()
 
+_ITEM = TypeAdapter(ItemResponse)
+_ITEM_LIST = TypeAdapter(list[ItemResponse])
+
 
 @router.get("", response_model=ItemList, summary="품목 목록 조회")
-def get_items(
+async def get_items(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 skip 무시)"),
     category_id: Optional[int] = Query(None, description="카테고리 ID 필터"),
     status: Optional[ItemStatus] = Query(None, description="상태 필터"),
     is_active: Optional[bool] = Query(None, description="활성 상태 필터 (관리자만)"),
     search: Optional[str] = Query(None, min_length=1, max_length=100, description="검색어"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -27,6 +34,7 @@ def get_items(
     
     - **skip**: 건너뛸 개수 (페이지네이션)
     - **limit**: 조회할 개수 (최대 1000개)
+    - **cursor**: 이전 응답의 next_cursor (깊은 페이지도 일정한 속도로 조회)
     - **category_id**: 특정 카테고리의 품목만 조회
     - **status**: 특정 상태의 품목만 조회
     - **is_active**: 활성 상태 필터 (관리자만 사용 가능)
@@ -44,11 +52,18 @@ def get_items(
             search=search
         )
         
-        return ItemService.get_items(
+        return json_list_response(await AsyncItemService.get_items(
             db=db,
             skip=skip,
             limit=limit,
-            filters=filters
+            filters=filters,
+            cursor=cursor
+        ), "items")
+    except ValueError as e:
+        # 이 함수에서는 status 쿼리 파라미터가 fastapi.status 모듈을 가리므로 숫자 코드 사용
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -58,11 +73,12 @@ def get_items(
 
 
 @router.get("/available", response_model=list[ItemResponse], summary="대여 가능한 품목 조회")
-def get_available_items(
+async def get_available_items(
+    request: Request,
     category_id: Optional[int] = Query(None, description="카테고리 ID 필터"),
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -71,34 +87,105 @@ def get_available_items(
     - **category_id**: 특정 카테고리의 품목만 조회
     - **skip**: 건너뛸 개수
     - **limit**: 조회할 개수
+    
+    응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다.
     """
     try:
-        return ItemService.get_available_items(
+        # 만료된 예약이 있으면 캐시 조회 전에 만료 처리 (관련 캐시 응답도 함께 무효화됨)
+        if expiry_horizon.is_due():
+            await AsyncReservationService.release_expired_reservations(db=db)
+        
+        return await response_cache.respond(
+            request,
+            "items_available",
+            [CATEGORIES, ITEMS],
+            _ITEM_LIST,
+            lambda: AsyncItemService.get_available_items(
+                db=db,
+                category_id=category_id,
+                skip=skip,
+                limit=limit
+            )
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"대여 가능한 품목 조회 중 오류 발생: {str(e)}"
+        )
+
+
+@router.get("/search", response_model=list[ItemResponse], summary="품목 검색")
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 개수"),
+    category_id: Optional[int] = Query(None, description="카테고리 ID 필터"),
+    db: DBSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    품목명, 설명, 일련번호로 품목을 검색합니다. (관련도 순)
+
+    - **q**: 검색어 (한글 부분 검색 지원)
+    - **limit**: 조회할 개수 (최대 100개)
+    - **category_id**: 특정 카테고리의 품목만 검색
+
+    **일반 사용자는 활성 품목만 검색됩니다.**
+    """
+    try:
+        return json_response(_ITEM_LIST, await AsyncItemService.search_items(
             db=db,
+            query=q,
+            limit=limit,
             category_id=category_id,
-            skip=skip,
-            limit=limit
+            active_only=not current_user.is_admin
+        ))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"품목 검색 중 오류 발생: {str(e)}"
         )
+
+
+@router.get("/statistics", response_model=dict, summary="품목 통계 조회")
+async def get_item_statistics(
+    db: DBSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    품목 통계 정보를 조회합니다.
+    
+    **관리자 권한이 필요합니다.**
+    
+    다음 정보를 포함합니다:
+    - 전체 품목 개수
+    - 상태별 품목 개수
+    - 카테고리별 품목 개수
+    """
+    try:
+        return await AsyncItemService.get_item_statistics(db=db)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"대여 가능한 품목 조회 중 오류 발생: {str(e)}"
+            detail=f"품목 통계 조회 중 오류 발생: {str(e)}"
         )
 
 
 @router.get("/{item_id}", response_model=ItemResponse, summary="특정 품목 조회")
-def get_item(
+async def get_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     특정 품목의 상세 정보를 조회합니다.
     
     - **item_id**: 조회할 품목 ID
+    
+    응답은 캐시되며 ETag가 같으면(If-None-Match) 304를 반환합니다.
     """
-    try:
-        item = ItemService.get_item(db=db, item_id=item_id)
+    async def load_item():
+        item = await AsyncItemService.get_item(db=db, item_id=item_id)
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -113,6 +200,20 @@ def get_item(
             )
         
         return item
+    
+    try:
+        if expiry_horizon.is_due():
+            await AsyncReservationService.release_expired_reservations(db=db)
+        
+        # 404는 캐시하지 않으며, 비활성 품목 노출 여부가 다르므로 관리자/일반 사용자 응답을 따로 캐시
+        return await response_cache.respond(
+            request,
+            "item_detail",
+            [CATEGORIES, item_version(item_id)],
+            _ITEM,
+            load_item,
+            scope="admin" if current_user.is_admin else "user"
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -123,9 +224,9 @@ def get_item(
 
 
 @router.get("/serial/{serial_number}", response_model=ItemResponse, summary="일련번호로 품목 조회")
-def get_item_by_serial(
+async def get_item_by_serial(
     serial_number: str,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -134,7 +235,7 @@ def get_item_by_serial(
     - **serial_number**: 품목 일련번호
     """
     try:
-        item = ItemService.get_item_by_serial(db=db, serial_number=serial_number)
+        item = await AsyncItemService.get_item_by_serial(db=db, serial_number=serial_number)
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -159,10 +260,10 @@ def get_item_by_serial(
 
 
 @router.post("", response_model=ItemResponse, status_code=status.HTTP_201_CREATED, summary="품목 생성")
-def create_item(
+async def create_item(
     item_data: ItemCreate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -180,7 +281,7 @@ def create_item(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        return ItemService.create_item(
+        return await AsyncItemService.create_item(
             db=db,
             item_data=item_data,
             user_id=current_admin.id,
@@ -199,11 +300,11 @@ def create_item(
 
 
 @router.put("/{item_id}", response_model=ItemResponse, summary="품목 수정")
-def update_item(
+async def update_item(
     item_id: int,
     item_data: ItemUpdate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -223,7 +324,7 @@ def update_item(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        item = ItemService.update_item(
+        item = await AsyncItemService.update_item(
             db=db,
             item_id=item_id,
             item_data=item_data,
@@ -253,10 +354,10 @@ def update_item(
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT, summary="품목 삭제")
-def delete_item(
+async def delete_item(
     item_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -272,7 +373,7 @@ def delete_item(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        success = ItemService.delete_item(
+        success = await AsyncItemService.delete_item(
             db=db,
             item_id=item_id,
             user_id=current_admin.id,
@@ -298,27 +399,3 @@ def delete_item(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"품목 삭제 중 오류 발생: {str(e)}"
         )
-
-
-@router.get("/statistics", response_model=dict, summary="품목 통계 조회")
-def get_item_statistics(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin_user)
-):
-    """
-    품목 통계 정보를 조회합니다.
-    
-    **관리자 권한이 필요합니다.**
-    
-    다음 정보를 포함합니다:
-    - 전체 품목 개수
-    - 상태별 품목 개수
-    - 카테고리별 품목 개수
-    """
-    try:
-        return ItemService.get_item_statistics(db=db)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"품목 통계 조회 중 오류 발생: {str(e)}"
-        )
\ No newline at end of file
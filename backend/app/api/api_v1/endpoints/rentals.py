@@ -1,24 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
+from pydantic import TypeAdapter
 
-from app.db.database import get_db
+from app.core.responses import json_list_response, json_response
+from app.db.database import get_db_session, DBSession
 from app.schemas.rental import (
     RentalCreate, RentalUpdate, RentalResponse, RentalList, 
     RentalFilter, RentalStatus, RentalReturn, RentalExtend, RentalHistory
 )
-from app.services.rental_service import RentalService
+from app.services.async_service import AsyncRentalService
 from app.api.deps import get_current_user, get_current_admin_user
 from app.models.user import User
 
 router = APIRouter()
 
+_RENTAL_LIST = TypeAdapter(list[RentalResponse])
+
 
 @router.get("", response_model=RentalList, summary="대여 목록 조회")
-def get_rentals(
+async def get_rentals(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 skip 무시)"),
     user_id: Optional[int] = Query(None, description="사용자 ID 필터 (관리자만)"),
     item_id: Optional[int] = Query(None, description="품목 ID 필터"),
     category_id: Optional[int] = Query(None, description="카테고리 ID 필터"),
@@ -28,7 +32,7 @@ def get_rentals(
     date_to: Optional[datetime] = Query(None, description="종료 날짜"),
     due_date_from: Optional[datetime] = Query(None, description="반납 예정일 시작"),
     due_date_to: Optional[datetime] = Query(None, description="반납 예정일 종료"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -36,6 +40,7 @@ def get_rentals(
     
     - **skip**: 건너뛸 개수 (페이지네이션)
     - **limit**: 조회할 개수 (최대 1000개)
+    - **cursor**: 이전 응답의 next_cursor (깊은 페이지도 일정한 속도로 조회)
     - **user_id**: 특정 사용자의 대여만 조회 (관리자만 사용 가능)
     - **item_id**: 특정 품목의 대여만 조회
     - **category_id**: 특정 카테고리의 대여만 조회
@@ -59,13 +64,20 @@ def get_rentals(
             due_date_to=due_date_to
         )
         
-        return RentalService.get_rentals(
+        return json_list_response(await AsyncRentalService.get_rentals(
             db=db,
             skip=skip,
             limit=limit,
             filters=filters,
             current_user_id=current_user.id,
-            is_admin=current_user.is_admin
+            is_admin=current_user.is_admin,
+            cursor=cursor
+        ), "rentals")
+    except ValueError as e:
+        # 이 함수에서는 status 쿼리 파라미터가 fastapi.status 모듈을 가리므로 숫자 코드 사용
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -75,8 +87,8 @@ def get_rentals(
 
 
 @router.get("/my", response_model=list[RentalResponse], summary="내 활성 대여 조회")
-def get_my_active_rentals(
-    db: Session = Depends(get_db),
+async def get_my_active_rentals(
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -85,10 +97,10 @@ def get_my_active_rentals(
     활성 대여: ACTIVE 또는 OVERDUE 상태의 대여들
     """
     try:
-        return RentalService.get_user_active_rentals(
+        return json_response(_RENTAL_LIST, await AsyncRentalService.get_user_active_rentals(
             db=db,
             user_id=current_user.id
-        )
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -96,10 +108,36 @@ def get_my_active_rentals(
         )
 
 
+@router.get("/statistics", response_model=dict, summary="대여 통계 조회")
+async def get_rental_statistics(
+    db: DBSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    대여 통계 정보를 조회합니다.
+    
+    **관리자 권한이 필요합니다.**
+    
+    다음 정보를 포함합니다:
+    - 전체 대여 개수
+    - 상태별 대여 개수
+    - 오늘 대여 개수
+    - 현재 활성/연체 대여 개수
+    - 평균 대여 기간
+    """
+    try:
+        return await AsyncRentalService.get_rental_statistics(db=db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"대여 통계 조회 중 오류 발생: {str(e)}"
+        )
+
+
 @router.get("/{rental_id}", response_model=RentalResponse, summary="특정 대여 조회")
-def get_rental(
+async def get_rental(
     rental_id: int,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -110,7 +148,7 @@ def get_rental(
     **일반 사용자는 자신의 대여만 조회 가능합니다.**
     """
     try:
-        rental = RentalService.get_rental(
+        rental = await AsyncRentalService.get_rental(
             db=db,
             rental_id=rental_id,
             current_user_id=current_user.id,
@@ -134,10 +172,10 @@ def get_rental(
 
 
 @router.post("", response_model=RentalResponse, status_code=status.HTTP_201_CREATED, summary="대여 생성")
-def create_rental(
+async def create_rental(
     rental_data: RentalCreate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -172,11 +210,11 @@ def create_rental(
 
 
 @router.post("/{rental_id}/return", response_model=RentalResponse, summary="대여 반납")
-def return_rental(
+async def return_rental(
     rental_id: int,
     return_data: RentalReturn,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -194,7 +232,7 @@ def return_rental(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        rental = RentalService.return_rental(
+        rental = await AsyncRentalService.return_rental(
             db=db,
             rental_id=rental_id,
             return_data=return_data,
@@ -224,11 +262,11 @@ def return_rental(
 
 
 @router.post("/{rental_id}/extend", response_model=RentalResponse, summary="대여 연장")
-def extend_rental(
+async def extend_rental(
     rental_id: int,
     extend_data: RentalExtend,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -246,7 +284,7 @@ def extend_rental(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        rental = RentalService.extend_rental(
+        rental = await AsyncRentalService.extend_rental(
             db=db,
             rental_id=rental_id,
             extend_data=extend_data,
@@ -276,8 +314,8 @@ def extend_rental(
 
 
 @router.post("/overdue", response_model=dict, summary="연체된 대여 일괄 처리")
-def mark_overdue_rentals(
-    db: Session = Depends(get_db),
+async def mark_overdue_rentals(
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -290,7 +328,7 @@ def mark_overdue_rentals(
     **일반적으로 스케줄러에 의해 자동 실행되지만, 수동 실행도 가능합니다.**
     """
     try:
-        overdue_count = RentalService.mark_overdue_rentals(db=db)
+        overdue_count = await AsyncRentalService.mark_overdue_rentals(db=db)
         
         return {
             "message": f"{overdue_count}개의 대여가 연체 처리되었습니다",
@@ -304,11 +342,11 @@ def mark_overdue_rentals(
 
 
 @router.get("/history", response_model=list[RentalHistory], summary="대여 이력 조회")
-def get_rental_history(
+async def get_rental_history(
     user_id: Optional[int] = Query(None, description="특정 사용자 ID"),
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -324,7 +362,7 @@ def get_rental_history(
     - 평균 대여 기간, 최근 대여일
     """
     try:
-        return RentalService.get_rental_history(
+        return await AsyncRentalService.get_rental_history(
             db=db,
             user_id=user_id,
             skip=skip,
@@ -335,29 +373,3 @@ def get_rental_history(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"대여 이력 조회 중 오류 발생: {str(e)}"
         )
-
-
-@router.get("/statistics", response_model=dict, summary="대여 통계 조회")
-def get_rental_statistics(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin_user)
-):
-    """
-    대여 통계 정보를 조회합니다.
-    
-    **관리자 권한이 필요합니다.**
-    
-    다음 정보를 포함합니다:
-    - 전체 대여 개수
-    - 상태별 대여 개수
-    - 오늘 대여 개수
-    - 현재 활성/연체 대여 개수
-    - 평균 대여 기간
-    """
-    try:
-        return RentalService.get_rental_statistics(db=db)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"대여 통계 조회 중 오류 발생: {str(e)}"
-        )
\ No newline at end of file
@@ -1,25 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
+from pydantic import TypeAdapter
 
-from app.db.database import get_db
+from app.core.responses import json_list_response, json_response
+from app.db.database import get_db_session, DBSession
 from app.schemas.reservation import (
     ReservationCreate, ReservationUpdate, ReservationResponse, 
     ReservationList, ReservationFilter, ReservationStatus,
     ReservationConfirm, ReservationCancel
 )
-from app.services.reservation_service import ReservationService
+from app.services.async_service import AsyncReservationService
 from app.api.deps import get_current_user, get_current_admin_user
 from app.models.user import User
 
 router = APIRouter()
 
+_RESERVATION_LIST = TypeAdapter(list[ReservationResponse])
+
 
 @router.get("", response_model=ReservationList, summary="예약 목록 조회")
-def get_reservations(
+async def get_reservations(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 skip 무시)"),
     user_id: Optional[int] = Query(None, description="사용자 ID 필터 (관리자만)"),
     item_id: Optional[int] = Query(None, description="품목 ID 필터"),
     category_id: Optional[int] = Query(None, description="카테고리 ID 필터"),
@@ -27,7 +31,7 @@ def get_reservations(
     is_expired: Optional[bool] = Query(None, description="만료 여부 필터"),
     date_from: Optional[datetime] = Query(None, description="시작 날짜"),
     date_to: Optional[datetime] = Query(None, description="종료 날짜"),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -35,6 +39,7 @@ def get_reservations(
     
     - **skip**: 건너뛸 개수 (페이지네이션)
     - **limit**: 조회할 개수 (최대 1000개)
+    - **cursor**: 이전 응답의 next_cursor (깊은 페이지도 일정한 속도로 조회)
     - **user_id**: 특정 사용자의 예약만 조회 (관리자만 사용 가능)
     - **item_id**: 특정 품목의 예약만 조회
     - **category_id**: 특정 카테고리의 예약만 조회
@@ -55,13 +60,20 @@ def get_reservations(
             date_to=date_to
         )
         
-        return ReservationService.get_reservations(
+        return json_list_response(await AsyncReservationService.get_reservations(
             db=db,
             skip=skip,
             limit=limit,
             filters=filters,
             current_user_id=current_user.id,
-            is_admin=current_user.is_admin
+            is_admin=current_user.is_admin,
+            cursor=cursor
+        ), "reservations")
+    except ValueError as e:
+        # 이 함수에서는 status 쿼리 파라미터가 fastapi.status 모듈을 가리므로 숫자 코드 사용
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -71,8 +83,8 @@ def get_reservations(
 
 
 @router.get("/my", response_model=list[ReservationResponse], summary="내 활성 예약 조회")
-def get_my_active_reservations(
-    db: Session = Depends(get_db),
+async def get_my_active_reservations(
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -81,10 +93,10 @@ def get_my_active_reservations(
     활성 예약: PENDING 상태이면서 만료되지 않은 예약들
     """
     try:
-        return ReservationService.get_user_active_reservations(
+        return json_response(_RESERVATION_LIST, await AsyncReservationService.get_user_active_reservations(
             db=db,
             user_id=current_user.id
-        )
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,10 +104,35 @@ def get_my_active_reservations(
         )
 
 
+@router.get("/statistics", response_model=dict, summary="예약 통계 조회")
+async def get_reservation_statistics(
+    db: DBSession = Depends(get_db_session),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """
+    예약 통계 정보를 조회합니다.
+    
+    **관리자 권한이 필요합니다.**
+    
+    다음 정보를 포함합니다:
+    - 전체 예약 개수
+    - 상태별 예약 개수
+    - 오늘 예약 개수
+    - 현재 활성 예약 개수
+    """
+    try:
+        return await AsyncReservationService.get_reservation_statistics(db=db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"예약 통계 조회 중 오류 발생: {str(e)}"
+        )
+
+
 @router.get("/{reservation_id}", response_model=ReservationResponse, summary="특정 예약 조회")
-def get_reservation(
+async def get_reservation(
     reservation_id: int,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -106,7 +143,7 @@ def get_reservation(
     **일반 사용자는 자신의 예약만 조회 가능합니다.**
     """
     try:
-        reservation = ReservationService.get_reservation(
+        reservation = await AsyncReservationService.get_reservation(
             db=db,
             reservation_id=reservation_id,
             current_user_id=current_user.id,
@@ -130,10 +167,10 @@ def get_reservation(
 
 
 @router.post("", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED, summary="예약 생성")
-def create_reservation(
+async def create_reservation(
     reservation_data: ReservationCreate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -152,7 +189,7 @@ def create_reservation(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        return ReservationService.create_reservation(
+        return await AsyncReservationService.create_reservation(
             db=db,
             reservation_data=reservation_data,
             user_id=current_user.id,
@@ -171,11 +208,11 @@ def create_reservation(
 
 
 @router.post("/{reservation_id}/confirm", response_model=ReservationResponse, summary="예약 수령 확인")
-def confirm_reservation(
+async def confirm_reservation(
     reservation_id: int,
     confirm_data: ReservationConfirm,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -192,7 +229,7 @@ def confirm_reservation(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        reservation = ReservationService.confirm_reservation(
+        reservation = await AsyncReservationService.confirm_reservation(
             db=db,
             reservation_id=reservation_id,
             confirm_data=confirm_data,
@@ -222,11 +259,11 @@ def confirm_reservation(
 
 
 @router.post("/{reservation_id}/cancel", response_model=ReservationResponse, summary="예약 취소")
-def cancel_reservation(
+async def cancel_reservation(
     reservation_id: int,
     cancel_data: ReservationCancel,
     request: Request,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -244,7 +281,7 @@ def cancel_reservation(
         # 클라이언트 IP 주소 추출
         client_ip = request.headers.get("x-forwarded-for") or request.client.host
         
-        reservation = ReservationService.cancel_reservation(
+        reservation = await AsyncReservationService.cancel_reservation(
             db=db,
             reservation_id=reservation_id,
             cancel_data=cancel_data,
@@ -275,8 +312,8 @@ def cancel_reservation(
 
 
 @router.post("/expire", response_model=dict, summary="만료된 예약 일괄 처리")
-def expire_reservations(
-    db: Session = Depends(get_db),
+async def expire_reservations(
+    db: DBSession = Depends(get_db_session),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """
@@ -290,7 +327,7 @@ def expire_reservations(
     **일반적으로 스케줄러에 의해 자동 실행되지만, 수동 실행도 가능합니다.**
     """
     try:
-        expired_count = ReservationService.expire_reservations(db=db)
+        expired_count = await AsyncReservationService.expire_reservations(db=db)
         
         return {
             "message": f"{expired_count}개의 예약이 만료 처리되었습니다",
@@ -301,28 +338,3 @@ def expire_reservations(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"예약 만료 처리 중 오류 발생: {str(e)}"
         )
-
-
-@router.get("/statistics", response_model=dict, summary="예약 통계 조회")
-def get_reservation_statistics(
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin_user)
-):
-    """
-    예약 통계 정보를 조회합니다.
-    
-    **관리자 권한이 필요합니다.**
-    
-    다음 정보를 포함합니다:
-    - 전체 예약 개수
-    - 상태별 예약 개수
-    - 오늘 예약 개수
-    - 현재 활성 예약 개수
-    """
-    try:
-        return ReservationService.get_reservation_statistics(db=db)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"예약 통계 조회 중 오류 발생: {str(e)}"
-        )
\ No newline at end of file
@@ -0,0 +1,408 @@
+import asyncio
+import glob
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.db.database import engine
+from app.db.unit_of_work import after_commit
+from app.models.audit_log import AuditLog
+
+try:
+    import fcntl
+except ImportError:  # Windows에는 fcntl이 없으므로 WAL 없이 기록
+    fcntl = None
+
+_SEGMENT_PATTERN = "audit-*.wal"
+_OVERFLOW_SUFFIX = "-overflow.wal"
+_DEAD_LETTER_FILE = "dead-letter.jsonl"
+
+
+def _writer_engine() -> Engine:
+    """
+    감사 로그 기록용 엔진
+
+    SQLite 앱 엔진(StaticPool)은 연결 하나를 모든 스레드가 공유하므로, 백그라운드 기록이
+    요청 처리 중인 트랜잭션에 끼어들지 않도록 파일 DB는 별도 연결을 사용합니다.
+    """
+    url = settings.DATABASE_URL
+    if url.startswith("sqlite") and ":memory:" not in url and url.rstrip("/") != "sqlite:":
+        return create_engine(url, connect_args={"check_same_thread": False, "timeout": 30}, poolclass=NullPool)
+    return engine
+
+
+class AuditLogWriter:
+    """
+    감사 로그 비동기 일괄 기록기
+
+    record()는 로그를 프로세스 내 큐와 WAL 세그먼트 파일에 추가만 하므로 요청 처리 경로에서 DB를 기다리지 않습니다.
+    백그라운드 루프가 flush_seconds마다 큐를 비워 batch_size 단위 executemany INSERT(트랜잭션 하나)로 기록하며,
+    큐 하나를 순서대로 기록하므로 같은 레코드의 로그 순서(id 순서)는 record() 호출 순서와 같습니다.
+    큐가 max_pending에 도달하면 record()를 호출한 쪽에서 바로 flush하되 flush_seconds에 한 번만 시도하며,
+    그래도 큐가 넘치면 가장 오래된 로그부터 큐에서 빼 넘침 세그먼트(WAL)에 남겨 두고, 큐가 줄어든 뒤
+    백그라운드 루프가 recover()와 같은 방식으로 다시 기록합니다 (기록이 밀릴 때의 역압력).
+    WAL이 없으면 넘친 로그는 버립니다 (버린 수는 dropped).
+    제약 조건 위반 등 데이터 오류로 기록할 수 없는 로그는 배치를 나눠 찾아낸 뒤
+    WAL 디렉터리의 dead-letter 파일로 옮기고, 나머지 로그는 그대로 기록합니다.
+
+    WAL 세그먼트(JSON Lines)는 프로세스가 파일 잠금을 쥐고 있으며, 담긴 로그가 DB에 기록되면 삭제합니다.
+    프로세스가 비정상 종료되면 다음 시작 시 recover()가 주인 없는 세그먼트를 다시 기록합니다
+    (DB 커밋 직후 세그먼트 삭제 전에 종료되면 일부 로그가 중복 기록될 수 있음).
+    세그먼트 잠금에 fcntl을 쓰므로 fcntl이 없는 환경(Windows)에서는 WAL을 사용하지 않습니다.
+    """
+
+    def __init__(self, batch_size: int, flush_seconds: float, max_pending: int, wal_dir: Optional[str]):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self.wal_dir = wal_dir or None
+        if self.wal_dir is not None and fcntl is None:
+            print("⚠️  fcntl을 사용할 수 없어 감사 로그 WAL을 비활성화합니다")
+            self.wal_dir = None
+        self._engine = _writer_engine()
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._segment: Optional[IO[str]] = None
+        self._segment_path: Optional[str] = None
+        self._sealed: List[Tuple[str, IO[str]]] = []
+        self._overflow: Optional[IO[str]] = None
+        self._overflow_path: Optional[str] = None
+        self._replay_needed = False
+        self.recorded = 0
+        self.written = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.backpressure_flushes = 0
+        self._last_backpressure_at = float("-inf")
+        self.dropped = 0
+        self.spilled = 0
+        self.dead_lettered = 0
+        self.wal_errors = 0
+        self.recovered = 0
+        self.last_flush_ms: Optional[float] = None
+        self.max_flush_ms = 0.0
+
+    def record(
+        self,
+        action: str,
+        table_name: str,
+        user_id: Optional[int] = None,
+        record_id: Optional[int] = None,
+        changes: Optional[Dict[str, Any]] = None,
+        description: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> None:
+        """감사 로그 1건 기록 요청 (AuditLog.create_log와 같은 인자)"""
+        row = {
+            "user_id": user_id,
+            "action": action,
+            "table_name": table_name,
+            "record_id": record_id,
+            "changes": changes,
+            "description": description,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "created_at": datetime.utcnow(),
+        }
+        with self._lock:
+            self._append_wal(row)
+            self._queue.append(row)
+            self.recorded += 1
+            overflow = len(self._queue) >= self.max_pending
+            self._drop_overflow()
+            # 기록이 계속 실패해도 호출마다 flush하지 않도록 주기당 한 번만 시도
+            now = time.monotonic()
+            backpressure = overflow and now - self._last_backpressure_at >= self.flush_seconds
+            if backpressure:
+                self._last_backpressure_at = now
+
+        if backpressure:
+            self.backpressure_flushes += 1
+            self.flush(wait=False)
+
+    def _drop_overflow(self) -> None:
+        """큐가 max_pending을 넘으면 가장 오래된 로그부터 넘침 세그먼트로 옮김 (_lock 안에서 호출)"""
+        while len(self._queue) > self.max_pending:
+            row = self._queue.popleft()
+            if self._spill(row):
+                self.spilled += 1
+            else:
+                self.dropped += 1
+
+    def _spill(self, row: Dict[str, Any]) -> bool:
+        """
+        큐에서 뺀 로그를 넘침 세그먼트에 기록 (_lock 안에서 호출)
+
+        원래 세그먼트는 남은 로그가 기록되면 삭제되므로 넘친 로그는 따로 남겨 두며,
+        넘침 세그먼트도 닫을 때까지 잠금을 유지해 다른 워커가 복구하지 않도록 합니다.
+        """
+        if self.wal_dir is None:
+            return False
+        try:
+            if self._overflow is None:
+                os.makedirs(self.wal_dir, exist_ok=True)
+                self._overflow_path = os.path.join(
+                    self.wal_dir, f"audit-{time.time_ns()}-{os.getpid()}{_OVERFLOW_SUFFIX}"
+                )
+                self._overflow = open(self._overflow_path, "a", encoding="utf-8")
+                fcntl.flock(self._overflow, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            self._overflow.write(json.dumps(row, ensure_ascii=False, default=datetime.isoformat) + "\n")
+            self._overflow.flush()
+        except (OSError, TypeError, ValueError) as e:
+            self.wal_errors += 1
+            print(f"⚠️  감사 로그 넘침 세그먼트 기록 실패: {e}")
+            return False
+        self._replay_needed = True
+        return True
+
+    def replay_overflow(self) -> int:
+        """큐에 여유가 생기면 넘침 세그먼트를 닫고 recover()로 다시 기록"""
+        with self._lock:
+            if not self._replay_needed or len(self._queue) >= self.max_pending:
+                return 0
+            if self._overflow is not None:
+                # 닫으면 잠금이 풀려 recover() 대상이 됨
+                self._overflow.close()
+                self._overflow = None
+                self._overflow_path = None
+            self._replay_needed = False
+        try:
+            return self.recover()
+        except Exception as e:
+            # 세그먼트는 남아 있으므로 다음 주기(또는 다음 시작)에 다시 시도
+            self._replay_needed = True
+            self.flush_errors += 1
+            print(f"⚠️  감사 로그 넘침 세그먼트 재기록 실패: {e}")
+            return 0
+
+    def record_after_commit(self, db: Session, **fields: Any) -> None:
+        """현재 트랜잭션이 커밋된 뒤 기록 (롤백되면 기록하지 않음)"""
+        after_commit(db, lambda: self.record(**fields))
+
+    def _append_wal(self, row: Dict[str, Any]) -> None:
+        if self.wal_dir is None:
+            return
+        try:
+            if self._segment is None:
+                os.makedirs(self.wal_dir, exist_ok=True)
+                # 파일 이름이 생성 순서대로 정렬되도록 시각을 앞에 둠
+                self._segment_path = os.path.join(self.wal_dir, f"audit-{time.time_ns()}-{os.getpid()}.wal")
+                self._segment = open(self._segment_path, "a", encoding="utf-8")
+                fcntl.flock(self._segment, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            self._segment.write(json.dumps(row, ensure_ascii=False, default=datetime.isoformat) + "\n")
+            self._segment.flush()
+        except (OSError, TypeError, ValueError) as e:
+            # WAL 없이 계속 (비정상 종료 시 큐에 남은 로그만 유실)
+            self.wal_errors += 1
+            print(f"⚠️  감사 로그 WAL 기록 실패: {e}")
+
+    def _seal_segment(self) -> None:
+        """
+        현재 세그먼트를 기록 대기 목록으로 (다음 record()는 새 세그먼트에 추가)
+
+        담긴 로그가 DB에 기록될 때까지 파일을 열어 둔 채 잠금을 유지해 다른 워커가 복구하지 않도록 합니다.
+        """
+        if self._segment is None:
+            return
+        self._sealed.append((self._segment_path, self._segment))
+        self._segment = None
+        self._segment_path = None
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        with self._engine.begin() as conn:
+            for start in range(0, len(rows), self.batch_size):
+                conn.execute(insert(AuditLog.__table__), rows[start:start + self.batch_size])
+
+    def _write(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+        """
+        로그를 순서대로 기록하고 (기록하지 못한 로그, 원인 예외) 반환
+
+        데이터 오류(IntegrityError/DataError)가 나면 배치를 반으로 나눠 다시 기록하고,
+        한 건만 남아도 실패하는 로그는 dead-letter로 옮깁니다.
+        DB 연결 실패 등 그 밖의 오류는 그 시점까지 기록하지 못한 로그를 돌려줍니다.
+        """
+        stack = [rows]
+        while stack:
+            batch = stack.pop()
+            try:
+                self._insert(batch)
+            except (IntegrityError, DataError) as e:
+                if len(batch) == 1:
+                    self._dead_letter(batch[0], e)
+                    continue
+                middle = len(batch) // 2
+                stack.append(batch[middle:])
+                stack.append(batch[:middle])
+            except Exception as e:
+                remaining = [row for pending in [batch, *reversed(stack)] for row in pending]
+                return remaining, e
+        return [], None
+
+    def _dead_letter(self, row: Dict[str, Any], error: Exception) -> None:
+        """기록할 수 없는 로그를 dead-letter 파일에 보관 (WAL 디렉터리가 없으면 출력만)"""
+        self.dead_lettered += 1
+        reason = str(getattr(error, "orig", error))
+        print(f"⚠️  감사 로그 기록 불가, dead-letter로 이동: {row['action']} {row['table_name']} {row['record_id']} ({reason})")
+        if self.wal_dir is None:
+            return
+        try:
+            os.makedirs(self.wal_dir, exist_ok=True)
+            with open(os.path.join(self.wal_dir, _DEAD_LETTER_FILE), "a", encoding="utf-8") as dead_letter:
+                dead_letter.write(json.dumps(
+                    {**row, "error": reason}, ensure_ascii=False, default=datetime.isoformat
+                ) + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            self.wal_errors += 1
+            print(f"⚠️  감사 로그 dead-letter 기록 실패: {e}")
+
+    def flush(self, wait: bool = True) -> int:
+        """
+        큐에 쌓인 로그를 DB에 기록 (실패하면 기록하지 못한 로그를 큐 앞쪽으로 되돌려 다음 flush에서 재시도)
+
+        Args:
+            wait: False이면 다른 flush가 진행 중일 때 기다리지 않고 반환 (record()의 역압력 flush)
+        """
+        if not self._flush_lock.acquire(blocking=wait):
+            return 0
+        try:
+            with self._lock:
+                rows = list(self._queue)
+                self._queue.clear()
+                if rows:
+                    self._seal_segment()
+                sealed, self._sealed = self._sealed, []
+            if not rows:
+                return 0
+
+            started = time.perf_counter()
+            dead_lettered = self.dead_lettered
+            remaining, error = self._write(rows)
+            written = len(rows) - len(remaining) - (self.dead_lettered - dead_lettered)
+            self.written += written
+            if error is not None:
+                with self._lock:
+                    self._queue.extendleft(reversed(remaining))
+                    self._drop_overflow()
+                    self._sealed = sealed + self._sealed
+                self.flush_errors += 1
+                print(f"⚠️  감사 로그 기록 실패, 다음 flush에서 재시도: {error}")
+                return 0
+
+            for path, segment in sealed:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                segment.close()
+
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.flushes += 1
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            return written
+        finally:
+            self._flush_lock.release()
+
+    def recover(self) -> int:
+        """이전 프로세스가 남긴 WAL 세그먼트의 로그를 기록 (시작 시 실행)"""
+        if self.wal_dir is None:
+            return 0
+
+        recovered = 0
+        for path in sorted(glob.glob(os.path.join(self.wal_dir, _SEGMENT_PATTERN))):
+            if path in (self._segment_path, self._overflow_path):
+                continue
+            try:
+                segment = open(path, "r", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with segment:
+                try:
+                    fcntl.flock(segment, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # 실행 중인 다른 워커의 세그먼트
+                if os.fstat(segment.fileno()).st_nlink == 0:
+                    continue  # 다른 워커가 이미 복구하고 삭제함
+
+                rows = []
+                for line in segment:
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        continue  # 기록 도중 종료된 마지막 줄
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    rows.append(row)
+                if rows:
+                    remaining, error = self._write(rows)
+                    if error is not None:
+                        raise error
+                os.remove(path)
+            recovered += len(rows)
+
+        self.recovered += recovered
+        if recovered:
+            print(f"📝 감사 로그 WAL 복구: {recovered}건")
+        return recovered
+
+    async def run(self) -> None:
+        """주기적으로 flush하는 백그라운드 루프 (lifespan에서 시작)"""
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await run_in_threadpool(self.flush)
+            await run_in_threadpool(self.replay_overflow)
+
+    def close(self) -> None:
+        """남은 로그를 기록하고 WAL 세그먼트를 닫음 (종료 시 실행, 기록하지 못한 로그는 다음 시작 때 복구)"""
+        self.flush()
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+                self._segment_path = None
+            if self._overflow is not None:
+                self._overflow.close()
+                self._overflow = None
+                self._overflow_path = None
+
+    def stats(self) -> Dict[str, Any]:
+        """기록 통계"""
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "pending": len(self._queue),
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+            "backpressure_flushes": self.backpressure_flushes,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "dead_lettered": self.dead_lettered,
+            "wal_errors": self.wal_errors,
+            "recovered": self.recovered,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+        }
+
+
+audit_log_writer = AuditLogWriter(
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_seconds=settings.AUDIT_LOG_FLUSH_SECONDS,
+    max_pending=settings.AUDIT_LOG_MAX_PENDING,
+    wal_dir=settings.AUDIT_LOG_WAL_DIR,
+)
+
+metrics_registry.register("audit_log_writer", audit_log_writer.stats)
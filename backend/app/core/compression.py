@@ -0,0 +1,273 @@
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+try:
+    import brotli
+except ImportError:  # brotli 패키지가 없으면 gzip만 사용
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+
+class _Compressor:
+    """응답 본문 스트리밍 압축기 (조각마다 flush해 받은 만큼 바로 전송 가능)"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == BROTLI:
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16 + MAX_WBITS: gzip 헤더/트레일러 포함
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == BROTLI:
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionStats:
+    """경로별 압축률/압축 CPU 시간 통계 (최소 크기 기준 조정용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, int]] = {}
+
+    def _counters(self, route: str) -> Dict[str, int]:
+        return self._routes.setdefault(route, {
+            "responses": 0, GZIP: 0, BROTLI: 0, "below_minimum": 0, "not_accepted": 0,
+            "bytes_in": 0, "bytes_out": 0, "uncompressed_bytes": 0, "cpu_ns": 0,
+        })
+
+    def record_compressed(self, route: str, encoding: str, bytes_in: int, bytes_out: int, cpu_ns: int) -> None:
+        with self._lock:
+            counters = self._counters(route)
+            counters["responses"] += 1
+            counters[encoding] += 1
+            counters["bytes_in"] += bytes_in
+            counters["bytes_out"] += bytes_out
+            counters["cpu_ns"] += cpu_ns
+
+    def record_skipped(self, route: str, reason: str, size: int) -> None:
+        with self._lock:
+            counters = self._counters(route)
+            counters["responses"] += 1
+            counters[reason] += 1
+            counters["uncompressed_bytes"] += size
+
+    @staticmethod
+    def _summary(counters: Dict[str, int]) -> Dict[str, Any]:
+        compressed = counters[GZIP] + counters[BROTLI]
+        summary = {key: value for key, value in counters.items() if key != "cpu_ns"}
+        summary.update({
+            "compressed": compressed,
+            # 원본 대비 압축 결과 크기 (낮을수록 효과가 큼)
+            "ratio": round(counters["bytes_out"] / counters["bytes_in"], 4) if counters["bytes_in"] else None,
+            "cpu_ms": round(counters["cpu_ns"] / 1e6, 3),
+            "cpu_ms_per_response": round(counters["cpu_ns"] / 1e6 / compressed, 3) if compressed else 0.0,
+        })
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        """전체/경로별 압축 통계"""
+        with self._lock:
+            routes = {route: dict(counters) for route, counters in self._routes.items()}
+        total: Dict[str, int] = {}
+        for counters in routes.values():
+            for key, value in counters.items():
+                total[key] = total.get(key, 0) + value
+        return {
+            "brotli_available": brotli is not None,
+            "minimum_size": settings.COMPRESSION_MINIMUM_SIZE,
+            **(self._summary(total) if total else {}),
+            "routes": {route: self._summary(counters) for route, counters in routes.items()},
+        }
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (gzip, brotli 설치 시 br 우선)
+
+    Content-Type이 허용 목록에 있고 본문이 minimum_size 이상인 응답만 압축합니다.
+    스트리밍 응답은 minimum_size만큼 모일 때까지 모았다가 이후 조각을 받는 대로 압축해 보내며,
+    그 전에 끝나면 압축하지 않고 그대로 보냅니다.
+    압축하면 바이트가 달라지므로 강한 ETag는 약한 ETag로 바꿉니다 (응답 캐시의 ETag는 원래 약한 ETag).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = {content_type.lower() for content_type in content_types}
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    @staticmethod
+    def _negotiate(accept_encoding: str) -> Optional[str]:
+        """Accept-Encoding에서 사용할 인코딩 선택 (q=0은 거부, 같은 q면 br 우선)"""
+        qualities: Dict[str, float] = {}
+        for part in accept_encoding.lower().split(","):
+            coding, _, params = part.strip().partition(";")
+            if not coding:
+                continue
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            qualities[coding.strip()] = quality
+
+        wildcard = qualities.get("*", 0.0)
+        candidates = [BROTLI, GZIP] if brotli is not None else [GZIP]
+        best, best_quality = None, 0.0
+        for coding in candidates:
+            quality = qualities.get(coding, wildcard)
+            if quality > best_quality:
+                best, best_quality = coding, quality
+        return best
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나의 압축 상태 (시작 메시지를 보류했다가 본문을 보고 압축 여부 결정)"""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, encoding: Optional[str]):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.buffer = bytearray()
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+        self.skip_reason: Optional[str] = None
+        self.skipped_bytes = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_ns = 0
+
+    def _route(self) -> str:
+        # 라우팅이 끝나면 scope에 매칭된 경로가 기록됨
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or "(unmatched)"
+        return f"{self.scope.get('method', '')} {path}"
+
+    def _eligible(self, message: Message) -> bool:
+        if message.get("status", 200) in (204, 304):
+            return False
+        headers = Headers(raw=message.get("headers", []))
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.middleware.content_types
+
+    def _compress(self, data: bytes, final: bool) -> bytes:
+        started = time.thread_time_ns()
+        out = self.compressor.compress(data, final)
+        self.cpu_ns += time.thread_time_ns() - started
+        self.bytes_in += len(data)
+        self.bytes_out += len(out)
+        return out
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            eligible = self._eligible(message)
+            if eligible or message.get("status") == 304:
+                # 재검증 응답(304)에도 원래 응답과 같은 Vary를 붙임
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                headers.add_vary_header("Accept-Encoding")
+                message["headers"] = headers.raw
+            if not eligible:
+                self.passthrough = True
+                await self._send(message)
+                return
+            self.start_message = message
+            return
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.passthrough:
+            await self._send(message)
+            if self.skip_reason is not None:
+                self._record_skipped(len(body), more_body)
+            return
+        if self.compressor is not None:
+            message["body"] = self._compress(body, final=not more_body)
+            await self._send(message)
+            if not more_body:
+                self._record_compressed()
+            return
+
+        self.buffer += body
+        if self.encoding is None or (not more_body and len(self.buffer) < self.middleware.minimum_size):
+            # 압축하지 않음 - 보류한 시작 메시지와 모은 본문을 그대로 전송
+            self.skip_reason = "not_accepted" if self.encoding is None else "below_minimum"
+            self.passthrough = True
+            body, self.buffer = bytes(self.buffer), bytearray()
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            self._record_skipped(len(body), more_body)
+            return
+        if more_body and len(self.buffer) < self.middleware.minimum_size:
+            return
+
+        self.compressor = _Compressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        compressed = self._compress(bytes(self.buffer), final=not more_body)
+        self.buffer = bytearray()
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        if not more_body:
+            headers["Content-Length"] = str(len(compressed))
+        elif "content-length" in headers:
+            del headers["Content-Length"]
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+        if not more_body:
+            self._record_compressed()
+
+    def _record_skipped(self, size: int, more_body: bool) -> None:
+        self.skipped_bytes += size
+        if not more_body:
+            compression_stats.record_skipped(self._route(), self.skip_reason, self.skipped_bytes)
+
+    def _record_compressed(self) -> None:
+        compression_stats.record_compressed(self._route(), self.encoding, self.bytes_in, self.bytes_out, self.cpu_ns)
+
+
+# 전역 압축 통계
+compression_stats = CompressionStats()
+
+metrics_registry.register("compression", compression_stats.stats)
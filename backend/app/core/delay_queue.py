@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.redis_client import async_redis_client, redis_client
+from app.db.database import SessionLocal
+
+# 처리 시각이 지난 멤버를 꺼내면서 삭제 (여러 워커가 같은 멤버를 가져가지 않도록 원자적으로 실행)
+_POP_DUE_SCRIPT = """
+local entries = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+for i = 1, #entries, 2 do
+    redis.call('ZREM', KEYS[1], entries[i])
+end
+return entries
+"""
+
+
+def _epoch_seconds(value: datetime) -> float:
+    """datetime → epoch 초 (timezone 없는 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class DelayQueue:
+    """
+    Redis sorted set 기반 지연 큐 (score = 처리 시각 epoch 초)
+
+    이 프로세스에서 소비 루프가 돌고 있으면 schedule/discard는 요청 처리 경로에서 Redis를 기다리지 않도록
+    메모리에 모아 두었다가 루프가 돌 때마다 파이프라인 한 번으로 반영하고, 소비 루프가 없는 프로세스
+    (SCHEDULER_ENABLED=False)에서는 모아 둔 변경을 반영할 곳이 없으므로 바로 Redis에 씁니다.
+    소비 루프는 처리 시각이 지난 멤버를 원자적으로 꺼내 새 세션으로 handler(db, ids)를 실행하며,
+    다음 처리 시각까지(최대 max_wait_seconds) 대기합니다.
+    """
+
+    def __init__(self, key: str, max_wait_seconds: float, batch_size: int = 100, retry_seconds: float = 5.0):
+        self.key = key
+        self.max_wait_seconds = max_wait_seconds
+        self.batch_size = batch_size
+        self.retry_seconds = retry_seconds
+        self._pending: Dict[int, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self._consuming = False
+        self._pop_due = async_redis_client.register_script(_POP_DUE_SCRIPT)
+        self.scheduled = 0
+        self.discarded = 0
+        self.popped = 0
+        self.handler_errors = 0
+        self.redis_errors = 0
+        self.max_lag_ms = 0.0
+        self.last_lag_ms: Optional[float] = None
+
+    def schedule(self, member: int, due_at: datetime) -> None:
+        """멤버를 due_at에 처리하도록 등록 (이미 있으면 처리 시각 갱신)"""
+        self.scheduled += 1
+        self._write({member: _epoch_seconds(due_at)})
+
+    def discard(self, *members: int) -> None:
+        """등록 취소 (없는 멤버는 무시)"""
+        self.discarded += len(members)
+        self._write(dict.fromkeys(members))
+
+    def _write(self, changes: Dict[int, Optional[float]]) -> None:
+        """등록(score)/취소(None) 반영 - 소비 루프가 있으면 모아 두고, 없으면 바로 Redis에 씀"""
+        if self._consuming:
+            with self._lock:
+                self._pending.update(changes)
+            return
+
+        scores = {member: score for member, score in changes.items() if score is not None}
+        removed = [member for member, score in changes.items() if score is None]
+        try:
+            if scores:
+                redis_client.zadd(self.key, scores)
+            if removed:
+                redis_client.zrem(self.key, *removed)
+        except Exception as e:
+            # 놓친 등록은 스케줄러의 만료 작업이, 놓친 취소는 처리 시 상태 확인으로 걸러짐
+            self.redis_errors += 1
+            print(f"⚠️  Redis unavailable, delay queue '{self.key}' write skipped: {e}")
+
+    async def flush(self) -> int:
+        """대기 중인 등록/취소를 Redis에 반영"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        scores = {member: score for member, score in pending.items() if score is not None}
+        removed = [member for member, score in pending.items() if score is None]
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                if scores:
+                    pipe.zadd(self.key, scores)
+                if removed:
+                    pipe.zrem(self.key, *removed)
+                await pipe.execute()
+        except Exception as e:
+            # 다음 flush에서 다시 시도 (그 사이 새로 들어온 변경이 우선)
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+            self.redis_errors += 1
+            print(f"⚠️  Redis unavailable, delay queue '{self.key}' flush postponed: {e}")
+            return 0
+        return len(pending)
+
+    async def _next_wait(self) -> float:
+        """다음 처리 시각까지 대기할 시간 (최대 max_wait_seconds)"""
+        entries = await async_redis_client.zrange(self.key, 0, 0, withscores=True)
+        if not entries:
+            return self.max_wait_seconds
+        return min(max(entries[0][1] - time.time(), 0.0), self.max_wait_seconds)
+
+    @staticmethod
+    def _execute(handler: Callable[[Session, List[int]], Any], members: List[int]) -> Any:
+        with SessionLocal() as db:
+            return handler(db, members)
+
+    async def process_due(self, handler: Callable[[Session, List[int]], Any]) -> int:
+        """처리 시각이 지난 멤버를 꺼내 handler 실행 (실패하면 retry_seconds 뒤 재시도)"""
+        entries = await self._pop_due(keys=[self.key], args=[time.time(), self.batch_size])
+        if not entries:
+            return 0
+
+        members = [int(member) for member in entries[0::2]]
+        earliest_due = min(float(score) for score in entries[1::2])
+
+        self.popped += len(members)
+        try:
+            await run_in_threadpool(self._execute, handler, members)
+        except Exception as e:
+            self.handler_errors += 1
+            print(f"⚠️  지연 큐 처리 실패 ({self.key}): {e}")
+            with self._lock:
+                for member in members:
+                    self._pending.setdefault(member, time.time() + self.retry_seconds)
+            return 0
+
+        # 처리 시각 대비 지연 (가장 먼저 처리됐어야 하는 멤버 기준)
+        self.last_lag_ms = round((time.time() - earliest_due) * 1000, 3)
+        self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+        return len(members)
+
+    async def run(self, handler: Callable[[Session, List[int]], Any]) -> None:
+        """소비 루프 (lifespan에서 시작)"""
+        self._consuming = True
+        try:
+            while True:
+                await self.flush()
+                try:
+                    processed = await self.process_due(handler)
+                    wait = 0.0 if processed >= self.batch_size else await self._next_wait()
+                except Exception as e:
+                    self.redis_errors += 1
+                    print(f"⚠️  Redis unavailable, delay queue '{self.key}' paused: {e}")
+                    wait = self.max_wait_seconds
+                await asyncio.sleep(wait)
+        finally:
+            self._consuming = False
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 처리 통계"""
+        return {
+            "scheduled": self.scheduled,
+            "discarded": self.discarded,
+            "popped": self.popped,
+            "pending_writes": len(self._pending),
+            "handler_errors": self.handler_errors,
+            "redis_errors": self.redis_errors,
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+        }
+
+
+# 예약 만료 큐 (멤버: 예약 ID, score: expires_at)
+reservation_expiry_queue = DelayQueue(
+    "reservations:expiry",
+    max_wait_seconds=settings.RESERVATION_EXPIRY_MAX_WAIT_SECONDS,
+)
+
+metrics_registry.register("reservation_expiry_queue", reservation_expiry_queue.stats)
@@ -0,0 +1,55 @@
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.metrics import metrics_registry
+
+
+class JobStats:
+    """
+    배치 작업 실행 통계
+
+    작업 이름별로 실행 횟수, 처리 건수, 마지막/최대 실행 시간과 마지막 오류를 보관합니다.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        processed: int,
+        elapsed_seconds: float,
+        chunks: int = 1,
+        error: Optional[str] = None
+    ) -> None:
+        """작업 1회 실행 결과 기록"""
+        elapsed_ms = round(elapsed_seconds * 1000, 3)
+        with self._lock:
+            job = self._jobs.setdefault(name, {
+                "runs": 0,
+                "failures": 0,
+                "processed_total": 0,
+                "max_ms": 0.0,
+            })
+            job["runs"] += 1
+            job["processed_total"] += processed
+            job["max_ms"] = max(job["max_ms"], elapsed_ms)
+            job["last_processed"] = processed
+            job["last_chunks"] = chunks
+            job["last_ms"] = elapsed_ms
+            job["last_run_at"] = datetime.utcnow().isoformat()
+            if error is not None:
+                job["failures"] += 1
+                job["last_error"] = error
+
+    def snapshot(self) -> Dict[str, Any]:
+        """작업별 통계 스냅샷"""
+        with self._lock:
+            return {name: dict(job) for name, job in self._jobs.items()}
+
+
+job_stats = JobStats()
+
+metrics_registry.register("jobs", job_stats.snapshot)
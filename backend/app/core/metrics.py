@@ -0,0 +1,38 @@
+import os
+import threading
+from typing import Any, Callable, Dict
+
+
+class MetricsRegistry:
+    """
+    워커 프로세스 단위 메트릭 레지스트리
+
+    각 서브시스템이 수집 함수를 등록하면 /metrics 엔드포인트에서
+    현재 워커(pid)의 스냅샷을 한 번에 조회할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, collector: Callable[[], Dict[str, Any]]) -> None:
+        """메트릭 수집 함수 등록 (같은 이름은 덮어씀)"""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def collect(self) -> Dict[str, Any]:
+        """등록된 모든 메트릭 수집"""
+        with self._lock:
+            collectors = dict(self._collectors)
+
+        snapshot: Dict[str, Any] = {"worker_pid": os.getpid()}
+        for name, collector in collectors.items():
+            try:
+                snapshot[name] = collector()
+            except Exception as e:
+                snapshot[name] = {"error": str(e)}
+        return snapshot
+
+
+# 전역 메트릭 레지스트리
+metrics_registry = MetricsRegistry()
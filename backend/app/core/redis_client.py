@@ -0,0 +1,10 @@
+import redis
+import redis.asyncio as async_redis
+
+from app.core.config import settings
+
+# Redis 클라이언트 (세션 관리 및 캐시용)
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# 비동기 Redis 클라이언트 (요청 처리 경로에서 이벤트 루프를 막지 않도록 사용)
+async_redis_client = async_redis.from_url(settings.REDIS_URL, decode_responses=True)
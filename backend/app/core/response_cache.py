@@ -0,0 +1,185 @@
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.redis_client import redis_client, async_redis_client
+from app.db.unit_of_work import after_commit
+
+# 버전 이름 - 쓰기 작업이 관련 버전을 올리고, 캐시된 응답은 의존하는 버전이 모두 그대로일 때만 재사용
+CATEGORIES = "categories"      # 카테고리 이름/설명/활성 상태
+ITEM_CATALOG = "item_catalog"  # 품목 등록/수정/삭제 (카테고리별 활성 품목 수)
+ITEMS = "items"                # 예약/대여에 따른 상태 변경을 포함한 모든 품목 변경
+
+_CACHE_CONTROL = "private, no-cache"  # 브라우저는 저장하되 매번 If-None-Match로 재검증
+
+
+def item_version(item_id: int) -> str:
+    """품목 하나의 버전 이름 (품목 상세 조회)"""
+    return f"item:{item_id}"
+
+
+class ResponseCache:
+    """
+    카탈로그 조회 응답 캐시 (Redis, 워커 간 공유)
+
+    응답 본문(JSON)을 "경로 + 의존 버전 + 조회 범위 + 쿼리" 키로 저장합니다.
+    쓰기 작업이 커밋 후 버전을 올리면 키가 바뀌므로 이전 응답은 다시 읽히지 않고 TTL 후 삭제됩니다.
+    응답에는 본문 해시로 만든 ETag를 붙이고, If-None-Match가 같으면 본문 없이 304를 반환합니다.
+
+    버전을 읽은 뒤 조회한 응답은 그 버전 키에 저장되므로, 조회 중 커밋된 변경이 있어도
+    커밋 후 버전이 올라가면 다음 요청부터 새로 조회합니다.
+    Redis를 사용할 수 없으면 캐시 없이 조회하고, 버전을 올리지 못하면 최대 TTL 동안 이전 응답이 보일 수 있습니다.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, int]] = {}
+        self.invalidations = 0
+        self.errors = 0
+
+    @staticmethod
+    def _version_key(name: str) -> str:
+        return f"response_cache:version:{name}"
+
+    @staticmethod
+    def _entry_key(route: str, versions: List[str], scope: str, request: Request) -> str:
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+        digest = hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()
+        return f"response_cache:{route}:{scope}:{'.'.join(versions)}:{digest}"
+
+    @staticmethod
+    def _etag(body: str) -> str:
+        # 압축 등으로 바이트가 달라져도 같은 응답이므로 약한 ETag 사용
+        return f'W/"{hashlib.sha1(body.encode()).hexdigest()[:20]}"'
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 헤더와 ETag 약한 비교 (여러 값, * 허용)"""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    async def respond(
+        self,
+        request: Request,
+        route: str,
+        versions: Sequence[str],
+        adapter: TypeAdapter,
+        load: Callable[[], Awaitable[Any]],
+        scope: str = "all"
+    ) -> Response:
+        """
+        캐시된 응답 반환 (없으면 load()로 조회해 저장)
+
+        Args:
+            request: 현재 요청 (쿼리 파라미터와 If-None-Match 사용)
+            route: 캐시 구분 이름 (메트릭 단위)
+            versions: 응답이 의존하는 버전 이름
+            adapter: 조회 결과를 JSON으로 직렬화할 TypeAdapter (response_model과 같은 타입)
+            load: 조회 함수 (예외는 캐시하지 않고 그대로 전달 - 404 등)
+            scope: 같은 요청이라도 응답이 달라지는 사용자 범위 (예: admin/user)
+        """
+        if self.ttl_seconds <= 0:
+            body = adapter.dump_json(await load()).decode()
+            return self._response(request, route, body, self._etag(body), "BYPASS")
+
+        key = None
+        cached = None
+        try:
+            current = await async_redis_client.mget([self._version_key(name) for name in versions])
+            key = self._entry_key(route, [version or "0" for version in current], scope, request)
+            cached = await async_redis_client.get(key)
+        except Exception as e:
+            self._record(route, "errors")
+            print(f"⚠️  Redis unavailable, skipping response cache: {e}")
+
+        if cached is not None:
+            self._record(route, "hits")
+            etag, body = cached.split("\n", 1)
+            return self._response(request, route, body, etag, "HIT")
+
+        if key is not None:
+            self._record(route, "misses")
+        body = adapter.dump_json(await load()).decode()
+        etag = self._etag(body)
+        if key is not None:
+            try:
+                await async_redis_client.set(key, f"{etag}\n{body}", ex=self.ttl_seconds)
+            except Exception as e:
+                self._record(route, "errors")
+                print(f"⚠️  Redis unavailable, skipping response cache: {e}")
+        return self._response(request, route, body, etag, "MISS")
+
+    def _response(self, request: Request, route: str, body: str, etag: str, cache_status: str) -> Response:
+        headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL, "X-Cache": cache_status}
+        if self._etag_matches(request.headers.get("if-none-match"), etag):
+            self._record(route, "not_modified")
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def invalidate(self, *names: str) -> None:
+        """버전을 올려 해당 버전에 의존하는 캐시 응답 무효화 (쓰기 커밋 후 호출)"""
+        if not names:
+            return
+        try:
+            pipeline = redis_client.pipeline(transaction=False)
+            for name in names:
+                pipeline.incr(self._version_key(name))
+            pipeline.execute()
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            print(f"⚠️  Redis unavailable, cannot invalidate response cache: {e}")
+            return
+        with self._lock:
+            self.invalidations += len(names)
+
+    def invalidate_after_commit(self, db: Session, *names: str) -> None:
+        """현재 트랜잭션이 커밋되면 버전을 올리도록 등록 (롤백되면 그대로)"""
+        after_commit(db, lambda: self.invalidate(*names))
+
+    def _record(self, route: str, counter: str) -> None:
+        with self._lock:
+            counters = self._routes.setdefault(
+                route, {"hits": 0, "misses": 0, "not_modified": 0, "errors": 0}
+            )
+            counters[counter] += 1
+            if counter == "errors":
+                self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """경로별 캐시 적중 통계"""
+        with self._lock:
+            routes = {}
+            hits = misses = not_modified = 0
+            for route, counters in self._routes.items():
+                lookups = counters["hits"] + counters["misses"]
+                routes[route] = {
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+                }
+                hits += counters["hits"]
+                misses += counters["misses"]
+                not_modified += counters["not_modified"]
+            return {
+                "hits": hits,
+                "misses": misses,
+                "not_modified": not_modified,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "invalidations": self.invalidations,
+                "errors": self.errors,
+                "routes": routes,
+            }
+
+
+response_cache = ResponseCache(ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+metrics_registry.register("response_cache", response_cache.stats)
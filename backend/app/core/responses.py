@@ -0,0 +1,66 @@
+from functools import lru_cache
+from typing import Any, Iterator
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+
+def json_response(adapter: TypeAdapter, value: Any) -> Response:
+    """
+    응답 모델 값을 JSON 바이트로 바로 직렬화한 응답
+
+    엔드포인트가 모델을 그대로 반환하면 FastAPI는 response_model로 다시 검증하고
+    dict로 변환한 뒤 json.dumps로 인코딩합니다. 목록처럼 큰 응답은 서비스가 만든 모델을
+    pydantic 직렬화기로 한 번에 바이트로 만들어 그 과정을 건너뜁니다.
+    (response_model은 API 문서용으로 그대로 지정)
+
+    Args:
+        adapter: 값을 직렬화할 TypeAdapter (response_model과 같은 타입)
+        value: 서비스가 반환한 응답 모델
+    """
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    """타입별 TypeAdapter (스키마 생성 비용이 커서 재사용)"""
+    return TypeAdapter(annotation)
+
+
+def iter_list_json(value: BaseModel, field: str, chunk_size: int) -> Iterator[bytes]:
+    """
+    목록 응답 모델을 JSON 조각으로 인코딩
+
+    목록 필드를 chunk_size개씩 인코딩한 뒤 나머지 필드(총 개수, 커서 등)를 이어 씁니다.
+    목록 필드가 모델의 첫 필드이면 결과는 모델 전체를 한 번에 직렬화한 것과 같습니다.
+    """
+    entries = getattr(value, field)
+    entries_adapter = _adapter(type(value).model_fields[field].annotation)
+    yield f'{{"{field}":['.encode()
+    for start in range(0, len(entries), chunk_size):
+        chunk = entries_adapter.dump_json(entries[start:start + chunk_size])[1:-1]
+        yield b"," + chunk if start else chunk
+    rest = value.model_dump_json(exclude={field})
+    yield b"]" + (b"," + rest[1:].encode() if rest != "{}" else b"}")
+
+
+def json_list_response(value: BaseModel, field: str) -> Response:
+    """
+    목록 응답 (항목이 많으면 나누어 인코딩하며 스트리밍)
+
+    관리자 목록처럼 수백~천 개 항목을 담은 응답은 본문 전체를 한 번에 만들지 않고
+    LIST_STREAM_CHUNK_SIZE개씩 인코딩해 전송합니다. 인코딩은 스레드풀에서 조각 단위로 실행되어
+    이벤트 루프를 오래 막지 않고, 메모리에는 본문 대신 조각 하나만 올라갑니다.
+    항목이 적으면 Content-Length가 있는 일반 응답으로 반환합니다.
+
+    Args:
+        value: 서비스가 반환한 목록 응답 모델
+        field: 항목 목록 필드 이름 (예: "rentals")
+    """
+    chunk_size = settings.LIST_STREAM_CHUNK_SIZE
+    if chunk_size <= 0 or len(getattr(value, field)) <= chunk_size:
+        return json_response(_adapter(type(value)), value)
+    return StreamingResponse(iter_list_json(value, field, chunk_size), media_type="application/json")
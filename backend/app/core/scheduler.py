@@ -0,0 +1,224 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.redis_client import async_redis_client
+from app.db.database import SessionLocal
+
+_LOCK_KEY_PREFIX = "scheduler:lock:"
+_RAN_KEY_PREFIX = "scheduler:ran:"
+
+# 잠금 값(토큰)이 자신의 것일 때만 연장/해제 (만료 후 다른 워커가 얻은 잠금을 건드리지 않도록)
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ScheduledJob:
+    """스케줄러에 등록된 주기 작업과 실행 통계"""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Session], Any],
+        interval_seconds: float,
+        backlog: Optional[Callable[[Session], int]] = None,
+        run_on_start: bool = True
+    ):
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.backlog = backlog
+        self.run_on_start = run_on_start
+        self.runs = 0
+        self.failures = 0
+        self.skipped_locked = 0
+        self.lock_errors = 0
+        self.lock_lost = 0
+        self.last_result: Any = None
+        self.last_backlog: Optional[int] = None
+        self.last_duration_ms: Optional[float] = None
+        self.max_duration_ms = 0.0
+        self.last_run_at: Optional[str] = None
+        self.last_error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_locked": self.skipped_locked,
+            "lock_errors": self.lock_errors,
+            "lock_lost": self.lock_lost,
+            "last_result": self.last_result,
+            "backlog": self.last_backlog,
+            "last_duration_ms": self.last_duration_ms,
+            "max_duration_ms": self.max_duration_ms,
+            "last_run_at": self.last_run_at,
+            "last_error": self.last_error,
+        }
+
+
+class JobScheduler:
+    """
+    프로세스 내 주기 작업 스케줄러 (lifespan에서 시작/종료)
+
+    작업은 Redis 실행 잠금(토큰 값, 실행 중 주기적으로 연장, 끝나면 토큰 확인 후 해제)을 얻은
+    워커만 실행하므로 실행이 주기보다 길어져도 겹치지 않으며, 잠금을 얻은 뒤 이번 주기 실행 표시
+    (SET NX, 만료 시간 = 실행 주기)도 얻어야 실행하므로 워커가 여러 개여도 주기마다 한 번만 실행됩니다.
+    Redis에 연결할 수 없으면 잠금 없이 실행하지 않고 이번 주기를 건너뜁니다.
+    작업은 새 동기 세션을 열어 스레드풀에서 실행하고, 실행 후 남은 처리 대상(backlog)을 기록합니다.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._renew = async_redis_client.register_script(_RENEW_SCRIPT)
+        self._release = async_redis_client.register_script(_RELEASE_SCRIPT)
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[Session], Any],
+        interval_seconds: float,
+        backlog: Optional[Callable[[Session], int]] = None,
+        run_on_start: bool = True
+    ) -> None:
+        """작업 등록 (같은 이름은 덮어씀)"""
+        self._jobs[name] = ScheduledJob(name, func, interval_seconds, backlog, run_on_start)
+
+    def start(self) -> None:
+        """등록된 작업별 백그라운드 루프 시작"""
+        for job in self._jobs.values():
+            self._tasks.append(asyncio.create_task(self._run_loop(job)))
+
+    async def stop(self) -> None:
+        """백그라운드 루프 종료 (실행 중인 작업은 스레드풀에서 끝까지 실행됨)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_loop(self, job: ScheduledJob) -> None:
+        if not job.run_on_start:
+            await asyncio.sleep(job.interval_seconds)
+        while True:
+            await self.run_job(job)
+            await asyncio.sleep(job.interval_seconds)
+
+    async def _acquire(self, job: ScheduledJob) -> Optional[str]:
+        """
+        실행 잠금과 이번 주기의 실행권 획득
+
+        Returns:
+            Optional[str]: 잠금 토큰 (다른 워커가 실행 중이거나 이번 주기에 이미 실행했거나
+            Redis에 연결할 수 없으면 None)
+        """
+        lock_key = f"{_LOCK_KEY_PREFIX}{job.name}"
+        token = f"{self._owner}:{uuid.uuid4().hex}"
+        try:
+            if not await async_redis_client.set(
+                lock_key, token, nx=True, px=settings.SCHEDULER_LOCK_LEASE_SECONDS * 1000
+            ):
+                job.skipped_locked += 1
+                return None
+            ran = await async_redis_client.set(
+                f"{_RAN_KEY_PREFIX}{job.name}",
+                self._owner,
+                nx=True,
+                px=max(1, int(job.interval_seconds * 1000))
+            )
+        except Exception as e:
+            job.lock_errors += 1
+            print(f"⚠️  Redis unavailable, skipping job '{job.name}': {e}")
+            return None
+        if not ran:
+            job.skipped_locked += 1
+            await self._release_lock(job, token)
+            return None
+        return token
+
+    async def _keep_lock(self, job: ScheduledJob, token: str) -> None:
+        """실행이 끝날 때까지 실행 잠금 연장"""
+        lease_ms = settings.SCHEDULER_LOCK_LEASE_SECONDS * 1000
+        while True:
+            await asyncio.sleep(settings.SCHEDULER_LOCK_LEASE_SECONDS / 3)
+            try:
+                renewed = await self._renew(keys=[f"{_LOCK_KEY_PREFIX}{job.name}"], args=[token, lease_ms])
+            except Exception as e:
+                job.lock_errors += 1
+                print(f"⚠️  스케줄 작업 잠금 연장 실패 ({job.name}): {e}")
+                continue
+            if not renewed:
+                job.lock_lost += 1
+                print(f"⚠️  스케줄 작업 잠금 만료 ({job.name}): 다른 워커가 같은 작업을 실행할 수 있습니다")
+                return
+
+    async def _release_lock(self, job: ScheduledJob, token: str) -> None:
+        try:
+            await self._release(keys=[f"{_LOCK_KEY_PREFIX}{job.name}"], args=[token])
+        except Exception as e:
+            # 해제하지 못한 잠금은 lease 만료 후 풀림
+            job.lock_errors += 1
+            print(f"⚠️  스케줄 작업 잠금 해제 실패 ({job.name}): {e}")
+
+    @staticmethod
+    def _execute(job: ScheduledJob):
+        with SessionLocal() as db:
+            result = job.func(db)
+            backlog = job.backlog(db) if job.backlog else None
+        return result, backlog
+
+    async def run_job(self, job: ScheduledJob) -> bool:
+        """작업 1회 실행 (실행권이 없으면 건너뜀)"""
+        token = await self._acquire(job)
+        if token is None:
+            return False
+
+        keep_lock = asyncio.create_task(self._keep_lock(job, token))
+        started = time.perf_counter()
+        try:
+            job.last_result, job.last_backlog = await run_in_threadpool(self._execute, job)
+            job.last_error = None
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            print(f"⚠️  스케줄 작업 실패 ({job.name}): {e}")
+        finally:
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+            job.runs += 1
+            job.last_duration_ms = elapsed_ms
+            job.max_duration_ms = max(job.max_duration_ms, elapsed_ms)
+            job.last_run_at = datetime.utcnow().isoformat()
+            keep_lock.cancel()
+            await asyncio.gather(keep_lock, return_exceptions=True)
+            await self._release_lock(job, token)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """작업별 실행 통계"""
+        return {name: job.stats() for name, job in self._jobs.items()}
+
+
+scheduler = JobScheduler()
+
+metrics_registry.register("scheduler", scheduler.stats)
@@ -2,17 +2,16 @@ from datetime import datetime, timedelta
 from typing import Any, Union, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-import redis
 from fastapi import HTTPException, status
 
 from app.core.config import settings
+from app.core.redis_client import redis_client, async_redis_client
+from app.core.session_touch import session_touch_buffer
+from app.core.user_cache import user_cache
 
 # 패스워드 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# Redis 클라이언트 (세션 관리용)
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     """JWT 액세스 토큰 생성"""
@@ -48,12 +47,25 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_session_key(user_id: int, token: str) -> str:
+    """세션 키 (토큰 마지막 12자리로 구분)"""
+    return f"session:{user_id}:{token[-12:]}"
+
+
+def get_session_index_key(user_id: int) -> str:
+    """사용자별 세션 인덱스 키 (sorted set: 세션 키 → 만료 시각 epoch)"""
+    return f"user_sessions:{user_id}"
+
+
 def create_session(user_id: int, token: str, expires_minutes: int = None) -> str:
     """Redis에 사용자 세션 생성"""
     if expires_minutes is None:
         expires_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
     
-    session_key = f"session:{user_id}:{token[-12:]}"  # 토큰 마지막 12자리로 세션 키 생성
+    session_key = get_session_key(user_id, token)  # 토큰 마지막 12자리로 세션 키 생성
+    index_key = get_session_index_key(user_id)
+    expires_seconds = expires_minutes * 60
+    now_epoch = datetime.utcnow().timestamp()
     
     session_data = {
         "user_id": str(user_id),
@@ -63,9 +75,17 @@ def create_session(user_id: int, token: str, expires_minutes: int = None) -> str
     }
     
     try:
-        # Redis에 세션 저장 (만료 시간 설정)
-        redis_client.hmset(session_key, session_data)
-        redis_client.expire(session_key, expires_minutes * 60)
+        # Redis에 세션 저장 (만료 시간 설정) + 사용자별 세션 인덱스 갱신
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.hmset(session_key, session_data)
+        pipe.expire(session_key, expires_seconds)
+        # 이미 만료된 세션은 인덱스에서 정리
+        pipe.zremrangebyscore(index_key, "-inf", now_epoch)
+        pipe.zadd(index_key, {session_key: now_epoch + expires_seconds})
+        # 인덱스는 가장 늦게 만료되는 세션만큼 유지 (TTL 없으면 설정, 더 길면 연장)
+        pipe.expire(index_key, expires_seconds, nx=True)
+        pipe.expire(index_key, expires_seconds, gt=True)
+        pipe.execute()
         print(f"✅ Redis session created: {session_key}")
     except Exception as e:
         print(f"⚠️  Redis unavailable, skipping session storage: {e}")
@@ -74,18 +94,18 @@ def create_session(user_id: int, token: str, expires_minutes: int = None) -> str
     return session_key
 
 
-def get_session(user_id: int, token: str) -> Optional[dict]:
+async def get_session(user_id: int, token: str) -> Optional[dict]:
     """Redis에서 사용자 세션 조회"""
-    session_key = f"session:{user_id}:{token[-12:]}"
+    session_key = get_session_key(user_id, token)
     
     try:
-        session_data = redis_client.hgetall(session_key)
+        session_data = await async_redis_client.hgetall(session_key)
         
         if not session_data:
             return None
         
-        # 마지막 접근 시간 업데이트
-        redis_client.hset(session_key, "last_accessed", datetime.utcnow().isoformat())
+        # 마지막 접근 시간 업데이트 (디바운스 후 일괄 기록)
+        session_touch_buffer.touch(session_key)
         
         return session_data
     except Exception as e:
@@ -96,17 +116,24 @@ def get_session(user_id: int, token: str) -> Optional[dict]:
 
 def delete_session(user_id: int, token: str = None) -> bool:
     """Redis에서 사용자 세션 삭제"""
+    # 세션이 사라지면 캐시된 사용자 정보도 함께 무효화
+    user_cache.invalidate(user_id)
+    
+    index_key = get_session_index_key(user_id)
+    
     try:
         if token:
             # 특정 세션 삭제
-            session_key = f"session:{user_id}:{token[-12:]}"
-            return bool(redis_client.delete(session_key))
+            session_key = get_session_key(user_id, token)
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.delete(session_key)
+            pipe.zrem(index_key, session_key)
+            deleted, _ = pipe.execute()
+            return bool(deleted)
         else:
-            # 사용자의 모든 세션 삭제
-            pattern = f"session:{user_id}:*"
-            keys = redis_client.keys(pattern)
-            if keys:
-                return bool(redis_client.delete(*keys))
+            # 사용자의 모든 세션 삭제 (인덱스 기반 - 해당 사용자 세션 수에 비례)
+            session_keys = redis_client.zrange(index_key, 0, -1)
+            redis_client.delete(index_key, *session_keys)
             return True
     except Exception as e:
         print(f"⚠️  Redis unavailable, cannot delete session: {e}")
@@ -114,14 +141,19 @@ def delete_session(user_id: int, token: str = None) -> bool:
         return True
 
 
+def touch_session(user_id: int, token: str) -> None:
+    """세션 마지막 접근 시간 갱신 요청 (세션 조회 없이, 디바운스 적용)"""
+    session_touch_buffer.touch(get_session_key(user_id, token))
+
+
 def delete_all_sessions(user_id: int) -> bool:
     """사용자의 모든 세션 삭제 (로그아웃, 계정 비활성화 시)"""
     return delete_session(user_id)
 
 
-def validate_session(user_id: int, token: str) -> bool:
+async def validate_session(user_id: int, token: str) -> bool:
     """세션 유효성 검증"""
-    session_data = get_session(user_id, token)
+    session_data = await get_session(user_id, token)
     if not session_data:
         # Redis가 없을 때는 JWT 토큰 자체의 유효성으로만 판단
         print(f"⚠️  No session data found, relying on JWT token validation only")
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.redis_client import async_redis_client
+
+# 세션이 아직 존재할 때만 last_accessed 갱신
+# (로그아웃/만료로 삭제된 세션 키가 TTL 없이 되살아나지 않도록)
+_TOUCH_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HSET', KEYS[1], 'last_accessed', ARGV[1])
+end
+return -1
+"""
+
+
+class SessionTouchBuffer:
+    """
+    세션 last_accessed 갱신 디바운스 버퍼
+
+    같은 세션은 interval_seconds에 최대 한 번만 기록하고, 기록할 갱신은
+    모아 두었다가 flush 시 파이프라인 한 번으로 Redis에 반영합니다.
+    """
+
+    def __init__(self, interval_seconds: int, flush_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.flush_seconds = flush_seconds
+        self._last_written: Dict[str, float] = {}
+        self._pending: Dict[str, str] = {}
+        self._script = async_redis_client.register_script(_TOUCH_SCRIPT)
+        self.touch_count = 0
+        self.writes_avoided = 0
+        self.writes_flushed = 0
+        self.flush_count = 0
+        self.flush_errors = 0
+
+    def touch(self, session_key: str) -> None:
+        """세션 접근 기록 (즉시 Redis에 쓰지 않음)"""
+        self.touch_count += 1
+        now = time.monotonic()
+
+        last_written = self._last_written.get(session_key)
+        if last_written is not None and now - last_written < self.interval_seconds:
+            self.writes_avoided += 1
+            return
+
+        self._last_written[session_key] = now
+        self._pending[session_key] = datetime.utcnow().isoformat()
+
+    async def flush(self) -> int:
+        """대기 중인 갱신을 파이프라인으로 일괄 기록"""
+        # 디바운스 기록 정리 (간격이 지난 세션은 다음 접근 때 다시 기록)
+        cutoff = time.monotonic() - self.interval_seconds
+        for session_key in [k for k, t in self._last_written.items() if t < cutoff]:
+            del self._last_written[session_key]
+
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for session_key, accessed_at in pending.items():
+                    await self._script(keys=[session_key], args=[accessed_at], client=pipe)
+                await pipe.execute()
+        except Exception as e:
+            self.flush_errors += 1
+            print(f"⚠️  Redis unavailable, skipping session touch flush: {e}")
+            return 0
+
+        self.writes_flushed += len(pending)
+        self.flush_count += 1
+        return len(pending)
+
+    async def run(self) -> None:
+        """주기적으로 flush하는 백그라운드 루프 (lifespan에서 시작)"""
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """디바운스 통계"""
+        return {
+            "touches": self.touch_count,
+            "writes_avoided": self.writes_avoided,
+            "writes_flushed": self.writes_flushed,
+            "pending": len(self._pending),
+            "flushes": self.flush_count,
+            "flush_errors": self.flush_errors,
+        }
+
+
+session_touch_buffer = SessionTouchBuffer(
+    interval_seconds=settings.SESSION_TOUCH_INTERVAL_SECONDS,
+    flush_seconds=settings.SESSION_TOUCH_FLUSH_SECONDS,
+)
+
+metrics_registry.register("session_touch", session_touch_buffer.stats)
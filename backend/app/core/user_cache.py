@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.redis_client import redis_client, async_redis_client
+from app.models.user import User, UserRole
+
+# 캐시에 보관하는 사용자 컬럼 (관계 속성은 캐시하지 않음)
+_USER_FIELDS = ("id", "student_id", "name", "department", "email", "is_active")
+_USER_DATETIME_FIELDS = ("created_at", "updated_at", "last_login_at")
+
+
+def _serialize_user(user: User) -> Dict[str, Any]:
+    """User 객체를 캐시 가능한 dict로 변환"""
+    data = {field: getattr(user, field) for field in _USER_FIELDS}
+    data["role"] = user.role.value if user.role else None
+    for field in _USER_DATETIME_FIELDS:
+        value = getattr(user, field)
+        data[field] = value.isoformat() if value else None
+    return data
+
+
+def _deserialize_user(data: Dict[str, Any]) -> User:
+    """캐시 dict에서 세션에 연결되지 않은 User 객체 복원"""
+    values = {field: data.get(field) for field in _USER_FIELDS}
+    values["role"] = UserRole(data["role"]) if data.get("role") else None
+    for field in _USER_DATETIME_FIELDS:
+        value = data.get(field)
+        values[field] = datetime.fromisoformat(value) if value else None
+    return User(**values)
+
+
+class UserCache:
+    """
+    인증 사용자 2단계 캐시
+
+    - 1단계: 프로세스 내 LRU (키: 사용자 ID + 토큰 마지막 12자리, 짧은 TTL)
+    - 2단계: Redis (키: 사용자 ID, 워커 간 공유)
+
+    로그아웃/세션 전체 삭제/계정 비활성화 시 invalidate()로 무효화합니다.
+    다른 워커의 1단계 캐시는 최대 USER_CACHE_TTL_SECONDS 동안 유지될 수 있습니다.
+    """
+
+    def __init__(self, ttl_seconds: int, redis_ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _local_key(user_id: int, token: str) -> Tuple[int, str]:
+        return user_id, token[-12:]
+
+    @staticmethod
+    def _redis_key(user_id: int) -> str:
+        return f"user_cache:{user_id}"
+
+    def get_local(self, user_id: int, token: str) -> Optional[User]:
+        """1단계(프로세스 내) 캐시 조회"""
+        if self.ttl_seconds <= 0:
+            return None
+
+        key = self._local_key(user_id, token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.local_hits += 1
+        return _deserialize_user(data)
+
+    async def get_shared(self, user_id: int, token: str) -> Optional[User]:
+        """2단계(Redis) 캐시 조회 - 적중 시 1단계 캐시도 채움"""
+        if self.redis_ttl_seconds <= 0:
+            return None
+
+        try:
+            raw = await async_redis_client.get(self._redis_key(user_id))
+        except Exception as e:
+            print(f"⚠️  Redis unavailable, skipping user cache: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        data = json.loads(raw)
+        self._set_local(user_id, token, data)
+        with self._lock:
+            self.redis_hits += 1
+        return _deserialize_user(data)
+
+    async def set(self, user: User, token: str) -> None:
+        """조회한 사용자를 두 단계 캐시에 저장"""
+        data = _serialize_user(user)
+        self._set_local(user.id, token, data)
+
+        if self.redis_ttl_seconds <= 0:
+            return
+        try:
+            await async_redis_client.setex(self._redis_key(user.id), self.redis_ttl_seconds, json.dumps(data))
+        except Exception as e:
+            print(f"⚠️  Redis unavailable, skipping user cache: {e}")
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 캐시 무효화 (모든 토큰)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+        try:
+            redis_client.delete(self._redis_key(user_id))
+        except Exception as e:
+            print(f"⚠️  Redis unavailable, cannot invalidate user cache: {e}")
+
+    def _set_local(self, user_id: int, token: str, data: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+
+        key = self._local_key(user_id, token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계"""
+        with self._lock:
+            lookups = self.local_hits + self.redis_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "local_hits": self.local_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+user_cache = UserCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    redis_ttl_seconds=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+)
+
+metrics_registry.register("user_cache", user_cache.stats)
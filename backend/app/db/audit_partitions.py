@@ -0,0 +1,182 @@
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable
+
+from app.core.config import settings
+
+AUDIT_TABLE = "audit_logs"
+DEFAULT_PARTITION = f"{AUDIT_TABLE}_default"
+
+_PARTITION_NAME = re.compile(rf"^{AUDIT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+def month_start(value: date) -> date:
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """월 단위 이동 (결과는 해당 월의 1일)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month: date) -> Tuple[datetime, datetime]:
+    """월 범위 [시작, 다음 달 시작) (UTC)"""
+    end = add_months(month, 1)
+    return (
+        datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        datetime(end.year, end.month, 1, tzinfo=timezone.utc),
+    )
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 테이블 이름 (예: audit_logs_y2026m10)"""
+    return f"{AUDIT_TABLE}_y{month.year}m{month.month:02d}"
+
+
+def supports_partitioning(bind) -> bool:
+    """선언적 파티셔닝을 사용하는 DB인지 (PostgreSQL만 사용)"""
+    return bind.dialect.name == "postgresql"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """audit_logs가 파티션 테이블인지"""
+    if not supports_partitioning(connection):
+        return False
+    return bool(connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name))"),
+        {"name": AUDIT_TABLE}
+    ).scalar())
+
+
+def partitioned_table() -> Table:
+    """
+    모델 정의로 만든 파티션 부모 테이블
+
+    PostgreSQL 파티션 테이블의 기본 키에는 파티션 키가 포함되어야 하므로 기본 키를 (id, created_at)로 둡니다.
+    ORM 매핑은 그대로 id 기준입니다.
+    """
+    from app.models.audit_log import AuditLog
+    from app.models.user import User
+
+    metadata = MetaData()
+    User.__table__.to_metadata(metadata)  # 외래 키 대상
+    table = AuditLog.__table__.to_metadata(metadata)
+    table.c.created_at.nullable = False
+    table.c.created_at.primary_key = True
+    table.append_constraint(PrimaryKeyConstraint(table.c.id, table.c.created_at))
+    table.c.id.autoincrement = True
+    table.dialect_options["postgresql"]["partition_by"] = "RANGE (created_at)"
+    return table
+
+
+def list_partitions(connection: Connection) -> Dict[date, str]:
+    """월 파티션 목록 {월 1일: 테이블 이름}"""
+    names = connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:name)"
+    ), {"name": AUDIT_TABLE}).scalars()
+
+    partitions = {}
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def ensure_default_partition(connection: Connection) -> bool:
+    """월 파티션이 없는 시각의 로그를 받는 DEFAULT 파티션 생성 (이미 있으면 건너뜀) → 생성 여부"""
+    if connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": DEFAULT_PARTITION}).scalar():
+        return False
+    connection.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {AUDIT_TABLE} DEFAULT"))
+    return True
+
+
+def default_partition_months(connection: Connection) -> List[date]:
+    """DEFAULT 파티션에 들어간 로그의 월 목록 (UTC)"""
+    months = connection.execute(text(
+        f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC') FROM {DEFAULT_PARTITION}"
+    )).scalars()
+    return sorted(month.date() for month in months)
+
+
+def ensure_partitions(connection: Connection, first_month: date, last_month: date) -> List[str]:
+    """
+    first_month ~ last_month 월 파티션과 DEFAULT 파티션 생성 (이미 있는 월은 건너뜀)
+
+    미리 만든 범위 밖의 로그(WAL 복구, 파티션 생성 작업 지연)는 DEFAULT 파티션에 기록되며,
+    그 월의 파티션도 함께 만들어 DEFAULT 파티션의 로그를 옮깁니다 (보존 작업이 월 파티션 단위로 처리).
+    여러 워커가 동시에 실행해도 한 번만 만들도록 트랜잭션 advisory 잠금으로 직렬화합니다.
+    """
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": DEFAULT_PARTITION})
+    ensure_default_partition(connection)
+    existing = list_partitions(connection)
+
+    months = set(default_partition_months(connection))
+    month = month_start(first_month)
+    while month <= last_month:
+        months.add(month)
+        month = add_months(month, 1)
+
+    created = []
+    for month in sorted(months - set(existing)):
+        name = partition_name(month)
+        start, end = month_bounds(month)
+        # DDL은 바인딩 파라미터를 받지 않으므로 직접 계산한 경계값을 리터럴로 사용
+        start, end = start.isoformat(), end.isoformat()
+        # DEFAULT 파티션에 같은 범위의 로그가 있으면 파티션을 바로 만들 수 없으므로 빈 테이블에 옮긴 뒤 붙임
+        connection.execute(text(f"CREATE TABLE {name} (LIKE {AUDIT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        connection.execute(text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ))
+        connection.execute(text(
+            f"ALTER TABLE {AUDIT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+        ))
+        created.append(name)
+    return created
+
+
+def lock_partition(connection: Connection, month: date) -> None:
+    """보관 중 새 행이 들어오지 않도록 파티션 쓰기 잠금 (읽기는 허용, 트랜잭션 종료 시 해제)"""
+    connection.execute(text(f"LOCK TABLE {partition_name(month)} IN EXCLUSIVE MODE"))
+
+
+def drop_partition(connection: Connection, month: date) -> None:
+    """월 파티션 분리 후 삭제"""
+    name = partition_name(month)
+    connection.execute(text(f"ALTER TABLE {AUDIT_TABLE} DETACH PARTITION {name}"))
+    connection.execute(text(f"DROP TABLE {name}"))
+
+
+def prepare_partitions(engine: Engine, now: Optional[datetime] = None) -> None:
+    """
+    감사 로그 파티션 테이블 준비 (PostgreSQL, create_tables에서 실행)
+
+    테이블이 없으면 파티션 부모 테이블로 만들고, 지난달부터 AUDIT_LOG_PARTITION_PREMAKE_MONTHS개월 뒤까지
+    월 파티션과 DEFAULT 파티션을 만듭니다 (WAL 복구로 지난달 로그가 기록될 수 있고, 그보다 이전/이후
+    로그는 DEFAULT 파티션에 기록되므로 파티션이 없어 기록에 실패하지 않음).
+    기존 일반 테이블은 scripts/migrate_audit_log_partitions.py로 변환해야 합니다.
+    """
+    current = month_start(now or datetime.utcnow())
+    with engine.begin() as connection:
+        if not inspect(connection).has_table(AUDIT_TABLE):
+            connection.execute(CreateTable(partitioned_table()))
+        elif not is_partitioned(connection):
+            print("⚠️  audit_logs가 파티션 테이블이 아닙니다 (scripts/migrate_audit_log_partitions.py로 변환)")
+            return
+
+        created = ensure_partitions(
+            connection,
+            add_months(current, -1),
+            add_months(current, settings.AUDIT_LOG_PARTITION_PREMAKE_MONTHS)
+        )
+    if created:
+        print(f"감사 로그 파티션 생성: {', '.join(created)}")
@@ -1,11 +1,15 @@
-from sqlalchemy import create_engine
+from typing import Any, Callable, TypeVar, Union
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.db.pool_metrics import TimedQueuePool, TimedAsyncAdaptedQueuePool, pool_snapshot
 
 # 데이터베이스 엔진 생성 (PostgreSQL 또는 SQLite 지원)
 if settings.DATABASE_URL.startswith("sqlite"):
@@ -17,20 +21,83 @@ if settings.DATABASE_URL.startswith("sqlite"):
         echo=settings.DEBUG,
     )
 else:
-    # PostgreSQL 설정
+    # PostgreSQL 설정 (풀 크기는 워커 프로세스당 적용)
     engine = create_engine(
         settings.DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
         pool_pre_ping=True,
         echo=settings.DEBUG,
     )
 
-# 세션 팩토리 생성
+# 세션 팩토리 생성 (비동기 세션과 같이 커밋 후에도 객체를 만료하지 않아 응답 빌드 시 다시 조회하지 않음)
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
+
+def get_async_database_url(url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환"""
+    if url.startswith("sqlite+aiosqlite") or "+asyncpg" in url:
+        return url
+    if url.startswith("sqlite"):
+        return url.replace("sqlite", "sqlite+aiosqlite", 1)
+    if url.startswith("postgresql+psycopg2"):
+        return url.replace("postgresql+psycopg2", "postgresql+asyncpg", 1)
+    if url.startswith("postgresql"):
+        return url.replace("postgresql", "postgresql+asyncpg", 1)
+    return url
+
+
+# 비동기 엔진 생성 (USE_ASYNC_DB 설정 시에만 - asyncpg/aiosqlite 드라이버 필요)
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.USE_ASYNC_DB:
+    async_database_url = get_async_database_url(settings.DATABASE_URL)
+    if async_database_url.startswith("sqlite"):
+        async_engine = create_async_engine(
+            async_database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=settings.DEBUG,
+        )
+    else:
+        async_engine = create_async_engine(
+            async_database_url,
+            poolclass=TimedAsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+        )
+    
+    # 비동기 세션 팩토리 (커밋 후에도 응답 빌드를 위해 객체 만료하지 않음)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+def get_pool_metrics() -> dict:
+    """엔진별 커넥션 풀 메트릭 (현재 워커 기준)"""
+    pools = {"sync": pool_snapshot(engine.pool)}
+    if async_engine is not None:
+        pools["async"] = pool_snapshot(async_engine.pool)
+    return pools
+
+
+metrics_registry.register("db_pool", get_pool_metrics)
+
 # Base 클래스 생성
 Base = declarative_base()
 
@@ -45,6 +112,36 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """비동기 데이터베이스 세션을 가져오는 의존성 함수"""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("USE_ASYNC_DB가 비활성화되어 있어 비동기 세션을 사용할 수 없습니다")
+    
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 설정에 따라 선택되는 세션 의존성 (USE_ASYNC_DB=True면 AsyncSession)
+get_db_session = get_async_db if settings.USE_ASYNC_DB else get_db
+
+DBSession = Union[Session, AsyncSession]
+T = TypeVar("T")
+
+
+async def run_in_session(db: DBSession, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    세션 종류에 맞게 동기 ORM 코드를 실행
+    
+    - AsyncSession: run_sync로 이벤트 루프에서 실행 (스레드풀 미사용)
+    - Session: 기존과 동일하게 스레드풀에서 실행
+    
+    func의 첫 번째 인자로 동기 Session이 전달됩니다.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(lambda session: func(session, *args, **kwargs))
+    return await run_in_threadpool(func, db, *args, **kwargs)
+
+
 async def create_tables():
     """테이블 생성 함수"""
     # 모든 모델 import (테이블 생성을 위해)
@@ -54,12 +151,64 @@ async def create_tables():
     from app.models.reservation import Reservation
     from app.models.rental import Rental
     from app.models.audit_log import AuditLog
+    from app.models.statistic_counter import StatisticCounter
+    from app.db.audit_partitions import prepare_partitions, supports_partitioning
     
-    # 테이블 생성
-    Base.metadata.create_all(bind=engine)
+    # 테이블 생성 (PostgreSQL의 감사 로그는 월별 파티션 테이블로 따로 생성)
+    partitioned = supports_partitioning(engine)
+    Base.metadata.create_all(bind=engine, tables=[
+        table for table in Base.metadata.sorted_tables
+        if not (partitioned and table is AuditLog.__table__)
+    ])
+    if partitioned:
+        prepare_partitions(engine)
+    
+    # 기존 테이블에 나중에 추가된 컬럼 생성
+    _add_missing_columns()
+    
+    # 기존 테이블에 나중에 추가된 인덱스 생성 (create_all은 이미 있는 테이블의 인덱스를 만들지 않음)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     print("데이터베이스 테이블이 생성되었습니다.")
 
 
+def _add_missing_columns():
+    """
+    모델에는 있지만 기존 테이블에 없는 컬럼을 ALTER TABLE로 추가
+    
+    nullable 컬럼과, 기존 행을 채울 server_default가 있는 NOT NULL 컬럼만 자동 추가합니다.
+    """
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    ddl_compiler = engine.dialect.ddl_compiler(engine.dialect, None)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    continue
+                column_spec = column.type.compile(dialect=engine.dialect)
+                if column.server_default is not None:
+                    column_spec += f" DEFAULT {ddl_compiler.get_column_default_string(column)}"
+                if not column.nullable:
+                    column_spec += " NOT NULL"
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_spec}"
+                ))
+                print(f"컬럼 추가: {table.name}.{column.name}")
+
+
+async def dispose_engines():
+    """엔진 연결 풀 정리 (애플리케이션 종료 시)"""
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
+
+
 async def init_db():
     """데이터베이스 초기화"""
     await create_tables()
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolWaitStats:
+    """커넥션 풀 대기 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait_count = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+        self.timeout_count = 0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """커넥션 획득 대기 시간 기록"""
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_seconds += seconds
+            self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+            if timed_out:
+                self.timeout_count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계 스냅샷"""
+        with self._lock:
+            avg = self.wait_total_seconds / self.wait_count if self.wait_count else 0.0
+            return {
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(avg * 1000, 3),
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3),
+                "wait_total_ms": round(self.wait_total_seconds * 1000, 3),
+                "timeout_count": self.timeout_count,
+            }
+
+
+class _TimedPoolMixin:
+    """풀에서 커넥션을 꺼낼 때까지 걸린 시간을 측정하는 믹스인"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        # dispose 후 재생성되는 풀도 같은 통계 객체를 이어서 사용
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """대기 시간 측정 QueuePool (동기 엔진용)"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """대기 시간 측정 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def pool_snapshot(pool) -> Dict[str, Any]:
+    """커넥션 풀 상태 스냅샷 (체크아웃/오버플로 커넥션 수 및 대기 시간)"""
+    snapshot: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        snapshot.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # overflow()는 풀이 다 차기 전에는 음수이므로 실제 사용 중인 초과 커넥션만 표시
+            "overflow_in_use": max(0, pool.overflow()),
+            "timeout_seconds": pool.timeout(),
+        })
+
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        snapshot.update(wait_stats.snapshot())
+
+    return snapshot
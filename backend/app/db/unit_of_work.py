@@ -0,0 +1,93 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics_registry
+
+_DEPTH_KEY = "unit_of_work_depth"
+_AFTER_COMMIT_KEY = "unit_of_work_after_commit"
+
+
+class UnitOfWorkStats:
+    """업무 트랜잭션 커밋/롤백 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commits = 0
+        self.rollbacks = 0
+        self.total_commit_ms = 0.0
+        self.max_commit_ms = 0.0
+
+    def record_commit(self, elapsed_seconds: float) -> None:
+        elapsed_ms = elapsed_seconds * 1000
+        with self._lock:
+            self.commits += 1
+            self.total_commit_ms += elapsed_ms
+            self.max_commit_ms = max(self.max_commit_ms, elapsed_ms)
+
+    def record_rollback(self) -> None:
+        with self._lock:
+            self.rollbacks += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "commits": self.commits,
+                "rollbacks": self.rollbacks,
+                "avg_commit_ms": round(self.total_commit_ms / self.commits, 3) if self.commits else None,
+                "max_commit_ms": round(self.max_commit_ms, 3),
+            }
+
+
+unit_of_work_stats = UnitOfWorkStats()
+
+metrics_registry.register("unit_of_work", unit_of_work_stats.snapshot)
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    업무 작업 하나를 트랜잭션 하나로 실행
+
+    블록이 정상 종료되면 한 번만 flush/커밋하고, 예외가 발생하면 롤백 후 다시 발생시킵니다.
+    중첩해서 사용하면 (예: 예약 확인 → 대여 생성) 가장 바깥 블록에서만 커밋하므로
+    안쪽 작업도 같은 트랜잭션에 포함됩니다.
+    서비스 코드는 블록 안에서 db.commit()을 호출하지 않아야 합니다.
+    """
+    depth = db.info.get(_DEPTH_KEY, 0)
+    db.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            started = time.perf_counter()
+            db.commit()
+            unit_of_work_stats.record_commit(time.perf_counter() - started)
+    except BaseException:
+        if depth == 0:
+            db.rollback()
+            db.info.pop(_AFTER_COMMIT_KEY, None)
+            unit_of_work_stats.record_rollback()
+        raise
+    finally:
+        db.info[_DEPTH_KEY] = depth
+
+    if depth == 0:
+        for callback in db.info.pop(_AFTER_COMMIT_KEY, []):
+            callback()
+
+
+def after_commit(db: Session, callback: Callable[[], Any]) -> None:
+    """
+    현재 트랜잭션이 커밋된 뒤 실행할 작업 등록 (롤백되면 실행하지 않음)
+
+    지연 큐 등록처럼 DB 밖의 부수 효과는 커밋이 확정된 뒤에 반영해야 합니다.
+    unit_of_work 블록 밖에서 호출하면 바로 실행합니다.
+    """
+    if not db.info.get(_DEPTH_KEY):
+        callback()
+        return
+    callbacks: List[Callable[[], Any]] = db.info.setdefault(_AFTER_COMMIT_KEY, [])
+    callbacks.append(callback)
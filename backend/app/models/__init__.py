@@ -5,6 +5,7 @@ from .item import Item
 from .reservation import Reservation
 from .rental import Rental
 from .audit_log import AuditLog
+from .statistic_counter import StatisticCounter
 
 __all__ = [
     "User",
@@ -12,5 +13,6 @@ __all__ = [
     "Item",
     "Reservation",
     "Rental",
-    "AuditLog"
+    "AuditLog",
+    "StatisticCounter"
 ]
\ No newline at end of file
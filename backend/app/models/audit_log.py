@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from typing import Optional, Dict, Any
@@ -7,17 +7,29 @@ from app.db.database import Base
 
 
 class AuditLog(Base):
-    """감사 로그 테이블"""
+    """
+    감사 로그 테이블
+    
+    PostgreSQL에서는 created_at 기준 월별 범위 파티션 테이블로 생성됩니다 (app/db/audit_partitions.py).
+    보존 기간이 지난 월은 압축 JSONL 파일로 옮겨지며, 조회는 AuditLogService가 DB와 보관 파일을 합쳐 처리합니다.
+    INSERT마다 갱신되는 인덱스를 줄이기 위해 인덱스는 조회 패턴별 복합 인덱스만 둡니다.
+    """
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # 기간 조회 및 목록 keyset 페이지네이션 (created_at, id)
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        # 레코드별 변경 이력 조회
+        Index("ix_audit_logs_table_record_created", "table_name", "record_id", "created_at"),
+    )
     
     # 기본 필드
-    id = Column(Integer, primary_key=True, index=True, comment="로그 ID")
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True, comment="사용자 ID (시스템 작업시 NULL 가능)")
+    id = Column(Integer, primary_key=True, comment="로그 ID")
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, comment="사용자 ID (시스템 작업시 NULL 가능)")
     
     # 작업 정보
-    action = Column(String(100), nullable=False, index=True, comment="수행된 작업 (CREATE, UPDATE, DELETE 등)")
-    table_name = Column(String(100), nullable=False, index=True, comment="대상 테이블명")
-    record_id = Column(Integer, nullable=True, index=True, comment="대상 레코드 ID")
+    action = Column(String(100), nullable=False, comment="수행된 작업 (CREATE, UPDATE, DELETE 등)")
+    table_name = Column(String(100), nullable=False, comment="대상 테이블명")
+    record_id = Column(Integer, nullable=True, comment="대상 레코드 ID")
     
     # 변경 내용
     changes = Column(JSON, nullable=True, comment="변경된 내용 (before/after)")
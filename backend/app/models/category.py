@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 
 from app.db.database import Base
@@ -15,7 +15,7 @@ class Category(Base):
     description = Column(Text, nullable=True, comment="카테고리 설명")
     
     # 상태
-    is_active = Column(Boolean, default=True, nullable=False, comment="활성 상태")
+    is_active = column_property(Column(Boolean, default=True, nullable=False, comment="활성 상태"), active_history=True)
     
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Index, event, inspect
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 import enum
 
 from app.db.database import Base
+from app.utils.text_search import build_search_tokens
 
 
 class ItemStatus(enum.Enum):
@@ -17,29 +18,57 @@ class ItemStatus(enum.Enum):
 class Item(Base):
     """품목 테이블"""
     __tablename__ = "items"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용 복합 인덱스 (created_at, id)
+        Index("ix_items_created_at_id", "created_at", "id"),
+    )
     
     # 기본 필드
     id = Column(Integer, primary_key=True, index=True, comment="품목 ID")
-    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False, index=True, comment="카테고리 ID")
+    category_id = column_property(Column(Integer, ForeignKey("categories.id"), nullable=False, index=True, comment="카테고리 ID"), active_history=True)
     name = Column(String(200), nullable=False, index=True, comment="품목 이름")
     description = Column(Text, nullable=True, comment="품목 설명")
     serial_number = Column(String(100), unique=True, nullable=False, index=True, comment="시리얼 번호")
     
     # 상태
-    status = Column(Enum(ItemStatus), default=ItemStatus.AVAILABLE, nullable=False, index=True, comment="품목 상태")
-    is_active = Column(Boolean, default=True, nullable=False, comment="활성 상태")
+    status = column_property(Column(Enum(ItemStatus), default=ItemStatus.AVAILABLE, nullable=False, index=True, comment="품목 상태"), active_history=True)
+    is_active = column_property(Column(Boolean, default=True, nullable=False, comment="활성 상태"), active_history=True)
     
     # 메타데이터 (JSONB - 품목별 특수 속성)
     item_metadata = Column(JSON, nullable=True, comment="메타데이터 (색상, 크기, 모델명 등)")
     
+    # 검색 색인 (이름/설명/일련번호의 n-gram 토큰, 쓰기 시 자동 갱신)
+    search_tokens = Column(Text, nullable=True, comment="검색 토큰 (n-gram)")
+    
+    # 현재 대여(반납 전)/예약(PENDING) - 상태 전이 시 갱신하는 비정규화 포인터 (조회 시 이력 테이블을 읽지 않음)
+    # items ↔ rentals/reservations 외래 키가 서로를 참조하므로 제약은 테이블 생성 후 ALTER로 추가
+    current_rental_id = Column(
+        Integer, ForeignKey("rentals.id", use_alter=True, name="fk_items_current_rental_id"),
+        nullable=True, comment="현재 대여 ID"
+    )
+    current_reservation_id = Column(
+        Integer, ForeignKey("reservations.id", use_alter=True, name="fk_items_current_reservation_id"),
+        nullable=True, comment="현재 예약 ID"
+    )
+    
+    # 낙관적 동시성 제어 (UPDATE마다 1씩 증가, 읽은 뒤 다른 트랜잭션이 먼저 수정했으면 StaleDataError)
+    version_id = Column(Integer, nullable=False, server_default="1", comment="행 버전")
+    
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정 시간")
     
+    # eager_defaults: INSERT/UPDATE 시 RETURNING으로 updated_at 등을 받아와 커밋 후 다시 조회하지 않음
+    __mapper_args__ = {"version_id_col": version_id, "eager_defaults": True}
+    
     # 관계 설정
     category = relationship("Category", back_populates="items")
-    reservations = relationship("Reservation", back_populates="item", cascade="all, delete-orphan")
-    rentals = relationship("Rental", back_populates="item", cascade="all, delete-orphan")
+    reservations = relationship(
+        "Reservation", back_populates="item", foreign_keys="Reservation.item_id", cascade="all, delete-orphan"
+    )
+    rentals = relationship(
+        "Rental", back_populates="item", foreign_keys="Rental.item_id", cascade="all, delete-orphan"
+    )
     
     def __repr__(self):
         return f"<Item(id={self.id}, name='{self.name}', serial='{self.serial_number}', status='{self.status.value}')>"
@@ -58,15 +87,24 @@ class Item(Base):
     def is_rented(self) -> bool:
         """대여 중 여부"""
         return self.status == ItemStatus.RENTED
-    
-    @property
-    def current_reservation(self):
-        """현재 활성 예약"""
-        from app.models.reservation import ReservationStatus
-        return next((r for r in self.reservations if r.status == ReservationStatus.PENDING), None)
-    
-    @property
-    def current_rental(self):
-        """현재 활성 대여"""
-        from app.models.rental import RentalStatus
-        return next((r for r in self.rentals if r.status == RentalStatus.ACTIVE), None)
\ No newline at end of file
+
+
+# PostgreSQL: 검색 토큰 GIN 색인 (토큰을 파서 없이 그대로 lexeme으로 사용)
+Index(
+    "ix_items_search_tokens",
+    func.array_to_tsvector(func.string_to_array(Item.search_tokens, " ")),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
+
+
+_SEARCH_FIELDS = ("name", "description", "serial_number")
+
+
+@event.listens_for(Item, "before_insert")
+@event.listens_for(Item, "before_update")
+def _refresh_search_tokens(mapper, connection, target):
+    """품목 생성 또는 검색 대상 필드 수정 시 검색 토큰 갱신"""
+    state = inspect(target)
+    if state.persistent and not any(state.attrs[field].history.has_changes() for field in _SEARCH_FIELDS):
+        return
+    target.search_tokens = build_search_tokens(*(getattr(target, field) for field in _SEARCH_FIELDS))
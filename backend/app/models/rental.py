@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Date
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Date, Index, Text
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 from datetime import datetime, timedelta, date
 import enum
@@ -12,32 +12,45 @@ class RentalStatus(enum.Enum):
     ACTIVE = "ACTIVE"       # 대여 중
     RETURNED = "RETURNED"   # 반납 완료
     OVERDUE = "OVERDUE"     # 연체
+    LOST = "LOST"           # 분실
 
 
 class Rental(Base):
     """대여 테이블"""
     __tablename__ = "rentals"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용 복합 인덱스 (created_at, id)
+        Index("ix_rentals_created_at_id", "created_at", "id"),
+    )
     
     # 기본 필드
     id = Column(Integer, primary_key=True, index=True, comment="대여 ID")
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True, comment="사용자 ID")
     item_id = Column(Integer, ForeignKey("items.id"), nullable=False, index=True, comment="품목 ID")
+    reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=True, comment="연결된 예약 ID")
     
     # 대여 시간 정보
-    rental_date = Column(Date, default=date.today, nullable=False, comment="대여 일자")
+    rental_date = column_property(Column(Date, default=date.today, nullable=False, comment="대여 일자"), active_history=True)
     due_date = Column(Date, nullable=False, comment="반납 예정 일자")
-    return_date = Column(Date, nullable=True, comment="실제 반납 일자")
+    return_date = column_property(Column(Date, nullable=True, comment="실제 반납 일자"), active_history=True)
     
     # 상태
-    status = Column(Enum(RentalStatus), default=RentalStatus.ACTIVE, nullable=False, index=True, comment="대여 상태")
+    status = column_property(Column(Enum(RentalStatus), default=RentalStatus.ACTIVE, nullable=False, index=True, comment="대여 상태"), active_history=True)
+    
+    # 메모
+    notes = Column(Text, nullable=True, comment="대여 메모")
+    admin_notes = Column(Text, nullable=True, comment="관리자 메모")
     
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정 시간")
     
+    # INSERT/UPDATE 시 RETURNING으로 서버 생성 값을 받아와 커밋 후 다시 조회하지 않음
+    __mapper_args__ = {"eager_defaults": True}
+    
     # 관계 설정
     user = relationship("User", back_populates="rentals")
-    item = relationship("Item", back_populates="rentals")
+    item = relationship("Item", back_populates="rentals", foreign_keys=[item_id])
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
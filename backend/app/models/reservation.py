@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Index, Text
+from sqlalchemy.orm import column_property, relationship
 from sqlalchemy.sql import func
 from datetime import datetime, timedelta
 import enum
@@ -18,6 +18,10 @@ class ReservationStatus(enum.Enum):
 class Reservation(Base):
     """예약 테이블"""
     __tablename__ = "reservations"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용 복합 인덱스 (created_at, id)
+        Index("ix_reservations_created_at_id", "created_at", "id"),
+    )
     
     # 기본 필드
     id = Column(Integer, primary_key=True, index=True, comment="예약 ID")
@@ -29,15 +33,21 @@ class Reservation(Base):
     expires_at = Column(DateTime(timezone=True), nullable=False, comment="만료 시간")
     
     # 상태
-    status = Column(Enum(ReservationStatus), default=ReservationStatus.PENDING, nullable=False, index=True, comment="예약 상태")
+    status = column_property(Column(Enum(ReservationStatus), default=ReservationStatus.PENDING, nullable=False, index=True, comment="예약 상태"), active_history=True)
+    
+    # 메모
+    notes = Column(Text, nullable=True, comment="예약 메모")
     
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정 시간")
     
+    # INSERT/UPDATE 시 RETURNING으로 서버 생성 값을 받아와 커밋 후 다시 조회하지 않음
+    __mapper_args__ = {"eager_defaults": True}
+    
     # 관계 설정
     user = relationship("User", back_populates="reservations")
-    item = relationship("Item", back_populates="reservations")
+    item = relationship("Item", back_populates="reservations", foreign_keys=[item_id])
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class StatisticCounter(Base):
+    """대시보드 통계 집계 테이블 (상태 변경 시 증분 갱신, 주기적으로 재계산해 보정)"""
+    __tablename__ = "statistic_counters"
+
+    # 카운터 이름 (예: rentals.status.ACTIVE, items.category.3, reservations.created.2025-08-29)
+    name = Column(String(100), primary_key=True, comment="카운터 이름")
+    value = Column(BigInteger, default=0, nullable=False, comment="카운터 값")
+
+    # 타임스탬프
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정 시간")
+
+    def __repr__(self):
+        return f"<StatisticCounter(name='{self.name}', value={self.value})>"
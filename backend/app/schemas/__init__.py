@@ -5,4 +5,5 @@ from .user import *
 from .category import *
 from .item import *
 from .reservation import *
-from .rental import *
\ No newline at end of file
+from .rental import *
+from .audit_log import *
\ No newline at end of file
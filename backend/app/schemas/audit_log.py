@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+from enum import Enum
+
+
+class AuditLogExportFormat(str, Enum):
+    """감사 로그 내보내기 형식"""
+    NDJSON = "ndjson"   # 한 줄에 JSON 객체 하나
+    CSV = "csv"
+
+
+class AuditLogFilter(BaseModel):
+    """감사 로그 검색 필터 스키마"""
+    user_id: Optional[int] = Field(None, description="작업한 사용자 ID")
+    action: Optional[str] = Field(None, description="작업 (예: RENTAL_RETURNED)")
+    table_name: Optional[str] = Field(None, description="대상 테이블명")
+    record_id: Optional[int] = Field(None, description="대상 레코드 ID")
+    date_from: Optional[datetime] = Field(None, description="조회 시작 시각 (포함, timezone 없으면 UTC)")
+    date_to: Optional[datetime] = Field(None, description="조회 종료 시각 (미포함, timezone 없으면 UTC)")
+
+
+class AuditLogResponse(BaseModel):
+    """감사 로그 응답 스키마"""
+    id: int
+    user_id: Optional[int] = Field(None, description="작업한 사용자 ID (시스템 작업은 null)")
+    action: str
+    table_name: str
+    record_id: Optional[int] = None
+    changes: Optional[Dict[str, Any]] = Field(None, description="변경 내용 (필드별 before/after)")
+    description: Optional[str] = None
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "id": 1024,
+                "user_id": 1,
+                "action": "RENTAL_RETURNED",
+                "table_name": "rentals",
+                "record_id": 15,
+                "changes": None,
+                "description": "대여 반납: 보조배터리 (PWR001)",
+                "ip_address": "10.0.0.12",
+                "user_agent": None,
+                "created_at": "2025-09-05T14:00:00Z"
+            }
+        }
+
+
+class AuditLogList(BaseModel):
+    """감사 로그 목록 응답 스키마"""
+    audit_logs: list[AuditLogResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
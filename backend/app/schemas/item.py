@@ -111,6 +111,7 @@ class ItemList(BaseModel):
     rented_count: int
     reserved_count: int
     maintenance_count: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     
     class Config:
         json_schema_extra = {
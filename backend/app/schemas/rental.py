@@ -124,6 +124,7 @@ class RentalList(BaseModel):
     returned_count: int
     overdue_count: int
     lost_count: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     
     class Config:
         json_schema_extra = {
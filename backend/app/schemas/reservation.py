@@ -105,6 +105,7 @@ class ReservationList(BaseModel):
     confirmed_count: int
     cancelled_count: int
     expired_count: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
     
     class Config:
         json_schema_extra = {
@@ -0,0 +1,42 @@
+import functools
+from typing import Any, Callable
+
+from app.db.database import DBSession, run_in_session
+from app.services.item_service import ItemService
+from app.services.category_service import CategoryService
+from app.services.reservation_service import ReservationService
+from app.services.rental_service import RentalService
+from app.services.audit_log_service import AuditLogService
+
+
+def _to_async(method: Callable[..., Any]):
+    """동기 서비스 메서드를 세션 종류에 맞게 실행하는 코루틴으로 변환"""
+    @functools.wraps(method)
+    async def wrapper(db: DBSession, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_session(db, method, *args, **kwargs)
+
+    return staticmethod(wrapper)
+
+
+def _build_async_service(service_cls: type, name: str) -> type:
+    """
+    서비스 클래스의 공개 정적 메서드를 비동기 버전으로 감싼 클래스 생성
+
+    AsyncSession이 주입되면 run_sync로 이벤트 루프에서, 동기 Session이 주입되면
+    스레드풀에서 기존 서비스 로직을 그대로 실행합니다. 비즈니스 로직은
+    동기 서비스 한 곳에만 유지됩니다.
+    """
+    attrs = {"__doc__": f"{service_cls.__name__} 비동기 버전"}
+    for attr_name, attr in vars(service_cls).items():
+        if attr_name.startswith("_") or not isinstance(attr, staticmethod):
+            continue
+        attrs[attr_name] = _to_async(attr.__func__)
+
+    return type(name, (), attrs)
+
+
+AsyncItemService = _build_async_service(ItemService, "AsyncItemService")
+AsyncCategoryService = _build_async_service(CategoryService, "AsyncCategoryService")
+AsyncReservationService = _build_async_service(ReservationService, "AsyncReservationService")
+AsyncRentalService = _build_async_service(RentalService, "AsyncRentalService")
+AsyncAuditLogService = _build_async_service(AuditLogService, "AsyncAuditLogService")
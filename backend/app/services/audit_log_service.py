@@ -0,0 +1,460 @@
+import csv
+import glob
+import gzip
+import heapq
+import io
+import json
+import os
+import re
+from datetime import date, datetime, timezone
+from itertools import chain, dropwhile, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import audit_partitions
+from app.db.audit_partitions import add_months, month_bounds, month_start
+from app.db.database import SessionLocal
+from app.db.unit_of_work import unit_of_work
+from app.models.audit_log import AuditLog
+from app.schemas.audit_log import AuditLogExportFormat, AuditLogFilter, AuditLogList, AuditLogResponse
+from app.utils.pagination import datetime_literal, decode_cursor, encode_cursor
+
+_ARCHIVE_NAME = re.compile(r"^audit_logs-(\d{4})-(\d{2})\.jsonl\.gz$")
+
+_EXPORT_COLUMNS = [column.name for column in AuditLog.__table__.columns]
+
+SortKey = Tuple[datetime, int]
+
+
+def _utc(value: datetime) -> datetime:
+    """정렬/비교용 UTC 시각 (timezone 없는 값은 UTC로 간주 - SQLite 저장값)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _sort_key(row: Dict[str, Any]) -> SortKey:
+    return _utc(row["created_at"]), row["id"]
+
+
+def _unique(rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """정렬된 행에서 연속된 중복 행 제거 (보관 파일 기록 후 DB 삭제 전에 중단된 경우 양쪽에 같은 행이 있음)"""
+    previous = None
+    for row in rows:
+        key = _sort_key(row)
+        if key != previous:
+            yield row
+        previous = key
+
+
+def _concat_sorted(
+    first: Iterable[Dict[str, Any]], second: Iterable[Dict[str, Any]], descending: bool
+) -> Iterator[Dict[str, Any]]:
+    """
+    정렬된 두 행 목록을 이어 읽음 (second는 first가 끝난 뒤에 읽기 시작)
+
+    보관 파일 기록 후 DB 삭제 전에 중단된 월은 양쪽에 같은 행이 있으므로,
+    second에서 first의 마지막 행 이전(정렬 순서 기준)에 해당하는 행은 건너뜁니다.
+    """
+    last = None
+    for row in first:
+        last = _sort_key(row)
+        yield row
+    if last is None:
+        yield from second
+    elif descending:
+        yield from dropwhile(lambda row: _sort_key(row) >= last, second)
+    else:
+        yield from dropwhile(lambda row: _sort_key(row) <= last, second)
+
+
+def _csv_value(row: Dict[str, Any], column: str) -> Any:
+    value = row[column]
+    if column == "changes" and value is not None:
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _archive_path(month: date) -> str:
+    return os.path.join(settings.AUDIT_LOG_ARCHIVE_DIR, f"audit_logs-{month.year}-{month.month:02d}.jsonl.gz")
+
+
+def _archived_months() -> List[date]:
+    """보관 파일이 있는 월 목록 (오름차순)"""
+    months = []
+    for path in glob.glob(os.path.join(settings.AUDIT_LOG_ARCHIVE_DIR, "audit_logs-*.jsonl.gz")):
+        match = _ARCHIVE_NAME.match(os.path.basename(path))
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def _read_archive(month: date) -> Iterator[Dict[str, Any]]:
+    """보관 파일의 로그를 (created_at, id) 오름차순으로 읽음"""
+    try:
+        archive = gzip.open(_archive_path(month), "rt", encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with archive:
+        for line in archive:
+            row = json.loads(line)
+            row["created_at"] = datetime.fromisoformat(row["created_at"])
+            yield row
+
+
+def _write_archive(month: date, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    월 보관 파일에 로그 추가 ((created_at, id) 오름차순 행을 기존 파일 내용과 병합, 같은 행은 한 번만 기록)
+
+    임시 파일에 모두 쓰고 fsync한 뒤 교체하므로 중간에 실패해도 기존 파일은 그대로입니다.
+    """
+    path = _archive_path(month)
+    temp_path = f"{path}.tmp"
+    os.makedirs(settings.AUDIT_LOG_ARCHIVE_DIR, exist_ok=True)
+
+    written = 0
+    with open(temp_path, "wb") as raw:
+        with gzip.open(raw, "wt", encoding="utf-8", compresslevel=6) as archive:
+            for row in _unique(heapq.merge(_read_archive(month), rows, key=_sort_key)):
+                archive.write(json.dumps(row, ensure_ascii=False, default=datetime.isoformat) + "\n")
+                written += 1
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(temp_path, path)
+    return written
+
+
+class AuditLogService:
+    """
+    감사 로그 보존 및 조회 서비스
+
+    DB에는 최근 AUDIT_LOG_RETENTION_MONTHS개월만 남기고, 그 이전 월은 월별 압축 JSONL 파일
+    (AUDIT_LOG_ARCHIVE_DIR/audit_logs-YYYY-MM.jsonl.gz, (created_at, id) 오름차순)로 옮깁니다.
+    보관 파일에는 DB보다 오래된 로그만 있으므로 조회는 DB와 보관 파일을 (created_at, id) 순서로 이어 읽어 스트리밍합니다.
+    """
+
+    @staticmethod
+    def iter_logs(
+        db: Session,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        table_name: Optional[str] = None,
+        record_id: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        descending: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        DB와 보관 파일의 감사 로그를 (created_at, id) 순서로 조회 (스트리밍)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id, action, table_name, record_id: 일치 조건
+            start, end: 기간 [start, end) (timezone 없는 값은 UTC)
+            cursor: 이 커서 이후의 로그만 조회 (app.utils.pagination.encode_cursor 형식)
+            descending: 최신순 여부
+
+        Yields:
+            감사 로그 dict (AuditLog 컬럼과 같은 키)
+
+        Raises:
+            ValueError: 형식이 잘못된 커서
+        """
+        after = None
+        if cursor:
+            cursor_at, cursor_id = decode_cursor(cursor)
+            after = (_utc(cursor_at), cursor_id)
+        start = _utc(start) if start else None
+        end = _utc(end) if end else None
+
+        # DB 조회를 먼저 실행한 뒤 보관 파일 목록을 읽음 (보관 작업은 파일을 만든 뒤 DB에서 삭제하므로
+        # 그 사이에 보관된 월도 둘 중 한 곳에서는 반드시 조회됨)
+        live = AuditLogService._iter_live(db, user_id, action, table_name, record_id, start, end, after, descending)
+        archived = AuditLogService._iter_archived(user_id, action, table_name, record_id, start, end, after, descending)
+        # 보관 파일에는 DB의 어떤 로그보다 오래된 로그만 있으므로 병합하지 않고 이어 읽음
+        # (최신순이면 DB를 다 읽은 뒤에야 보관 파일을 열어, DB만으로 채워지는 페이지는 파일을 읽지 않음)
+        if descending:
+            return _concat_sorted(live, archived, descending)
+        return _concat_sorted(archived, live, descending)
+
+    @staticmethod
+    def query_logs(
+        db: Session,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        table_name: Optional[str] = None,
+        record_id: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """감사 로그 최대 limit건 조회 (조건은 iter_logs와 같음)"""
+        logs = AuditLogService.iter_logs(
+            db, user_id, action, table_name, record_id, start, end, cursor, descending
+        )
+        return list(islice(logs, limit))
+
+    @staticmethod
+    def get_audit_logs(
+        db: Session,
+        filters: AuditLogFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> AuditLogList:
+        """
+        감사 로그 목록 조회 (최신순, keyset 페이지네이션)
+
+        Raises:
+            ValueError: 형식이 잘못된 커서
+        """
+        logs = AuditLogService.query_logs(
+            db, **AuditLogService._filter_args(filters), cursor=cursor, limit=limit + 1
+        )
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1]["created_at"], logs[-1]["id"])
+
+        return AuditLogList(
+            audit_logs=[AuditLogResponse.model_validate(log) for log in logs],
+            next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def export_logs(
+        db: Session,
+        filters: AuditLogFilter,
+        export_format: AuditLogExportFormat,
+        chunk_rows: int = 1000
+    ) -> Iterator[str]:
+        """
+        조건에 맞는 감사 로그 전체를 오래된 순으로 내보내기 (chunk_rows행씩 텍스트 조각 생성)
+
+        DB 결과와 보관 파일을 스트리밍으로 읽으므로 로그 수와 무관하게 메모리 사용량이 일정합니다.
+        CSV는 Excel에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작하며 changes는 JSON 문자열로 씁니다.
+        """
+        logs = AuditLogService.iter_logs(db, **AuditLogService._filter_args(filters), descending=False)
+        buffer = io.StringIO()
+        writer = None
+        if export_format == AuditLogExportFormat.CSV:
+            buffer.write("\ufeff")
+            writer = csv.writer(buffer)
+            writer.writerow(_EXPORT_COLUMNS)
+
+        rows = 0
+        for log in logs:
+            if writer is not None:
+                writer.writerow([_csv_value(log, column) for column in _EXPORT_COLUMNS])
+            else:
+                buffer.write(json.dumps(log, ensure_ascii=False, default=datetime.isoformat) + "\n")
+            rows += 1
+            if rows % chunk_rows == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _filter_args(filters: AuditLogFilter) -> Dict[str, Any]:
+        return {
+            "user_id": filters.user_id,
+            "action": filters.action,
+            "table_name": filters.table_name,
+            "record_id": filters.record_id,
+            "start": filters.date_from,
+            "end": filters.date_to,
+        }
+
+    @staticmethod
+    def _iter_live(
+        db: Session,
+        user_id: Optional[int],
+        action: Optional[str],
+        table_name: Optional[str],
+        record_id: Optional[int],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        after: Optional[SortKey],
+        descending: bool
+    ) -> Iterator[Dict[str, Any]]:
+        table = AuditLog.__table__
+        query = select(table)
+        if user_id is not None:
+            query = query.where(table.c.user_id == user_id)
+        if action:
+            query = query.where(table.c.action == action)
+        if table_name:
+            query = query.where(table.c.table_name == table_name)
+        if record_id is not None:
+            query = query.where(table.c.record_id == record_id)
+        if start:
+            query = query.where(table.c.created_at >= datetime_literal(start))
+        if end:
+            query = query.where(table.c.created_at < datetime_literal(end))
+        if after:
+            key = tuple_(table.c.created_at, table.c.id)
+            bound = tuple_(datetime_literal(after[0]), after[1])
+            query = query.where(key < bound if descending else key > bound)
+        if descending:
+            query = query.order_by(table.c.created_at.desc(), table.c.id.desc())
+        else:
+            query = query.order_by(table.c.created_at.asc(), table.c.id.asc())
+
+        result = db.execute(query, execution_options={"yield_per": 1000})
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            try:
+                for row in result.mappings():
+                    yield dict(row)
+            finally:
+                result.close()
+
+        return rows()
+
+    @staticmethod
+    def _iter_archived(
+        user_id: Optional[int],
+        action: Optional[str],
+        table_name: Optional[str],
+        record_id: Optional[int],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        after: Optional[SortKey],
+        descending: bool
+    ) -> Iterator[Dict[str, Any]]:
+        # 월 파일은 서로 겹치지 않으므로 순서대로 이어 읽음 (조건 범위 밖의 월은 열지 않음)
+        months = []
+        for month in _archived_months():
+            month_from, month_to = month_bounds(month)
+            if (start and month_to <= start) or (end and month_from >= end):
+                continue
+            if after and (month_to <= after[0] if not descending else month_from > after[0]):
+                continue
+            months.append(month)
+
+        def matches(row: Dict[str, Any]) -> bool:
+            if user_id is not None and row["user_id"] != user_id:
+                return False
+            if action and row["action"] != action:
+                return False
+            if table_name and row["table_name"] != table_name:
+                return False
+            if record_id is not None and row["record_id"] != record_id:
+                return False
+            created_at = _utc(row["created_at"])
+            if (start and created_at < start) or (end and created_at >= end):
+                return False
+            if after:
+                key = (created_at, row["id"])
+                return key < after if descending else key > after
+            return True
+
+        if not descending:
+            return chain.from_iterable(filter(matches, _read_archive(month)) for month in months)
+        # 최신순은 월 단위로 읽어 뒤집음 (메모리 사용량은 한 달 치 일치 행으로 제한)
+        return chain.from_iterable(
+            reversed(list(filter(matches, _read_archive(month)))) for month in reversed(months)
+        )
+
+    @staticmethod
+    def apply_retention(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        감사 로그 보존 작업 (스케줄러에서 실행)
+
+        파티션 테이블이면 앞으로 쓸 월 파티션을 미리 만들고, 보존 기간이 지난 월의 로그를
+        보관 파일로 옮긴 뒤 DB에서 제거합니다 (파티션은 분리 후 삭제, 일반 테이블은 범위 삭제).
+        월마다 별도 트랜잭션으로 처리하므로 중간에 실패해도 다음 실행에서 이어서 처리합니다.
+        """
+        current = month_start(now or datetime.utcnow())
+        cutoff = add_months(current, -settings.AUDIT_LOG_RETENTION_MONTHS)
+
+        with unit_of_work(db):
+            connection = db.connection()
+            partitioned = audit_partitions.is_partitioned(connection)
+            created = []
+            if partitioned:
+                created = audit_partitions.ensure_partitions(
+                    connection, current, add_months(current, settings.AUDIT_LOG_PARTITION_PREMAKE_MONTHS)
+                )
+                months = sorted(month for month in audit_partitions.list_partitions(connection) if month < cutoff)
+            else:
+                oldest = db.execute(
+                    select(func.min(AuditLog.created_at)).where(
+                        AuditLog.created_at < datetime_literal(month_bounds(cutoff)[0])
+                    )
+                ).scalar()
+                months = []
+                month = month_start(oldest) if oldest else cutoff
+                while month < cutoff:
+                    months.append(month)
+                    month = add_months(month, 1)
+
+        archived_months = archived_rows = 0
+        for month in months:
+            rows = AuditLogService._archive_month(db, month, partitioned)
+            archived_months += 1 if rows else 0
+            archived_rows += rows
+
+        return {
+            "partitions_created": len(created),
+            "months_archived": archived_months,
+            "rows_archived": archived_rows,
+        }
+
+    @staticmethod
+    def _archive_month(db: Session, month: date, partitioned: bool) -> int:
+        """한 달 치 로그를 보관 파일로 옮기고 DB에서 제거 → 옮긴 행 수"""
+        table = AuditLog.__table__
+        month_from, month_to = month_bounds(month)
+        in_month = (
+            table.c.created_at >= datetime_literal(month_from),
+            table.c.created_at < datetime_literal(month_to),
+        )
+        exported = {"rows": 0, "max_id": 0}
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            result = db.execute(
+                select(table).where(*in_month).order_by(table.c.created_at, table.c.id),
+                execution_options={"yield_per": 1000}
+            )
+            for row in result.mappings():
+                exported["rows"] += 1
+                exported["max_id"] = max(exported["max_id"], row["id"])
+                yield dict(row)
+
+        with unit_of_work(db):
+            connection = db.connection()
+            if partitioned:
+                audit_partitions.lock_partition(connection, month)
+            if db.execute(select(table.c.id).where(*in_month).limit(1)).first():
+                _write_archive(month, rows())
+            if partitioned:
+                audit_partitions.drop_partition(connection, month)
+            elif exported["rows"]:
+                # 내보낸 뒤 들어온 행(더 큰 id)은 다음 실행에서 보관
+                db.execute(delete(table).where(*in_month, table.c.id <= exported["max_id"]))
+
+        if exported["rows"]:
+            print(f"📦 감사 로그 보관: {month:%Y-%m} {exported['rows']}건")
+        return exported["rows"]
+
+
+def stream_export(filters: AuditLogFilter, export_format: AuditLogExportFormat) -> Iterator[bytes]:
+    """
+    내보내기 응답 본문 (StreamingResponse용)
+
+    응답을 보내는 동안 계속 읽어야 하므로 요청 세션 대신 자기 세션을 열어 스트리밍이 끝날 때까지 유지합니다.
+    """
+    with SessionLocal() as db:
+        for chunk in AuditLogService.export_logs(db, filters, export_format):
+            yield chunk.encode("utf-8")
@@ -6,10 +6,11 @@ import logging
 from datetime import datetime
 
 from app.core.config import settings
-from app.core.security import create_jwt_token, verify_token, validate_session, delete_all_sessions
+from app.core.security import create_jwt_token, verify_token, validate_session, delete_all_sessions, touch_session
+from app.core.user_cache import user_cache
 from app.models.user import User, UserRole
-from app.models.audit_log import AuditLog
-from app.db.database import get_db
+from app.core.audit_writer import audit_log_writer
+from app.db.database import get_db, DBSession, run_in_session
 
 logger = logging.getLogger(__name__)
 
@@ -425,14 +426,12 @@ class AuthService:
         university_user_info = await self.university_api.authenticate_student(student_id, password)
         if not university_user_info:
             # 감사 로그 기록
-            audit_log = AuditLog.create_log(
+            audit_log_writer.record(
                 action="LOGIN_FAILED",
                 table_name="users",
                 description=f"로그인 실패: {student_id}",
                 ip_address=ip_address
             )
-            db.add(audit_log)
-            db.commit()
             
             raise ValueError("학번 또는 비밀번호가 잘못되었습니다")
         
@@ -454,7 +453,7 @@ class AuthService:
             db.refresh(user)
             
             # 감사 로그 기록
-            audit_log = AuditLog.create_log(
+            audit_log_writer.record(
                 action="USER_CREATED",
                 table_name="users",
                 user_id=user.id,
@@ -462,8 +461,6 @@ class AuthService:
                 description=f"신규 사용자 생성: {student_id}",
                 ip_address=ip_address
             )
-            db.add(audit_log)
-            db.commit()  # 감사 로그도 커밋
             
         else:
             # 기존 사용자 정보 업데이트
@@ -475,6 +472,9 @@ class AuthService:
                 user.email = university_user_info["email"]
             user.last_login_at = datetime.utcnow()
             db.commit()  # 사용자 정보 업데이트 커밋
+            
+            # 변경된 사용자 정보가 캐시에 남지 않도록 무효화
+            user_cache.invalidate(user.id)
         
         # 비활성 사용자 체크
         if not user.is_active:
@@ -484,7 +484,7 @@ class AuthService:
         access_token, session_key = create_jwt_token(user.id)
         
         # 감사 로그 기록
-        audit_log = AuditLog.create_log(
+        audit_log_writer.record(
             action="LOGIN_SUCCESS",
             table_name="users",
             user_id=user.id,
@@ -492,8 +492,6 @@ class AuthService:
             description=f"로그인 성공: {student_id}",
             ip_address=ip_address
         )
-        db.add(audit_log)
-        db.commit()
         
         return {
             "access_token": access_token,
@@ -527,7 +525,7 @@ class AuthService:
         
         if success:
             # 감사 로그 기록
-            audit_log = AuditLog.create_log(
+            audit_log_writer.record(
                 action="LOGOUT",
                 table_name="users",
                 user_id=user_id,
@@ -535,18 +533,16 @@ class AuthService:
                 description="로그아웃",
                 ip_address=ip_address
             )
-            db.add(audit_log)
-            db.commit()
         
         return success
     
-    def get_current_user(self, token: str, db: Session) -> Optional[User]:
+    async def get_current_user(self, token: str, db: DBSession) -> Optional[User]:
         """
         현재 사용자 조회
         
         Args:
             token: JWT 토큰
-            db: 데이터베이스 세션
+            db: 데이터베이스 세션 (동기 또는 비동기)
             
         Returns:
             User object if valid, None if invalid
@@ -561,15 +557,33 @@ class AuthService:
         except ValueError:
             return None
         
+        # 1단계 캐시 (프로세스 내) - 적중 시 Redis/DB 조회 생략
+        cached_user = user_cache.get_local(user_id, token)
+        if cached_user:
+            touch_session(user_id, token)
+            return cached_user
+        
         # 세션 유효성 검증 (Redis 없을 때는 JWT만으로 인증)
-        session_valid = validate_session(user_id, token)
+        session_valid = await validate_session(user_id, token)
         if not session_valid:
             print(f"⚠️  Session validation failed for user {user_id}, using JWT-only auth")
         
+        # 2단계 캐시 (Redis)
+        cached_user = await user_cache.get_shared(user_id, token)
+        if cached_user:
+            return cached_user
+        
         # 사용자 조회
-        user = db.query(User).filter(
-            User.id == user_id,
-            User.is_active == True
-        ).first()
+        user_cache.record_miss()
+        user = await run_in_session(
+            db,
+            lambda session: session.query(User).filter(
+                User.id == user_id,
+                User.is_active == True
+            ).first()
+        )
+        
+        if user:
+            await user_cache.set(user, token)
         
         return user
\ No newline at end of file
@@ -1,11 +1,13 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 
 from app.models.category import Category
 from app.models.item import Item
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryList
-from app.models.audit_log import AuditLog
+from app.core.audit_writer import audit_log_writer
+from app.core.response_cache import response_cache, CATEGORIES
+from app.services.statistics_service import StatisticsService
 
 
 class CategoryService:
@@ -38,22 +40,16 @@ class CategoryService:
         # 총 개수 조회
         total = query.count()
         
-        # 페이지네이션 적용하여 카테고리 조회
-        categories = query.offset(skip).limit(limit).all()
+        # 페이지네이션 적용하여 카테고리와 활성 품목 개수를 함께 조회
+        rows = query.add_columns(
+            CategoryService._active_items_count()
+        ).order_by(Category.id).offset(skip).limit(limit).all()
         
-        # 각 카테고리별 활성 품목 개수 조회
         category_responses = []
-        for category in categories:
-            active_items_count = db.query(func.count(Item.id)).filter(
-                and_(
-                    Item.category_id == category.id,
-                    Item.is_active == True
-                )
-            ).scalar()
-            
-            category_data = CategoryResponse.model_validate(category)
-            category_data.active_items_count = active_items_count
-            category_responses.append(category_data)
+        for category, active_items_count in rows:
+            category_responses.append(
+                CategoryService._build_category_response(category, active_items_count)
+            )
         
         return CategoryList(categories=category_responses, total=total)
     
@@ -69,21 +65,14 @@ class CategoryService:
         Returns:
             CategoryResponse: 카테고리 정보
         """
-        category = db.query(Category).filter(Category.id == category_id).first()
-        if not category:
+        row = db.query(Category, CategoryService._active_items_count()).filter(
+            Category.id == category_id
+        ).first()
+        if not row:
             return None
         
-        # 활성 품목 개수 조회
-        active_items_count = db.query(func.count(Item.id)).filter(
-            and_(
-                Item.category_id == category.id,
-                Item.is_active == True
-            )
-        ).scalar()
-        
-        category_data = CategoryResponse.model_validate(category)
-        category_data.active_items_count = active_items_count
-        return category_data
+        category, active_items_count = row
+        return CategoryService._build_category_response(category, active_items_count)
     
     @staticmethod
     def create_category(
@@ -120,10 +109,11 @@ class CategoryService:
         
         db.add(category)
         db.commit()
+        response_cache.invalidate(CATEGORIES)
         db.refresh(category)
         
         # 감사 로그 기록
-        audit_log = AuditLog.create_log(
+        audit_log_writer.record(
             action="CATEGORY_CREATED",
             table_name="categories",
             user_id=user_id,
@@ -131,13 +121,9 @@ class CategoryService:
             description=f"카테고리 생성: {category.name}",
             ip_address=ip_address
         )
-        db.add(audit_log)
-        db.commit()
         
         # 활성 품목 개수는 0으로 설정
-        category_data = CategoryResponse.model_validate(category)
-        category_data.active_items_count = 0
-        return category_data
+        return CategoryService._build_category_response(category, 0)
     
     @staticmethod
     def update_category(
@@ -189,32 +175,27 @@ class CategoryService:
             setattr(category, field, value)
         
         db.commit()
+        response_cache.invalidate(CATEGORIES)
         db.refresh(category)
         
         # 감사 로그 기록
-        audit_log = AuditLog.create_log(
+        audit_log_writer.record(
             action="CATEGORY_UPDATED",
             table_name="categories",
             user_id=user_id,
             record_id=category.id,
             description=f"카테고리 수정: {category.name}",
-            old_data=old_data,
-            new_data=update_data,
+            changes={
+                field: {"before": old_data.get(field), "after": value}
+                for field, value in update_data.items()
+            },
             ip_address=ip_address
         )
-        db.add(audit_log)
-        db.commit()
         
         # 활성 품목 개수 조회
-        active_items_count = db.query(func.count(Item.id)).filter(
-            and_(
-                Item.category_id == category.id,
-                Item.is_active == True
-            )
-        ).scalar()
+        active_items_count = CategoryService._count_active_items(db, category.id)
         
-        category_response = CategoryResponse.model_validate(category)
-        category_response.active_items_count = active_items_count
+        category_response = CategoryService._build_category_response(category, active_items_count)
         return category_response
     
     @staticmethod
@@ -241,12 +222,7 @@ class CategoryService:
             return False
         
         # 카테고리에 속한 활성 품목이 있는지 확인
-        active_items_count = db.query(func.count(Item.id)).filter(
-            and_(
-                Item.category_id == category_id,
-                Item.is_active == True
-            )
-        ).scalar()
+        active_items_count = CategoryService._count_active_items(db, category_id)
         
         if active_items_count > 0:
             raise ValueError(f"카테고리에 {active_items_count}개의 활성 품목이 있어 삭제할 수 없습니다")
@@ -254,9 +230,10 @@ class CategoryService:
         # 소프트 삭제 실행
         category.is_active = False
         db.commit()
+        response_cache.invalidate(CATEGORIES)
         
         # 감사 로그 기록
-        audit_log = AuditLog.create_log(
+        audit_log_writer.record(
             action="CATEGORY_DELETED",
             table_name="categories",
             user_id=user_id,
@@ -264,45 +241,56 @@ class CategoryService:
             description=f"카테고리 삭제: {category.name}",
             ip_address=ip_address
         )
-        db.add(audit_log)
-        db.commit()
         
         return True
     
+    @staticmethod
+    def _build_category_response(category: Category, active_items_count: int) -> CategoryResponse:
+        """
+        카테고리 응답 생성
+        
+        모델의 active_items_count 프로퍼티는 items 관계 전체를 지연 로딩하므로
+        model_validate 대신 컬럼 값과 집계한 개수로 응답을 만듭니다.
+        """
+        return CategoryResponse(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+            active_items_count=active_items_count
+        )
+    
+    @staticmethod
+    def _active_items_count():
+        """카테고리별 활성 품목 개수 (카테고리 조회와 같은 쿼리에서 계산하는 상관 서브쿼리)"""
+        return select(func.count(Item.id)).where(
+            Item.category_id == Category.id,
+            Item.is_active == True
+        ).correlate(Category).scalar_subquery().label("active_items_count")
+    
+    @staticmethod
+    def _count_active_items(db: Session, category_id: int) -> int:
+        """특정 카테고리의 활성 품목 개수"""
+        return db.query(func.count(Item.id)).filter(
+            and_(
+                Item.category_id == category_id,
+                Item.is_active == True
+            )
+        ).scalar()
+    
     @staticmethod
     def get_category_statistics(db: Session) -> dict:
         """
         카테고리 통계 조회
         
+        통계 카운터(statistic_counters)에서 읽으므로 데이터 양과 무관하게 일정한 시간에 조회됩니다.
+        
         Args:
             db: 데이터베이스 세션
             
         Returns:
             dict: 카테고리 통계 정보
         """
-        # 전체 카테고리 개수
-        total_categories = db.query(func.count(Category.id)).scalar()
-        
-        # 활성 카테고리 개수
-        active_categories = db.query(func.count(Category.id)).filter(
-            Category.is_active == True
-        ).scalar()
-        
-        # 카테고리별 품목 개수
-        category_items = db.query(
-            Category.name,
-            func.count(Item.id).label('item_count')
-        ).outerjoin(
-            Item, and_(Item.category_id == Category.id, Item.is_active == True)
-        ).filter(
-            Category.is_active == True
-        ).group_by(Category.id, Category.name).all()
-        
-        return {
-            "total_categories": total_categories,
-            "active_categories": active_categories,
-            "category_item_counts": [
-                {"category": name, "item_count": count} 
-                for name, count in category_items
-            ]
-        }
\ No newline at end of file
+        return StatisticsService.get_category_statistics(db)
@@ -0,0 +1,230 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import and_, bindparam, case, event, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import TSQUERY
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.models.item import Item
+from app.utils.text_search import build_search_tokens, query_tokens
+
+# 후보가 이보다 많으면 IN 목록 대신 ILIKE 스캔만 사용 (흔한 글자 검색)
+_MAX_INLINE_CANDIDATES = 5000
+
+_SEARCH_CHANGES_KEY = "item_search_changes"
+
+
+class InMemorySearchIndex:
+    """
+    SQLite용 프로세스 내 역색인 (토큰 → 품목 ID 집합)
+
+    첫 검색 때 DB에서 구성하고, 이 프로세스의 품목 쓰기는 트랜잭션이 커밋된 뒤 반영합니다
+    (롤백된 변경은 반영하지 않음).
+    다른 프로세스의 변경은 SEARCH_INDEX_REFRESH_SECONDS마다 재구성하며 반영합니다.
+    """
+
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._postings: Dict[str, Set[int]] = {}
+        self._item_tokens: Dict[int, List[str]] = {}
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.build_count = 0
+        self.last_build_ms = 0.0
+        self.lookups = 0
+
+    def candidates(self, db: Session, tokens: List[str]) -> Set[int]:
+        """모든 토큰을 가진 품목 ID 집합"""
+        self._ensure_built(db)
+        with self._lock:
+            self.lookups += 1
+            postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+            if not postings:
+                return set()
+            result = set(postings[0])
+            for posting in postings[1:]:
+                result &= posting
+                if not result:
+                    break
+            return result
+
+    def update_item(self, item_id: int, search_tokens: Optional[str]) -> None:
+        """품목 토큰 갱신 (색인이 구성된 경우에만)"""
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove_locked(item_id)
+            tokens = search_tokens.split() if search_tokens else []
+            self._item_tokens[item_id] = tokens
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(item_id)
+
+    def remove_item(self, item_id: int) -> None:
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def rebuild(self, db: Session) -> None:
+        """DB의 전체 품목으로 색인 재구성"""
+        started = time.perf_counter()
+        postings: Dict[str, Set[int]] = {}
+        item_tokens: Dict[int, List[str]] = {}
+        rows = db.query(
+            Item.id, Item.search_tokens, Item.name, Item.description, Item.serial_number
+        ).yield_per(1000)
+        for item_id, search_tokens, name, description, serial_number in rows:
+            if search_tokens is None:
+                search_tokens = build_search_tokens(name, description, serial_number)
+            tokens = search_tokens.split()
+            item_tokens[item_id] = tokens
+            for token in tokens:
+                postings.setdefault(token, set()).add(item_id)
+
+        with self._lock:
+            self._postings = postings
+            self._item_tokens = item_tokens
+            self._built_at = time.monotonic()
+            self.build_count += 1
+            self.last_build_ms = (time.perf_counter() - started) * 1000
+
+    def _ensure_built(self, db: Session) -> None:
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > self.refresh_seconds:
+            self.rebuild(db)
+
+    def _remove_locked(self, item_id: int) -> None:
+        for token in self._item_tokens.pop(item_id, []):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[token]
+
+    def stats(self) -> Dict[str, Any]:
+        """색인 상태"""
+        with self._lock:
+            return {
+                "items": len(self._item_tokens),
+                "tokens": len(self._postings),
+                "builds": self.build_count,
+                "last_build_ms": round(self.last_build_ms, 3),
+                "lookups": self.lookups,
+            }
+
+
+search_index = InMemorySearchIndex(refresh_seconds=settings.SEARCH_INDEX_REFRESH_SECONDS)
+
+metrics_registry.register("item_search", search_index.stats)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_search_index_changes(session, flush_context):
+    """flush된 품목의 검색 토큰 변경을 트랜잭션 단위로 모음 (커밋된 뒤 색인에 반영)"""
+    if session.get_bind().dialect.name != "sqlite":
+        return
+    changes = {obj.id: obj.search_tokens for obj in session.new | session.dirty if isinstance(obj, Item)}
+    changes.update((obj.id, None) for obj in session.deleted if isinstance(obj, Item))
+    if changes:
+        session.info.setdefault(_SEARCH_CHANGES_KEY, {}).update(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_search_index_changes(session):
+    """커밋된 품목 변경을 프로세스 내 색인에 반영 (None은 삭제)"""
+    for item_id, search_tokens in session.info.pop(_SEARCH_CHANGES_KEY, {}).items():
+        if search_tokens is None:
+            search_index.remove_item(item_id)
+        else:
+            search_index.update_item(item_id, search_tokens)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_search_index_changes(session):
+    """롤백된 트랜잭션의 품목 변경은 색인에 반영하지 않음"""
+    session.info.pop(_SEARCH_CHANGES_KEY, None)
+
+
+def _search_vector():
+    """ix_items_search_tokens 색인과 같은 식 (PostgreSQL)"""
+    return func.array_to_tsvector(func.string_to_array(Item.search_tokens, " "))
+
+
+def _search_query(tokens: List[str]):
+    """모든 토큰을 포함하는 tsquery (토큰은 \\w 문자만 있으므로 그대로 인용)"""
+    return literal(" & ".join(f"'{token}'" for token in tokens)).cast(TSQUERY)
+
+
+def search_condition(db: Session, term: str):
+    """
+    검색어 조건
+
+    색인(PostgreSQL GIN / SQLite 프로세스 내 역색인)으로 후보를 좁힌 뒤
+    기존과 같은 ILIKE 조건으로 재확인하므로 검색 결과는 ILIKE 단독과 같습니다.
+    """
+    search_term = f"%{term}%"
+    like_condition = or_(
+        Item.name.ilike(search_term),
+        Item.description.ilike(search_term),
+        Item.serial_number.ilike(search_term)
+    )
+
+    tokens = query_tokens(term)
+    if not tokens:
+        return like_condition
+
+    if db.get_bind().dialect.name == "postgresql":
+        return and_(_search_vector().op("@@")(_search_query(tokens)), like_condition)
+
+    candidate_ids = search_index.candidates(db, tokens)
+    if len(candidate_ids) > _MAX_INLINE_CANDIDATES:
+        return like_condition
+    return and_(
+        Item.id.in_(bindparam("search_candidate_ids", sorted(candidate_ids), expanding=True, literal_execute=True)),
+        like_condition
+    )
+
+
+def search_rank(db: Session, term: str) -> list:
+    """
+    검색 결과 정렬 기준 (관련도 높은 순)
+
+    이름 접두 일치 > 이름 포함 > 일련번호 포함 > 설명만 포함 순이며,
+    PostgreSQL에서는 같은 등급 안에서 ts_rank로 한 번 더 정렬합니다.
+    """
+    order_by = [
+        case(
+            (Item.name.ilike(f"{term}%"), 3),
+            (Item.name.ilike(f"%{term}%"), 2),
+            (Item.serial_number.ilike(f"%{term}%"), 1),
+            else_=0
+        ).desc()
+    ]
+    tokens = query_tokens(term)
+    if tokens and db.get_bind().dialect.name == "postgresql":
+        order_by.append(func.ts_rank(_search_vector(), _search_query(tokens)).desc())
+    return order_by
+
+
+def backfill_search_tokens(db: Session, batch_size: int = 1000) -> int:
+    """검색 토큰이 없는 기존 품목의 토큰 생성 (search_tokens 컬럼 추가 이전 데이터)"""
+    updated = 0
+    while True:
+        rows = db.query(Item.id, Item.name, Item.description, Item.serial_number).filter(
+            Item.search_tokens.is_(None)
+        ).limit(batch_size).all()
+        if not rows:
+            return updated
+
+        # 테이블 단위 UPDATE - 파생 컬럼만 채우므로 품목 버전(version_id)은 올리지 않음
+        items = Item.__table__
+        db.execute(
+            update(items).where(items.c.id == bindparam("item_id")).values(search_tokens=bindparam("tokens")),
+            [
+                {"item_id": item_id, "tokens": build_search_tokens(name, description, serial_number)}
+                for item_id, name, description, serial_number in rows
+            ]
+        )
+        db.commit()
+        updated += len(rows)
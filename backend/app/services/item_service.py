@@ -1,13 +1,44 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, bindparam, case, func, or_, select, true, update
 
-from app.models.item import Item
+from app.models.item import Item, ItemStatus
 from app.models.category import Category
-from app.models.rental import Rental
-from app.models.reservation import Reservation
-from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse, ItemList, ItemFilter, ItemStatus
-from app.models.audit_log import AuditLog
+from app.models.rental import Rental, RentalStatus
+from app.models.reservation import Reservation, ReservationStatus
+from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse, ItemList, ItemFilter
+from app.core.audit_writer import audit_log_writer
+from app.core.response_cache import response_cache, ITEMS, ITEM_CATALOG, item_version
+from app.services.statistics_service import StatisticsService
+from app.services.item_search import search_condition, search_rank
+from app.services.reservation_service import ReservationService
+from app.db.unit_of_work import unit_of_work
+from app.utils.pagination import keyset_condition, keyset_order_by, split_page
+
+# 목록 응답의 상태별 통계 필드
+_STATUS_COUNT_LABELS = (
+    ("available_count", ItemStatus.AVAILABLE),
+    ("rented_count", ItemStatus.RENTED),
+    ("reserved_count", ItemStatus.RESERVED),
+    ("maintenance_count", ItemStatus.MAINTENANCE),
+)
+
+
+# 목록 응답 컬럼 - ORM 객체 대신 튜플로 조회 (라벨은 ItemResponse 필드 이름)
+_LISTING_COLUMNS = (
+    Item.id, Item.name, Item.description, Item.serial_number, Item.category_id, Item.item_metadata,
+    Item.status, Item.is_active, Item.created_at, Item.updated_at,
+    Item.current_rental_id, Item.current_reservation_id,
+    Category.name.label("category_name"),
+)
+
+_ITEM_RESPONSES = TypeAdapter(List[ItemResponse])
+
+
+def _count_if(condition):
+    """조건에 맞는 행 수 (SUM(CASE ...)) - 집계/윈도우 양쪽에서 사용"""
+    return func.sum(case((condition, 1), else_=0))
 
 
 class ItemService:
@@ -18,77 +49,179 @@ class ItemService:
         db: Session, 
         skip: int = 0, 
         limit: int = 100,
-        filters: Optional[ItemFilter] = None
+        filters: Optional[ItemFilter] = None,
+        cursor: Optional[str] = None
     ) -> ItemList:
         """
         품목 목록 조회
         
+        페이지, 필터 적용 총 개수, 상태별 통계를 윈도우 함수로 한 번의 쿼리에서 조회합니다.
+        윈도우 함수를 지원하지 않는 SQLite(3.25 미만)에서는 집계 쿼리와 페이지 쿼리로 나누어 조회합니다.
+        
         Args:
             db: 데이터베이스 세션
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회할 개수
             filters: 필터 조건
+            cursor: 이전 응답의 next_cursor (등록 순 keyset 페이지네이션)
             
         Returns:
             ItemList: 품목 목록과 통계
         """
-        query = db.query(Item).options(
-            joinedload(Item.category),
-            joinedload(Item.current_rental),
-            joinedload(Item.current_reservation)
-        )
-        
-        # 필터 적용
-        if filters:
-            if filters.category_id:
-                query = query.filter(Item.category_id == filters.category_id)
+        # 만료 시각이 지난 예약의 품목이 예약됨으로 남지 않도록 먼저 반영
+        ReservationService.release_expired_reservations(db)
+        
+        scope_conditions, match_conditions = ItemService._build_item_filters(db, filters)
+        matched = and_(*match_conditions) if match_conditions else true()
+        
+        # 커서 조건은 페이지 행에만 적용 (총 개수/통계는 필터 기준 전체)
+        page_conditions = []
+        if cursor:
+            page_conditions.append(keyset_condition(Item.created_at, Item.id, cursor, descending=False))
+            skip = 0
+        
+        if ItemService._supports_window_functions(db):
+            # 카테고리 범위 내 전체 행에 대해 통계를 계산한 뒤 필터에 맞는 행만 페이지로 반환
+            listing = select(
+                Item.id.label("item_id"),
+                case((matched, 1), else_=0).label("is_match"),
+                _count_if(matched).over().label("total"),
+                *[
+                    _count_if(Item.status == status).over().label(label)
+                    for label, status in _STATUS_COUNT_LABELS
+                ]
+            ).where(*scope_conditions).subquery("item_listing")
             
-            if filters.status:
-                query = query.filter(Item.status == filters.status)
+            rows = ItemService._listing_page_query(
+                db, listing.c.total, *[listing.c[label] for label, _ in _STATUS_COUNT_LABELS]
+            ).join(
+                listing, listing.c.item_id == Item.id
+            ).filter(
+                listing.c.is_match == 1, *page_conditions
+            ).offset(skip).limit(limit + 1).all()
             
-            if filters.is_active is not None:
-                query = query.filter(Item.is_active == filters.is_active)
+            if rows:
+                counts = rows[0][len(_LISTING_COLUMNS):]
+            else:
+                # 빈 페이지에는 통계 컬럼이 실리지 않으므로 집계 쿼리로 보완
+                counts = ItemService._listing_counts(db, scope_conditions, matched)
+        else:
+            counts = ItemService._listing_counts(db, scope_conditions, matched)
+            rows = ItemService._listing_page_query(db).filter(
+                *scope_conditions, matched, *page_conditions
+            ).offset(skip).limit(limit + 1).all()
+        
+        rows, next_cursor = split_page(rows, limit)
+        
+        # 품목 응답 데이터 생성 (행 dict를 ItemList 생성 시 한 번에 검증)
+        item_responses = [row._asdict() for row in rows]
+        
+        total, available_count, rented_count, reserved_count, maintenance_count = (
+            int(count or 0) for count in counts
+        )
+        
+        return ItemList(
+            items=item_responses,
+            total=total,
+            available_count=available_count,
+            rented_count=rented_count,
+            reserved_count=reserved_count,
+            maintenance_count=maintenance_count,
+            next_cursor=next_cursor
+        )
+    
+    @staticmethod
+    def search_items(
+        db: Session,
+        query: str,
+        limit: int = 20,
+        category_id: Optional[int] = None,
+        active_only: bool = True
+    ) -> List[ItemResponse]:
+        """
+        품목 검색 (관련도 순)
+        
+        검색창 자동완성처럼 입력마다 호출되는 용도로, 검색 색인으로 후보를 좁힌 뒤 관련도 순으로 반환합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            query: 검색어
+            limit: 조회할 개수
+            category_id: 카테고리 ID (선택사항)
+            active_only: 활성 품목만 조회
             
-            if filters.search:
-                search_term = f"%{filters.search}%"
-                query = query.filter(
-                    or_(
-                        Item.name.ilike(search_term),
-                        Item.description.ilike(search_term),
-                        Item.serial_number.ilike(search_term)
-                    )
-                )
+        Returns:
+            List[ItemResponse]: 관련도 순 품목 목록
+        """
+        conditions = [search_condition(db, query)]
+        if category_id:
+            conditions.append(Item.category_id == category_id)
+        if active_only:
+            conditions.append(Item.is_active == True)
         
-        # 총 개수 조회 (필터 적용된 상태)
-        total = query.count()
+        rows = ItemService._listing_page_query(db).filter(*conditions).order_by(None).order_by(
+            *search_rank(db, query), Item.id
+        ).limit(limit).all()
         
-        # 페이지네이션 적용하여 품목 조회
-        items = query.offset(skip).limit(limit).all()
+        return _ITEM_RESPONSES.validate_python([row._asdict() for row in rows])
+    
+    @staticmethod
+    def _build_item_filters(db: Session, filters: Optional[ItemFilter]) -> Tuple[list, list]:
+        """
+        목록 필터 조건 생성
         
-        # 품목 응답 데이터 생성
-        item_responses = []
-        for item in items:
-            item_data = ItemResponse.model_validate(item)
-            item_data.category_name = item.category.name if item.category else None
-            item_data.current_rental_id = item.current_rental.id if item.current_rental else None
-            item_data.current_reservation_id = item.current_reservation.id if item.current_reservation else None
-            item_responses.append(item_data)
+        Returns:
+            Tuple[list, list]: (통계 범위 조건, 목록 필터 조건)
+                상태별 통계는 카테고리 범위 안의 전체 품목 기준으로 계산합니다.
+        """
+        scope_conditions = []
+        match_conditions = []
+        if not filters:
+            return scope_conditions, match_conditions
         
-        # 상태별 통계 조회 (전체 품목 기준)
-        stats_query = db.query(Item.status, func.count(Item.id)).group_by(Item.status)
-        if filters and filters.category_id:
-            stats_query = stats_query.filter(Item.category_id == filters.category_id)
+        if filters.category_id:
+            scope_conditions.append(Item.category_id == filters.category_id)
         
-        status_stats = dict(stats_query.all())
+        if filters.status:
+            match_conditions.append(Item.status == filters.status)
         
-        return ItemList(
-            items=item_responses,
-            total=total,
-            available_count=status_stats.get(ItemStatus.AVAILABLE, 0),
-            rented_count=status_stats.get(ItemStatus.RENTED, 0),
-            reserved_count=status_stats.get(ItemStatus.RESERVED, 0),
-            maintenance_count=status_stats.get(ItemStatus.MAINTENANCE, 0)
-        )
+        if filters.is_active is not None:
+            match_conditions.append(Item.is_active == filters.is_active)
+        
+        if filters.search:
+            match_conditions.append(search_condition(db, filters.search))
+        
+        return scope_conditions, match_conditions
+    
+    @staticmethod
+    def _listing_page_query(db: Session, *extra_columns):
+        """
+        품목 응답 컬럼 + 카테고리명을 튜플로 조회하는 목록 쿼리 (extra_columns는 응답 컬럼 뒤에 붙음)
+        
+        현재 대여/예약 ID는 품목 컬럼(비정규화 포인터)이므로 대여/예약 테이블은 읽지 않습니다.
+        """
+        return db.query(
+            *_LISTING_COLUMNS,
+            *extra_columns
+        ).outerjoin(
+            Category, Category.id == Item.category_id
+        ).order_by(*keyset_order_by(Item.created_at, Item.id, descending=False))
+    
+    @staticmethod
+    def _listing_counts(db: Session, scope_conditions: list, matched) -> tuple:
+        """필터 적용 총 개수와 상태별 개수를 집계 쿼리 한 번으로 조회"""
+        return db.query(
+            _count_if(matched),
+            *[_count_if(Item.status == status) for _, status in _STATUS_COUNT_LABELS]
+        ).filter(*scope_conditions).one()
+    
+    @staticmethod
+    def _supports_window_functions(db: Session) -> bool:
+        """윈도우 함수 지원 여부 (SQLite는 3.25부터 지원)"""
+        dialect = db.get_bind().dialect
+        if dialect.name != "sqlite":
+            return True
+        return (dialect.server_version_info or (0,)) >= (3, 25)
     
     @staticmethod
     def get_item(db: Session, item_id: int) -> Optional[ItemResponse]:
@@ -103,9 +236,7 @@ class ItemService:
             ItemResponse: 품목 정보
         """
         item = db.query(Item).options(
-            joinedload(Item.category),
-            joinedload(Item.current_rental),
-            joinedload(Item.current_reservation)
+            joinedload(Item.category)
         ).filter(Item.id == item_id).first()
         
         if not item:
@@ -113,8 +244,6 @@ class ItemService:
         
         item_data = ItemResponse.model_validate(item)
         item_data.category_name = item.category.name if item.category else None
-        item_data.current_rental_id = item.current_rental.id if item.current_rental else None
-        item_data.current_reservation_id = item.current_reservation.id if item.current_reservation else None
         
         return item_data
     
@@ -131,9 +260,7 @@ class ItemService:
             ItemResponse: 품목 정보
         """
         item = db.query(Item).options(
-            joinedload(Item.category),
-            joinedload(Item.current_rental),
-            joinedload(Item.current_reservation)
+            joinedload(Item.category)
         ).filter(Item.serial_number == serial_number).first()
         
         if not item:
@@ -141,8 +268,6 @@ class ItemService:
         
         item_data = ItemResponse.model_validate(item)
         item_data.category_name = item.category.name if item.category else None
-        item_data.current_rental_id = item.current_rental.id if item.current_rental else None
-        item_data.current_reservation_id = item.current_reservation.id if item.current_reservation else None
         
         return item_data
     
@@ -165,56 +290,55 @@ class ItemService:
         Returns:
             ItemResponse: 생성된 품목 정보
         """
-        # 카테고리 존재 확인
-        category = db.query(Category).filter(
-            and_(
-                Category.id == item_data.category_id,
-                Category.is_active == True
+        with unit_of_work(db):
+            # 카테고리 존재 확인
+            category = db.query(Category).filter(
+                and_(
+                    Category.id == item_data.category_id,
+                    Category.is_active == True
+                )
+            ).first()
+            
+            if not category:
+                raise ValueError(f"존재하지 않거나 비활성화된 카테고리입니다: {item_data.category_id}")
+            
+            # 일련번호 중복 확인
+            existing_item = db.query(Item.id).filter(
+                Item.serial_number == item_data.serial_number
+            ).first()
+            
+            if existing_item:
+                raise ValueError(f"이미 존재하는 일련번호입니다: {item_data.serial_number}")
+            
+            # 새 품목 생성
+            item = Item(
+                name=item_data.name,
+                description=item_data.description,
+                serial_number=item_data.serial_number,
+                category=category,
+                item_metadata=item_data.item_metadata,
+                status=ItemStatus.AVAILABLE
             )
-        ).first()
-        
-        if not category:
-            raise ValueError(f"존재하지 않거나 비활성화된 카테고리입니다: {item_data.category_id}")
-        
-        # 일련번호 중복 확인
-        existing_item = db.query(Item).filter(
-            Item.serial_number == item_data.serial_number
-        ).first()
-        
-        if existing_item:
-            raise ValueError(f"이미 존재하는 일련번호입니다: {item_data.serial_number}")
-        
-        # 새 품목 생성
-        item = Item(
-            name=item_data.name,
-            description=item_data.description,
-            serial_number=item_data.serial_number,
-            category_id=item_data.category_id,
-            item_metadata=item_data.item_metadata,
-            status=ItemStatus.AVAILABLE
-        )
-        
-        db.add(item)
-        db.commit()
-        db.refresh(item)
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="ITEM_CREATED",
-            table_name="items",
-            user_id=user_id,
-            record_id=item.id,
-            description=f"품목 생성: {item.name} ({item.serial_number})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+            
+            # 품목 ID는 감사 로그에 필요하므로 flush
+            db.add(item)
+            db.flush()
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="ITEM_CREATED",
+                table_name="items",
+                user_id=user_id,
+                record_id=item.id,
+                description=f"품목 생성: {item.name} ({item.serial_number})",
+                ip_address=ip_address
+            )
+            response_cache.invalidate_after_commit(db, ITEMS, ITEM_CATALOG, item_version(item.id))
         
         # 응답 데이터 생성
         item_data = ItemResponse.model_validate(item)
         item_data.category_name = category.name
-        item_data.current_rental_id = None
-        item_data.current_reservation_id = None
         
         return item_data
     
@@ -239,67 +363,72 @@ class ItemService:
         Returns:
             ItemResponse: 수정된 품목 정보
         """
-        item = db.query(Item).options(
-            joinedload(Item.category)
-        ).filter(Item.id == item_id).first()
-        
-        if not item:
-            return None
-        
-        # 기존 데이터 백업 (감사 로그용)
-        old_data = {
-            "name": item.name,
-            "description": item.description,
-            "status": item.status.value,
-            "category_id": item.category_id,
-            "item_metadata": item.item_metadata,
-            "is_active": item.is_active
-        }
-        
-        # 카테고리 변경 시 존재 확인
-        if item_data.category_id and item_data.category_id != item.category_id:
-            category = db.query(Category).filter(
-                and_(
-                    Category.id == item_data.category_id,
-                    Category.is_active == True
-                )
-            ).first()
+        with unit_of_work(db):
+            item = db.query(Item).options(
+                joinedload(Item.category)
+            ).filter(Item.id == item_id).first()
             
-            if not category:
-                raise ValueError(f"존재하지 않거나 비활성화된 카테고리입니다: {item_data.category_id}")
-        
-        # 상태 변경 유효성 검증
-        if item_data.status and item_data.status != item.status:
-            if not ItemService._validate_status_change(db, item, item_data.status):
-                raise ValueError(f"현재 상태에서 {item_data.status.value}로 변경할 수 없습니다")
-        
-        # 데이터 업데이트
-        update_data = item_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(item, field, value)
-        
-        db.commit()
-        db.refresh(item)
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="ITEM_UPDATED",
-            table_name="items",
-            user_id=user_id,
-            record_id=item.id,
-            description=f"품목 수정: {item.name} ({item.serial_number})",
-            old_data=old_data,
-            new_data=update_data,
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+            if not item:
+                return None
+            
+            # 기존 데이터 백업 (감사 로그용)
+            old_data = {
+                "name": item.name,
+                "description": item.description,
+                "status": item.status.value,
+                "category_id": item.category_id,
+                "item_metadata": item.item_metadata,
+                "is_active": item.is_active
+            }
+            
+            # 카테고리 변경 시 존재 확인
+            if item_data.category_id and item_data.category_id != item.category_id:
+                category = db.query(Category).filter(
+                    and_(
+                        Category.id == item_data.category_id,
+                        Category.is_active == True
+                    )
+                ).first()
+                
+                if not category:
+                    raise ValueError(f"존재하지 않거나 비활성화된 카테고리입니다: {item_data.category_id}")
+                
+                # 응답의 카테고리명도 새 카테고리로 (category_id만 바꾸면 관계는 커밋 전까지 이전 값)
+                item.category = category
+            
+            # 데이터 업데이트 (상태는 요청 스키마 Enum → 모델 Enum)
+            update_data = item_data.model_dump(exclude_unset=True)
+            if update_data.get("status") is not None:
+                update_data["status"] = ItemStatus(update_data["status"].value)
+            
+            # 상태 변경 유효성 검증
+            new_status = update_data.get("status")
+            if new_status and new_status != item.status:
+                if not ItemService._validate_status_change(db, item, new_status):
+                    raise ValueError(f"현재 상태에서 {new_status.value}로 변경할 수 없습니다")
+            
+            for field, value in update_data.items():
+                setattr(item, field, value)
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="ITEM_UPDATED",
+                table_name="items",
+                user_id=user_id,
+                record_id=item.id,
+                changes={
+                    field: {"before": old_data.get(field), "after": value}
+                    for field, value in item_data.model_dump(exclude_unset=True, mode="json").items()
+                },
+                description=f"품목 수정: {item.name} ({item.serial_number})",
+                ip_address=ip_address
+            )
+            response_cache.invalidate_after_commit(db, ITEMS, ITEM_CATALOG, item_version(item.id))
         
         # 응답 데이터 생성
         item_response = ItemResponse.model_validate(item)
         item_response.category_name = item.category.name if item.category else None
-        item_response.current_rental_id = item.current_rental.id if item.current_rental else None
-        item_response.current_reservation_id = item.current_reservation.id if item.current_reservation else None
         
         return item_response
     
@@ -322,30 +451,30 @@ class ItemService:
         Returns:
             bool: 삭제 성공 여부
         """
-        item = db.query(Item).filter(Item.id == item_id).first()
-        if not item:
-            return False
-        
-        # 대여중이거나 예약된 품목은 삭제 불가
-        if item.status in [ItemStatus.RENTED, ItemStatus.RESERVED]:
-            raise ValueError(f"대여중이거나 예약된 품목은 삭제할 수 없습니다 (현재 상태: {item.status.value})")
-        
-        # 소프트 삭제 실행
-        item.is_active = False
-        item.status = ItemStatus.MAINTENANCE  # 정비중으로 상태 변경
-        db.commit()
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="ITEM_DELETED",
-            table_name="items",
-            user_id=user_id,
-            record_id=item.id,
-            description=f"품목 삭제: {item.name} ({item.serial_number})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+        with unit_of_work(db):
+            item = db.query(Item).filter(Item.id == item_id).first()
+            if not item:
+                return False
+            
+            # 대여중이거나 예약된 품목은 삭제 불가
+            if item.status in [ItemStatus.RENTED, ItemStatus.RESERVED]:
+                raise ValueError(f"대여중이거나 예약된 품목은 삭제할 수 없습니다 (현재 상태: {item.status.value})")
+            
+            # 소프트 삭제 실행
+            item.is_active = False
+            item.status = ItemStatus.MAINTENANCE  # 정비중으로 상태 변경
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="ITEM_DELETED",
+                table_name="items",
+                user_id=user_id,
+                record_id=item.id,
+                description=f"품목 삭제: {item.name} ({item.serial_number})",
+                ip_address=ip_address
+            )
+            response_cache.invalidate_after_commit(db, ITEMS, ITEM_CATALOG, item_version(item.id))
         
         return True
     
@@ -368,9 +497,10 @@ class ItemService:
         Returns:
             List[ItemResponse]: 대여 가능한 품목 목록
         """
-        query = db.query(Item).options(
-            joinedload(Item.category)
-        ).filter(
+        # 만료 시각이 지난 예약의 품목도 바로 대여 가능으로 조회
+        ReservationService.release_expired_reservations(db)
+        
+        query = ItemService._listing_page_query(db).filter(
             and_(
                 Item.status == ItemStatus.AVAILABLE,
                 Item.is_active == True
@@ -380,15 +510,9 @@ class ItemService:
         if category_id:
             query = query.filter(Item.category_id == category_id)
         
-        items = query.offset(skip).limit(limit).all()
+        rows = query.offset(skip).limit(limit).all()
         
-        item_responses = []
-        for item in items:
-            item_data = ItemResponse.model_validate(item)
-            item_data.category_name = item.category.name if item.category else None
-            item_responses.append(item_data)
-        
-        return item_responses
+        return _ITEM_RESPONSES.validate_python([row._asdict() for row in rows])
     
     @staticmethod
     def _validate_status_change(db: Session, item: Item, new_status: ItemStatus) -> bool:
@@ -420,34 +544,63 @@ class ItemService:
         """
         품목 통계 조회
         
+        통계 카운터(statistic_counters)에서 읽으므로 데이터 양과 무관하게 일정한 시간에 조회됩니다.
+        
         Args:
             db: 데이터베이스 세션
             
         Returns:
             dict: 품목 통계 정보
         """
-        # 전체 품목 개수
-        total_items = db.query(func.count(Item.id)).filter(Item.is_active == True).scalar()
-        
-        # 상태별 품목 개수
-        status_counts = db.query(
-            Item.status, 
-            func.count(Item.id)
-        ).filter(Item.is_active == True).group_by(Item.status).all()
-        
-        # 카테고리별 품목 개수
-        category_counts = db.query(
-            Category.name,
-            func.count(Item.id)
-        ).join(Item).filter(
-            and_(Item.is_active == True, Category.is_active == True)
-        ).group_by(Category.id, Category.name).all()
-        
-        return {
-            "total_items": total_items,
-            "status_counts": {status.value: count for status, count in status_counts},
-            "category_counts": [
-                {"category": name, "count": count} 
-                for name, count in category_counts
-            ]
-        }
\ No newline at end of file
+        return StatisticsService.get_item_statistics(db)
+
+
+def reconcile_current_pointers(db: Session) -> int:
+    """
+    품목의 현재 대여/예약 포인터를 대여/예약 테이블 기준으로 보정 (시작 시 실행)
+    
+    포인터 컬럼 추가 이전 데이터를 채우고, 상태 전이를 거치지 않고 바뀐 데이터를 바로잡습니다.
+    반납 전 대여와 PENDING 예약은 품목 수를 넘지 않으므로 상태 인덱스로 조회합니다.
+    
+    Returns:
+        int: 보정한 품목 수
+    """
+    expected = {}
+    for item_id, rental_id in db.query(Rental.item_id, func.max(Rental.id)).filter(
+        Rental.status.in_([RentalStatus.ACTIVE, RentalStatus.OVERDUE])
+    ).group_by(Rental.item_id):
+        expected[item_id] = (rental_id, None)
+    for item_id, reservation_id in db.query(Reservation.item_id, func.max(Reservation.id)).filter(
+        Reservation.status == ReservationStatus.PENDING
+    ).group_by(Reservation.item_id):
+        expected[item_id] = (expected.get(item_id, (None, None))[0], reservation_id)
+    
+    stored = {
+        item_id: (rental_id, reservation_id)
+        for item_id, rental_id, reservation_id in db.query(
+            Item.id, Item.current_rental_id, Item.current_reservation_id
+        ).filter(
+            or_(Item.current_rental_id.isnot(None), Item.current_reservation_id.isnot(None))
+        )
+    }
+    
+    fixes = [
+        {"item_id": item_id, "rental_id": pointers[0], "reservation_id": pointers[1]}
+        for item_id in expected.keys() | stored.keys()
+        if (pointers := expected.get(item_id, (None, None))) != stored.get(item_id, (None, None))
+    ]
+    if not fixes:
+        return 0
+    
+    # 테이블 단위 UPDATE - 파생 컬럼만 보정하므로 품목 버전(version_id)은 올리지 않음
+    items = Item.__table__
+    db.execute(
+        update(items).where(items.c.id == bindparam("item_id")).values(
+            current_rental_id=bindparam("rental_id"),
+            current_reservation_id=bindparam("reservation_id")
+        ),
+        fixes
+    )
+    db.commit()
+    response_cache.invalidate(ITEMS, *[item_version(fix["item_id"]) for fix in fixes])
+    return len(fixes)
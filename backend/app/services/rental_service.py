@@ -1,19 +1,41 @@
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, or_
-from datetime import datetime, timedelta
+from sqlalchemy import and_, func, insert, literal, or_, select, update
+from datetime import date, datetime, timedelta
+from pydantic import TypeAdapter
+import time
 
-from app.models.rental import Rental
+from app.models.rental import Rental, RentalStatus
 from app.models.item import Item, ItemStatus
 from app.models.user import User
 from app.models.category import Category
 from app.models.reservation import Reservation
 from app.schemas.rental import (
     RentalCreate, RentalUpdate, RentalResponse, RentalList, 
-    RentalFilter, RentalStatus, RentalReturn, RentalExtend, RentalHistory
+    RentalFilter, RentalReturn, RentalExtend, RentalHistory
 )
 from app.models.audit_log import AuditLog
+from app.core.audit_writer import audit_log_writer
+from app.core.response_cache import response_cache, ITEMS, item_version
+from app.services.statistics_service import StatisticsService
 from app.core.config import settings
+from app.core.job_stats import job_stats
+from app.db.unit_of_work import unit_of_work
+from app.utils.pagination import keyset_condition, keyset_order_by, split_page
+
+# 목록 응답 컬럼 - ORM 객체 대신 튜플로 조회 (라벨은 RentalResponse 필드 이름)
+_RENTAL_LIST_COLUMNS = (
+    Rental.id, Rental.user_id, Rental.item_id, Rental.reservation_id, Rental.status,
+    Rental.rental_date, Rental.due_date, Rental.return_date,
+    Rental.notes, Rental.admin_notes, Rental.created_at, Rental.updated_at,
+    User.name.label("user_name"),
+    User.student_id.label("user_student_id"),
+    Item.name.label("item_name"),
+    Item.serial_number.label("item_serial_number"),
+    Category.name.label("category_name"),
+)
+
+_RENTAL_RESPONSES = TypeAdapter(List[RentalResponse])
 
 
 class RentalService:
@@ -29,26 +51,25 @@ class RentalService:
         limit: int = 100,
         filters: Optional[RentalFilter] = None,
         current_user_id: Optional[int] = None,
-        is_admin: bool = False
+        is_admin: bool = False,
+        cursor: Optional[str] = None
     ) -> RentalList:
         """
         대여 목록 조회
         
         Args:
             db: 데이터베이스 세션
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회할 개수
             filters: 필터 조건
             current_user_id: 현재 사용자 ID (일반 사용자는 자신 것만)
             is_admin: 관리자 여부
+            cursor: 이전 응답의 next_cursor (최신 순 keyset 페이지네이션)
             
         Returns:
             RentalList: 대여 목록과 통계
         """
-        query = db.query(Rental).options(
-            joinedload(Rental.user),
-            joinedload(Rental.item).joinedload(Item.category)
-        )
+        query = db.query(Rental)
         
         # 일반 사용자는 자신의 대여만 조회 가능
         if not is_admin and current_user_id:
@@ -63,7 +84,10 @@ class RentalService:
                 query = query.filter(Rental.item_id == filters.item_id)
             
             if filters.category_id:
-                query = query.join(Item).filter(Item.category_id == filters.category_id)
+                # 목록 컬럼 조회 시 품목을 외부 조인하므로 조인 대신 하위 쿼리로 필터
+                query = query.filter(
+                    Rental.item_id.in_(select(Item.id).where(Item.category_id == filters.category_id))
+                )
             
             if filters.status:
                 query = query.filter(Rental.status == filters.status)
@@ -100,14 +124,21 @@ class RentalService:
         # 총 개수 조회
         total = query.count()
         
-        # 페이지네이션 적용하여 대여 조회 (최신 순)
-        rentals = query.order_by(Rental.created_at.desc()).offset(skip).limit(limit).all()
+        # 커서가 있으면 (created_at, id) 기준 keyset, 없으면 offset 페이지네이션 (최신 순)
+        if cursor:
+            query = query.filter(keyset_condition(Rental.created_at, Rental.id, cursor))
+            skip = 0
+        
+        rows, next_cursor = split_page(
+            RentalService._list_query(query).order_by(
+                *keyset_order_by(Rental.created_at, Rental.id)
+            ).offset(skip).limit(limit + 1).all(),
+            limit
+        )
         
-        # 대여 응답 데이터 생성
-        rental_responses = []
-        for rental in rentals:
-            rental_data = RentalService._build_rental_response(rental)
-            rental_responses.append(rental_data)
+        # 대여 응답 데이터 생성 (행 dict를 RentalList 생성 시 한 번에 검증)
+        today = date.today()
+        rental_responses = [RentalService._build_list_entry(row, today) for row in rows]
         
         # 상태별 통계 조회
         stats_base_query = db.query(Rental.status, func.count(Rental.id)).group_by(Rental.status)
@@ -122,7 +153,8 @@ class RentalService:
             active_count=status_stats.get(RentalStatus.ACTIVE, 0),
             returned_count=status_stats.get(RentalStatus.RETURNED, 0),
             overdue_count=status_stats.get(RentalStatus.OVERDUE, 0),
-            lost_count=status_stats.get(RentalStatus.LOST, 0)
+            lost_count=status_stats.get(RentalStatus.LOST, 0),
+            next_cursor=next_cursor
         )
     
     @staticmethod
@@ -183,59 +215,56 @@ class RentalService:
         Raises:
             ValueError: 대여 불가능한 경우
         """
-        # 품목 존재 및 대여 가능 여부 확인
-        item = db.query(Item).options(joinedload(Item.category)).filter(
-            and_(
-                Item.id == rental_data.item_id,
-                Item.is_active == True
+        with unit_of_work(db):
+            # 품목 존재 및 대여 가능 여부 확인 (예약 확인에서 호출되면 이미 로드된 객체 사용)
+            item = db.get(Item, rental_data.item_id)
+            
+            if not item or not item.is_active:
+                raise ValueError("존재하지 않거나 비활성화된 품목입니다")
+            
+            # 확인 중인 예약이 잡고 있는 품목만 대여 가능
+            if item.status != ItemStatus.RESERVED or item.current_reservation_id != rental_data.reservation_id:
+                raise ValueError(f"예약된 품목만 대여할 수 있습니다 (상태: {item.status.value})")
+            
+            # 사용자 존재 확인
+            user = db.get(User, user_id)
+            if not user:
+                raise ValueError("존재하지 않는 사용자입니다")
+            
+            # 반납 예정일 계산 (7일 후)
+            due_date = date.today() + timedelta(days=RentalService.RENTAL_DURATION_DAYS)
+            
+            # 새 대여 생성 (응답에 쓸 사용자/품목을 관계로 연결)
+            rental = Rental(
+                user=user,
+                item=item,
+                reservation_id=rental_data.reservation_id,
+                notes=rental_data.notes,
+                status=RentalStatus.ACTIVE,
+                due_date=due_date
             )
-        ).first()
-        
-        if not item:
-            raise ValueError("존재하지 않거나 비활성화된 품목입니다")
-        
-        if item.status != ItemStatus.RENTED:
-            raise ValueError(f"현재 대여 상태가 아닌 품목입니다 (상태: {item.status.value})")
-        
-        # 사용자 존재 확인
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise ValueError("존재하지 않는 사용자입니다")
-        
-        # 반납 예정일 계산 (7일 후)
-        due_date = datetime.utcnow() + timedelta(days=RentalService.RENTAL_DURATION_DAYS)
-        
-        # 새 대여 생성
-        rental = Rental(
-            user_id=user_id,
-            item_id=rental_data.item_id,
-            reservation_id=rental_data.reservation_id,
-            notes=rental_data.notes,
-            status=RentalStatus.ACTIVE,
-            due_date=due_date
-        )
-        
-        db.add(rental)
-        db.commit()
-        db.refresh(rental)
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RENTAL_CREATED",
-            table_name="rentals",
-            user_id=admin_user_id,
-            record_id=rental.id,
-            description=f"대여 생성: {item.name} ({item.serial_number}) - 사용자: {user.student_id}",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
-        
-        # 응답 데이터 생성
-        rental = db.query(Rental).options(
-            joinedload(Rental.user),
-            joinedload(Rental.item).joinedload(Item.category)
-        ).filter(Rental.id == rental.id).first()
+            
+            # 대여 ID는 품목의 현재 대여 포인터와 감사 로그에 필요하므로 먼저 INSERT
+            db.add(rental)
+            db.flush()
+            
+            # 품목을 대여중으로 변경하고 현재 예약 → 현재 대여로 포인터 이동 (커밋 시 품목 UPDATE 한 번)
+            item.status = ItemStatus.RENTED
+            item.current_rental_id = rental.id
+            item.current_reservation_id = None
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="RENTAL_CREATED",
+                table_name="rentals",
+                user_id=admin_user_id,
+                record_id=rental.id,
+                description=f"대여 생성: {item.name} ({item.serial_number}) - 사용자: {user.student_id}",
+                ip_address=ip_address
+            )
+            # 품목 상세의 현재 대여 ID 변경
+            response_cache.invalidate_after_commit(db, item_version(item.id))
         
         return RentalService._build_rental_response(rental)
     
@@ -260,41 +289,42 @@ class RentalService:
         Returns:
             RentalResponse: 반납된 대여 정보
         """
-        rental = db.query(Rental).options(
-            joinedload(Rental.user),
-            joinedload(Rental.item)
-        ).filter(Rental.id == rental_id).first()
-        
-        if not rental:
-            return None
-        
-        if rental.status not in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
-            raise ValueError(f"반납 처리할 수 없는 대여 상태입니다 (현재: {rental.status.value})")
-        
-        # 대여 반납 처리
-        rental.status = RentalStatus.RETURNED
-        rental.returned_at = datetime.utcnow()
-        rental.admin_notes = return_data.admin_notes
-        
-        # 품목 상태메모 업데이트 및 사용 가능으로 변경
-        if return_data.condition_notes:
-            rental.notes = f"{rental.notes or ''}\n[반납 상태: {return_data.condition_notes}]".strip()
-        
-        rental.item.status = ItemStatus.AVAILABLE
-        
-        db.commit()
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RENTAL_RETURNED",
-            table_name="rentals",
-            user_id=admin_user_id,
-            record_id=rental.id,
-            description=f"대여 반납: {rental.item.name} (사용자: {rental.user.student_id})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+        with unit_of_work(db):
+            rental = db.query(Rental).options(
+                joinedload(Rental.user),
+                joinedload(Rental.item).joinedload(Item.category)
+            ).filter(Rental.id == rental_id).first()
+            
+            if not rental:
+                return None
+            
+            if rental.status not in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
+                raise ValueError(f"반납 처리할 수 없는 대여 상태입니다 (현재: {rental.status.value})")
+            
+            # 대여 반납 처리
+            rental.status = RentalStatus.RETURNED
+            rental.return_date = date.today()
+            rental.admin_notes = return_data.admin_notes
+            
+            # 품목 상태메모 업데이트 및 사용 가능으로 변경
+            if return_data.condition_notes:
+                rental.notes = f"{rental.notes or ''}\n[반납 상태: {return_data.condition_notes}]".strip()
+            
+            rental.item.status = ItemStatus.AVAILABLE
+            if rental.item.current_rental_id == rental.id:
+                rental.item.current_rental_id = None
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="RENTAL_RETURNED",
+                table_name="rentals",
+                user_id=admin_user_id,
+                record_id=rental.id,
+                description=f"대여 반납: {rental.item.name} (사용자: {rental.user.student_id})",
+                ip_address=ip_address
+            )
+            response_cache.invalidate_after_commit(db, ITEMS, item_version(rental.item_id))
         
         return RentalService._build_rental_response(rental)
     
@@ -319,92 +349,138 @@ class RentalService:
         Returns:
             RentalResponse: 연장된 대여 정보
         """
-        rental = db.query(Rental).options(
-            joinedload(Rental.user),
-            joinedload(Rental.item)
-        ).filter(Rental.id == rental_id).first()
-        
-        if not rental:
-            return None
-        
-        if rental.status not in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
-            raise ValueError(f"연장 처리할 수 없는 대여 상태입니다 (현재: {rental.status.value})")
-        
-        # 기존 반납 예정일에서 연장
-        new_due_date = rental.due_date + timedelta(days=extend_data.extend_days)
-        
-        # 연장 기록 저장
-        old_due_date = rental.due_date
-        rental.due_date = new_due_date
-        
-        # 연체 상태였다면 활성으로 변경
-        if rental.status == RentalStatus.OVERDUE:
-            rental.status = RentalStatus.ACTIVE
-        
-        # 연장 사유 기록
-        extend_note = f"[연장: {extend_data.extend_days}일 ({old_due_date.strftime('%Y-%m-%d')} → {new_due_date.strftime('%Y-%m-%d')})"
-        if extend_data.reason:
-            extend_note += f" - 사유: {extend_data.reason}"
-        extend_note += "]"
-        
-        rental.notes = f"{rental.notes or ''}\n{extend_note}".strip()
-        
-        db.commit()
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RENTAL_EXTENDED",
-            table_name="rentals",
-            user_id=admin_user_id,
-            record_id=rental.id,
-            description=f"대여 연장: {rental.item.name} (사용자: {rental.user.student_id}, {extend_data.extend_days}일)",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+        with unit_of_work(db):
+            rental = db.query(Rental).options(
+                joinedload(Rental.user),
+                joinedload(Rental.item).joinedload(Item.category)
+            ).filter(Rental.id == rental_id).first()
+            
+            if not rental:
+                return None
+            
+            if rental.status not in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
+                raise ValueError(f"연장 처리할 수 없는 대여 상태입니다 (현재: {rental.status.value})")
+            
+            # 기존 반납 예정일에서 연장
+            new_due_date = rental.due_date + timedelta(days=extend_data.extend_days)
+            
+            # 연장 기록 저장
+            old_due_date = rental.due_date
+            rental.due_date = new_due_date
+            
+            # 연체 상태였다면 활성으로 변경
+            if rental.status == RentalStatus.OVERDUE:
+                rental.status = RentalStatus.ACTIVE
+            
+            # 연장 사유 기록
+            extend_note = f"[연장: {extend_data.extend_days}일 ({old_due_date.strftime('%Y-%m-%d')} → {new_due_date.strftime('%Y-%m-%d')})"
+            if extend_data.reason:
+                extend_note += f" - 사유: {extend_data.reason}"
+            extend_note += "]"
+            
+            rental.notes = f"{rental.notes or ''}\n{extend_note}".strip()
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="RENTAL_EXTENDED",
+                table_name="rentals",
+                user_id=admin_user_id,
+                record_id=rental.id,
+                description=f"대여 연장: {rental.item.name} (사용자: {rental.user.student_id}, {extend_data.extend_days}일)",
+                ip_address=ip_address
+            )
         
         return RentalService._build_rental_response(rental)
     
     @staticmethod
-    def mark_overdue_rentals(db: Session) -> int:
+    def mark_overdue_rentals(db: Session, chunk_size: Optional[int] = None) -> int:
         """
         연체된 대여들을 일괄 처리 (스케줄러용)
         
+        반납 예정일이 지난 ACTIVE 대여를 청크 단위로 UPDATE ... RETURNING 한 번에 OVERDUE로 바꾸고,
+        같은 트랜잭션에서 감사 로그를 INSERT ... SELECT 한 번으로 기록합니다.
+        PostgreSQL에서는 반납 처리 중인 대여(행 잠금)를 건너뛰고 다음 실행에서 처리합니다.
+        
         Args:
             db: 데이터베이스 세션
+            chunk_size: 한 트랜잭션에서 처리할 최대 대여 수 (기본값: BULK_JOB_CHUNK_SIZE)
             
         Returns:
             int: 연체 처리된 대여 개수
         """
-        now = datetime.utcnow()
-        
-        # 연체된 대여 조회 (ACTIVE 상태에서 반납 예정일 초과)
-        overdue_rentals = db.query(Rental).filter(
-            and_(
-                Rental.status == RentalStatus.ACTIVE,
-                Rental.due_date < now
-            )
-        ).all()
-        
-        count = 0
-        for rental in overdue_rentals:
-            # 연체 상태로 변경
-            rental.status = RentalStatus.OVERDUE
-            
-            # 감사 로그 기록
-            audit_log = AuditLog.create_log(
-                action="RENTAL_OVERDUE",
-                table_name="rentals",
-                record_id=rental.id,
-                description=f"대여 연체: {rental.item.name} (사용자: {rental.user.student_id})"
-            )
-            db.add(audit_log)
-            count += 1
-        
-        if count > 0:
-            db.commit()
-        
-        return count
+        chunk_size = chunk_size or settings.BULK_JOB_CHUNK_SIZE
+        dialect = db.get_bind().dialect
+        started = time.perf_counter()
+        today = date.today()
+        total = 0
+        chunks = 0
+        
+        try:
+            while True:
+                # 연체 대상 (ACTIVE 상태에서 반납 예정일 초과)
+                target_ids = select(Rental.id).where(
+                    Rental.status == RentalStatus.ACTIVE,
+                    Rental.due_date < today
+                ).order_by(Rental.id).limit(chunk_size)
+                if dialect.name == "postgresql":
+                    target_ids = target_ids.with_for_update(skip_locked=True)
+                
+                if dialect.update_returning:
+                    rental_ids = db.execute(
+                        update(Rental).where(
+                            Rental.id.in_(target_ids.scalar_subquery())
+                        ).values(status=RentalStatus.OVERDUE).returning(Rental.id),
+                        execution_options={"synchronize_session": False}
+                    ).scalars().all()
+                else:
+                    rental_ids = db.execute(target_ids).scalars().all()
+                    if rental_ids:
+                        db.execute(
+                            update(Rental).where(Rental.id.in_(rental_ids)).values(status=RentalStatus.OVERDUE),
+                            execution_options={"synchronize_session": False}
+                        )
+                
+                if not rental_ids:
+                    break
+                
+                # 감사 로그 일괄 기록
+                db.execute(insert(AuditLog).from_select(
+                    ["action", "table_name", "record_id", "description"],
+                    select(
+                        literal("RENTAL_OVERDUE"),
+                        literal("rentals"),
+                        Rental.id,
+                        literal("대여 연체: ") + Item.name + literal(" (사용자: ") + User.student_id + literal(")")
+                    ).join(
+                        Item, Item.id == Rental.item_id
+                    ).join(
+                        User, User.id == Rental.user_id
+                    ).where(Rental.id.in_(rental_ids))
+                ))
+                
+                # 일괄 UPDATE는 flush 이벤트를 거치지 않으므로 통계 카운터 증감을 직접 추가 (커밋 시 반영)
+                StatisticsService.add_deltas(db, {
+                    f"rentals.status.{RentalStatus.ACTIVE.value}": -len(rental_ids),
+                    f"rentals.status.{RentalStatus.OVERDUE.value}": len(rental_ids),
+                })
+                db.commit()
+                
+                total += len(rental_ids)
+                chunks += 1
+                if len(rental_ids) < chunk_size:
+                    break
+        except Exception as e:
+            db.rollback()
+            job_stats.record("mark_overdue_rentals", total, time.perf_counter() - started, chunks, error=str(e))
+            raise
+        
+        elapsed = time.perf_counter() - started
+        job_stats.record("mark_overdue_rentals", total, elapsed, chunks)
+        if total > 0:
+            print(f"⏰ 연체 처리: {total}건 ({chunks}개 청크, {elapsed * 1000:.1f}ms)")
+        
+        return total
     
     @staticmethod
     def get_user_active_rentals(db: Session, user_id: int) -> List[RentalResponse]:
@@ -418,17 +494,15 @@ class RentalService:
         Returns:
             List[RentalResponse]: 활성 대여 목록
         """
-        rentals = db.query(Rental).options(
-            joinedload(Rental.user),
-            joinedload(Rental.item).joinedload(Item.category)
-        ).filter(
+        rows = RentalService._list_query(db.query(Rental)).filter(
             and_(
                 Rental.user_id == user_id,
                 Rental.status.in_([RentalStatus.ACTIVE, RentalStatus.OVERDUE])
             )
         ).order_by(Rental.created_at.desc()).all()
         
-        return [RentalService._build_rental_response(r) for r in rentals]
+        today = date.today()
+        return _RENTAL_RESPONSES.validate_python([RentalService._build_list_entry(row, today) for row in rows])
     
     @staticmethod
     def get_rental_history(
@@ -491,27 +565,52 @@ class RentalService:
         return history_list
     
     @staticmethod
-    def _build_rental_response(rental: Rental) -> RentalResponse:
-        """대여 응답 데이터 빌드"""
-        now = datetime.utcnow()
-        
-        # 연체 여부 및 남은/연체 일수 계산
-        is_overdue = rental.due_date < now if rental.status in [RentalStatus.ACTIVE, RentalStatus.OVERDUE] else False
+    def _status_helpers(
+        status: RentalStatus,
+        rental_date: date,
+        due_date: date,
+        return_date: Optional[date],
+        today: date
+    ) -> dict:
+        """연체 여부, 남은/연체 일수, 총 대여 일수 계산 (대여 일자 컬럼은 날짜 단위)"""
+        is_overdue = due_date < today if status in [RentalStatus.ACTIVE, RentalStatus.OVERDUE] else False
         days_remaining = None
         days_overdue = None
         
-        if rental.status in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
+        if status in [RentalStatus.ACTIVE, RentalStatus.OVERDUE]:
             if is_overdue:
-                days_overdue = (now - rental.due_date).days
+                days_overdue = (today - due_date).days
             else:
-                days_remaining = (rental.due_date - now).days
-        
-        # 총 대여 일수 계산
-        if rental.returned_at:
-            rental_duration_days = (rental.returned_at - rental.created_at).days
-        else:
-            rental_duration_days = (now - rental.created_at).days
+                days_remaining = (due_date - today).days
         
+        return {
+            "is_overdue": is_overdue,
+            "days_remaining": days_remaining,
+            "days_overdue": days_overdue,
+            "rental_duration_days": ((return_date or today) - rental_date).days,
+        }
+    
+    @staticmethod
+    def _list_query(query):
+        """대여 쿼리를 목록 응답 컬럼 (대여 + 사용자/품목/카테고리 이름) 튜플 조회로 변환"""
+        return query.with_entities(*_RENTAL_LIST_COLUMNS).outerjoin(
+            User, User.id == Rental.user_id
+        ).outerjoin(
+            Item, Item.id == Rental.item_id
+        ).outerjoin(
+            Category, Category.id == Item.category_id
+        )
+    
+    @staticmethod
+    def _build_list_entry(row, today: date) -> dict:
+        """목록 쿼리 행을 응답 dict로 변환 (모델 검증은 목록 단위로 한 번)"""
+        entry = row._asdict()
+        entry.update(RentalService._status_helpers(row.status, row.rental_date, row.due_date, row.return_date, today))
+        return entry
+    
+    @staticmethod
+    def _build_rental_response(rental: Rental) -> RentalResponse:
+        """대여 응답 데이터 빌드 (단건 조회/상태 변경 응답)"""
         rental_data = RentalResponse.model_validate(rental)
         
         # 관련 정보 추가
@@ -526,10 +625,11 @@ class RentalService:
                 rental_data.category_name = rental.item.category.name
         
         # 상태 헬퍼 추가
-        rental_data.is_overdue = is_overdue
-        rental_data.days_remaining = days_remaining
-        rental_data.days_overdue = days_overdue
-        rental_data.rental_duration_days = rental_duration_days
+        helpers = RentalService._status_helpers(
+            rental.status, rental.rental_date, rental.due_date, rental.return_date, date.today()
+        )
+        for field, value in helpers.items():
+            setattr(rental_data, field, value)
         
         return rental_data
     
@@ -538,57 +638,12 @@ class RentalService:
         """
         대여 통계 조회 (관리자용)
         
+        통계 카운터(statistic_counters)에서 읽으므로 데이터 양과 무관하게 일정한 시간에 조회됩니다.
+        
         Args:
             db: 데이터베이스 세션
             
         Returns:
             dict: 대여 통계 정보
         """
-        # 전체 대여 개수
-        total_rentals = db.query(func.count(Rental.id)).scalar()
-        
-        # 상태별 대여 개수
-        status_counts = db.query(
-            Rental.status,
-            func.count(Rental.id)
-        ).group_by(Rental.status).all()
-        
-        # 오늘 대여 개수
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_rentals = db.query(func.count(Rental.id)).filter(
-            Rental.created_at >= today_start
-        ).scalar()
-        
-        # 현재 활성 대여 개수
-        active_rentals = db.query(func.count(Rental.id)).filter(
-            Rental.status.in_([RentalStatus.ACTIVE, RentalStatus.OVERDUE])
-        ).scalar()
-        
-        # 연체 대여 개수
-        now = datetime.utcnow()
-        overdue_rentals = db.query(func.count(Rental.id)).filter(
-            and_(
-                Rental.status.in_([RentalStatus.ACTIVE, RentalStatus.OVERDUE]),
-                Rental.due_date < now
-            )
-        ).scalar()
-        
-        # 평균 대여 기간
-        avg_rental_days = db.query(
-            func.avg(
-                func.case(
-                    [(Rental.status == RentalStatus.RETURNED,
-                      func.extract('day', Rental.returned_at - Rental.created_at))],
-                    else_=None
-                )
-            )
-        ).scalar()
-        
-        return {
-            "total_rentals": total_rentals,
-            "status_counts": {status.value: count for status, count in status_counts},
-            "today_rentals": today_rentals,
-            "active_rentals": active_rentals,
-            "overdue_rentals": overdue_rentals,
-            "average_rental_days": float(avg_rental_days) if avg_rental_days else None
-        }
\ No newline at end of file
+        return StatisticsService.get_rental_statistics(db)
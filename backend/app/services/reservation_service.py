@@ -1,25 +1,76 @@
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, or_
-from datetime import datetime, timedelta
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import and_, func, insert, literal, or_, select, update
+from datetime import datetime, timedelta, timezone
+from pydantic import TypeAdapter
+import threading
+import time
 
-from app.models.reservation import Reservation
+from app.models.reservation import Reservation, ReservationStatus
 from app.models.item import Item, ItemStatus
 from app.models.user import User
 from app.models.category import Category
 from app.schemas.reservation import (
     ReservationCreate, ReservationUpdate, ReservationResponse, 
-    ReservationList, ReservationFilter, ReservationStatus,
+    ReservationList, ReservationFilter,
     ReservationConfirm, ReservationCancel
 )
 from app.models.audit_log import AuditLog
+from app.core.audit_writer import audit_log_writer
+from app.services.statistics_service import StatisticsService
 from app.core.config import settings
+from app.core.delay_queue import reservation_expiry_queue
+from app.core.response_cache import response_cache, ITEMS, item_version
+from app.db.unit_of_work import after_commit, unit_of_work
+from app.core.job_stats import job_stats
+from app.utils.pagination import keyset_condition, keyset_order_by, split_page
+
+# 목록 응답 컬럼 - ORM 객체 대신 튜플로 조회 (라벨은 ReservationResponse 필드 이름)
+_RESERVATION_LIST_COLUMNS = (
+    Reservation.id, Reservation.user_id, Reservation.item_id, Reservation.status,
+    Reservation.expires_at, Reservation.notes, Reservation.created_at, Reservation.updated_at,
+    User.name.label("user_name"),
+    User.student_id.label("user_student_id"),
+    Item.name.label("item_name"),
+    Item.serial_number.label("item_serial_number"),
+    Category.name.label("category_name"),
+)
+
+_RESERVATION_RESPONSES = TypeAdapter(List[ReservationResponse])
+
+
+class ExpiryHorizon:
+    """
+    읽기 경로 지연 만료의 다음 확인 시각 (워커 프로세스 단위)
+
+    확인 시점에 남아 있는 PENDING 예약은 가장 이른 만료 시각 전에는 만료되지 않고,
+    그 뒤 생성되는 예약은 확인 시각 + 예약 유효 시간 이후에 만료됩니다.
+    두 시각 중 이른 쪽까지는 만료될 예약이 없으므로 DB를 확인하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._due_at: Optional[datetime] = None
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """만료 확인이 필요한지 (UTC 기준)"""
+        with self._lock:
+            return self._due_at is None or (now or datetime.utcnow()) >= self._due_at
+
+    def advance(self, due_at: datetime) -> None:
+        with self._lock:
+            self._due_at = due_at
+
+
+expiry_horizon = ExpiryHorizon()
 
 
 class ReservationService:
     """예약 관리 서비스"""
     
     RESERVATION_DURATION_HOURS = 1  # 예약 유효 시간 (1시간)
+    RESERVATION_CREATE_MAX_ATTEMPTS = 3  # 같은 품목 동시 수정으로 충돌 시 최대 시도 횟수
     
     @staticmethod
     def get_reservations(
@@ -28,26 +79,25 @@ class ReservationService:
         limit: int = 100,
         filters: Optional[ReservationFilter] = None,
         current_user_id: Optional[int] = None,
-        is_admin: bool = False
+        is_admin: bool = False,
+        cursor: Optional[str] = None
     ) -> ReservationList:
         """
         예약 목록 조회
         
         Args:
             db: 데이터베이스 세션
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회할 개수
             filters: 필터 조건
             current_user_id: 현재 사용자 ID (일반 사용자는 자신 것만)
             is_admin: 관리자 여부
+            cursor: 이전 응답의 next_cursor (최신 순 keyset 페이지네이션)
             
         Returns:
             ReservationList: 예약 목록과 통계
         """
-        query = db.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.item).joinedload(Item.category)
-        )
+        query = db.query(Reservation)
         
         # 일반 사용자는 자신의 예약만 조회 가능
         if not is_admin and current_user_id:
@@ -62,7 +112,10 @@ class ReservationService:
                 query = query.filter(Reservation.item_id == filters.item_id)
             
             if filters.category_id:
-                query = query.join(Item).filter(Item.category_id == filters.category_id)
+                # 목록 컬럼 조회 시 품목을 외부 조인하므로 조인 대신 하위 쿼리로 필터
+                query = query.filter(
+                    Reservation.item_id.in_(select(Item.id).where(Item.category_id == filters.category_id))
+                )
             
             if filters.status:
                 query = query.filter(Reservation.status == filters.status)
@@ -93,14 +146,21 @@ class ReservationService:
         # 총 개수 조회
         total = query.count()
         
-        # 페이지네이션 적용하여 예약 조회 (최신 순)
-        reservations = query.order_by(Reservation.created_at.desc()).offset(skip).limit(limit).all()
+        # 커서가 있으면 (created_at, id) 기준 keyset, 없으면 offset 페이지네이션 (최신 순)
+        if cursor:
+            query = query.filter(keyset_condition(Reservation.created_at, Reservation.id, cursor))
+            skip = 0
         
-        # 예약 응답 데이터 생성
-        reservation_responses = []
-        for reservation in reservations:
-            reservation_data = ReservationService._build_reservation_response(reservation)
-            reservation_responses.append(reservation_data)
+        rows, next_cursor = split_page(
+            ReservationService._list_query(query).order_by(
+                *keyset_order_by(Reservation.created_at, Reservation.id)
+            ).offset(skip).limit(limit + 1).all(),
+            limit
+        )
+        
+        # 예약 응답 데이터 생성 (행 dict를 ReservationList 생성 시 한 번에 검증)
+        now = datetime.utcnow()
+        reservation_responses = [ReservationService._build_list_entry(row, now) for row in rows]
         
         # 상태별 통계 조회
         stats_base_query = db.query(Reservation.status, func.count(Reservation.id)).group_by(Reservation.status)
@@ -115,7 +175,8 @@ class ReservationService:
             pending_count=status_stats.get(ReservationStatus.PENDING, 0),
             confirmed_count=status_stats.get(ReservationStatus.CONFIRMED, 0),
             cancelled_count=status_stats.get(ReservationStatus.CANCELLED, 0),
-            expired_count=status_stats.get(ReservationStatus.EXPIRED, 0)
+            expired_count=status_stats.get(ReservationStatus.EXPIRED, 0),
+            next_cursor=next_cursor
         )
     
     @staticmethod
@@ -174,13 +235,57 @@ class ReservationService:
         Raises:
             ValueError: 예약 불가능한 경우
         """
+        # 만료 시각이 지난 예약이 품목을 잡고 있지 않도록 먼저 정리
+        ReservationService.release_expired_reservations(db)
+        
+        for attempt in range(1, ReservationService.RESERVATION_CREATE_MAX_ATTEMPTS + 1):
+            try:
+                with unit_of_work(db):
+                    reservation = ReservationService._reserve_item(db, reservation_data, user_id)
+                    
+                    # 감사 로그 기록
+                    audit_log_writer.record_after_commit(
+                        db,
+                        action="RESERVATION_CREATED",
+                        table_name="reservations",
+                        user_id=user_id,
+                        record_id=reservation.id,
+                        description=f"예약 생성: {reservation.item.name} ({reservation.item.serial_number})",
+                        ip_address=ip_address
+                    )
+                    
+                    # 만료 시각에 맞춰 자동 만료되도록 지연 큐에 등록
+                    after_commit(db, lambda: reservation_expiry_queue.schedule(reservation.id, reservation.expires_at))
+                    response_cache.invalidate_after_commit(db, ITEMS, item_version(reservation.item_id))
+                break
+            except StaleDataError:
+                # 다른 트랜잭션이 먼저 품목을 수정함 - 최신 상태로 다시 확인 (롤백은 unit_of_work에서 처리)
+                if attempt == ReservationService.RESERVATION_CREATE_MAX_ATTEMPTS:
+                    raise ValueError("다른 요청과 충돌하여 예약하지 못했습니다. 잠시 후 다시 시도해 주세요")
+        
+        return ReservationService._build_reservation_response(reservation)
+    
+    @staticmethod
+    def _reserve_item(
+        db: Session,
+        reservation_data: ReservationCreate,
+        user_id: int
+    ) -> Reservation:
+        """
+        품목 예약 (품목 상태 확인 → 예약 생성 → 품목 RESERVED → flush, 커밋은 호출한 쪽에서)
+        
+        Raises:
+            ValueError: 예약 불가능한 경우
+            StaleDataError: 품목을 읽은 뒤 다른 트랜잭션이 먼저 수정한 경우
+        """
         # 품목 존재 및 예약 가능 여부 확인
+        # PostgreSQL에서는 품목 행을 잠가 같은 품목에 대한 예약을 직렬화
         item = db.query(Item).options(joinedload(Item.category)).filter(
             and_(
                 Item.id == reservation_data.item_id,
                 Item.is_active == True
             )
-        ).first()
+        ).with_for_update(of=Item).first()
         
         if not item:
             raise ValueError("존재하지 않거나 비활성화된 품목입니다")
@@ -188,14 +293,6 @@ class ReservationService:
         if item.status != ItemStatus.AVAILABLE:
             raise ValueError(f"현재 예약할 수 없는 품목입니다 (상태: {item.status.value})")
         
-        # 사용자의 현재 활성 예약 개수 확인 (제한 없음이지만 확인용)
-        active_reservations = db.query(func.count(Reservation.id)).filter(
-            and_(
-                Reservation.user_id == user_id,
-                Reservation.status == ReservationStatus.PENDING
-            )
-        ).scalar()
-        
         # 같은 품목에 대한 중복 예약 방지
         existing_reservation = db.query(Reservation).filter(
             and_(
@@ -211,41 +308,25 @@ class ReservationService:
         # 예약 만료 시간 계산 (1시간 후)
         expires_at = datetime.utcnow() + timedelta(hours=ReservationService.RESERVATION_DURATION_HOURS)
         
-        # 새 예약 생성
+        # 새 예약 생성 (응답에 쓸 사용자/품목을 관계로 연결)
+        # 예약 ID는 품목의 현재 예약 포인터와 감사 로그에 필요하므로 먼저 INSERT
         reservation = Reservation(
-            user_id=user_id,
-            item_id=reservation_data.item_id,
+            user=db.get(User, user_id),
+            item=item,
             notes=reservation_data.notes,
             status=ReservationStatus.PENDING,
             expires_at=expires_at
         )
-        
-        # 품목 상태를 예약됨으로 변경
-        item.status = ItemStatus.RESERVED
-        
         db.add(reservation)
-        db.commit()
-        db.refresh(reservation)
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RESERVATION_CREATED",
-            table_name="reservations",
-            user_id=user_id,
-            record_id=reservation.id,
-            description=f"예약 생성: {item.name} ({item.serial_number})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+        db.flush()
         
-        # 응답 데이터 생성
-        reservation = db.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.item).joinedload(Item.category)
-        ).filter(Reservation.id == reservation.id).first()
+        # 품목 상태를 예약됨으로 변경하고 현재 예약 포인터 설정 (품목 UPDATE 한 번)
+        item.status = ItemStatus.RESERVED
+        item.current_reservation_id = reservation.id
         
-        return ReservationService._build_reservation_response(reservation)
+        # 품목 UPDATE에 버전 조건이 붙어, 그 사이 다른 트랜잭션이 품목을 수정했으면 StaleDataError
+        db.flush()
+        return reservation
     
     @staticmethod
     def confirm_reservation(
@@ -268,38 +349,34 @@ class ReservationService:
         Returns:
             ReservationResponse: 확인된 예약 정보
         """
-        reservation = db.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.item)
-        ).filter(Reservation.id == reservation_id).first()
-        
-        if not reservation:
-            return None
-        
-        if reservation.status != ReservationStatus.PENDING:
-            raise ValueError(f"수령 확인할 수 없는 예약 상태입니다 (현재: {reservation.status.value})")
-        
-        # 예약 상태 업데이트
-        reservation.status = ReservationStatus.CONFIRMED
-        reservation.confirmed_at = datetime.utcnow()
-        reservation.admin_notes = confirm_data.admin_notes
-        
-        # 품목 상태를 대여중으로 변경
-        reservation.item.status = ItemStatus.RENTED
-        
-        db.commit()
-        
-        # 대여 레코드 자동 생성
+        # 대여 생성까지 한 트랜잭션 (대여를 만들 수 없으면 예약 확인도 롤백)
         from app.services.rental_service import RentalService
         from app.schemas.rental import RentalCreate
         
-        try:
+        with unit_of_work(db):
+            # 예약 행 잠금 (만료 일괄 처리와 동시에 같은 예약을 처리하지 않도록)
+            reservation = db.query(Reservation).options(
+                joinedload(Reservation.user),
+                joinedload(Reservation.item).joinedload(Item.category)
+            ).filter(Reservation.id == reservation_id).with_for_update(of=Reservation).first()
+            
+            if not reservation:
+                return None
+            
+            if reservation.status != ReservationStatus.PENDING:
+                raise ValueError(f"수령 확인할 수 없는 예약 상태입니다 (현재: {reservation.status.value})")
+            
+            # 예약 상태 업데이트
+            reservation.status = ReservationStatus.CONFIRMED
+            reservation.confirmed_at = datetime.utcnow()
+            reservation.admin_notes = confirm_data.admin_notes
+            
+            # 대여 레코드 자동 생성 (품목 상태/현재 대여 포인터는 create_rental에서 변경)
             rental_data = RentalCreate(
                 item_id=reservation.item_id,
                 reservation_id=reservation.id,
                 notes=f"예약 확인을 통한 자동 대여 생성"
             )
-            
             RentalService.create_rental(
                 db=db,
                 rental_data=rental_data,
@@ -307,30 +384,19 @@ class ReservationService:
                 admin_user_id=admin_user_id,
                 ip_address=ip_address
             )
-        except Exception as e:
-            # 대여 레코드 생성 실패 시 롤백하지 않고 로그만 기록
-            audit_log = AuditLog.create_log(
-                action="RENTAL_CREATE_FAILED",
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="RESERVATION_CONFIRMED",
                 table_name="reservations",
                 user_id=admin_user_id,
                 record_id=reservation.id,
-                description=f"예약 확인 후 대여 레코드 생성 실패: {str(e)}",
+                description=f"예약 수령 확인: {reservation.item.name} (사용자: {reservation.user.student_id})",
                 ip_address=ip_address
             )
-            db.add(audit_log)
-            db.commit()
-        
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RESERVATION_CONFIRMED",
-            table_name="reservations",
-            user_id=admin_user_id,
-            record_id=reservation.id,
-            description=f"예약 수령 확인: {reservation.item.name} (사용자: {reservation.user.student_id})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+            after_commit(db, lambda: reservation_expiry_queue.discard(reservation.id))
+            response_cache.invalidate_after_commit(db, ITEMS, item_version(reservation.item_id))
         
         return ReservationService._build_reservation_response(reservation)
     
@@ -357,51 +423,194 @@ class ReservationService:
         Returns:
             ReservationResponse: 취소된 예약 정보
         """
-        query = db.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.item)
-        ).filter(Reservation.id == reservation_id)
-        
-        # 일반 사용자는 자신의 예약만 취소 가능
-        if not is_admin:
-            query = query.filter(Reservation.user_id == user_id)
-        
-        reservation = query.first()
-        if not reservation:
-            return None
+        with unit_of_work(db):
+            # 예약 행 잠금 (만료 일괄 처리/수령 확인과 동시에 같은 예약을 처리하지 않도록)
+            # 세션에 이미 로드된 예약이 있어도 잠근 뒤의 값으로 상태를 다시 확인
+            query = db.query(Reservation).options(
+                joinedload(Reservation.user),
+                joinedload(Reservation.item).joinedload(Item.category)
+            ).filter(Reservation.id == reservation_id)
+            
+            # 일반 사용자는 자신의 예약만 취소 가능
+            if not is_admin:
+                query = query.filter(Reservation.user_id == user_id)
+            
+            reservation = query.with_for_update(of=Reservation).populate_existing().first()
+            if not reservation:
+                return None
+            
+            if reservation.status != ReservationStatus.PENDING:
+                raise ValueError(f"취소할 수 없는 예약 상태입니다 (현재: {reservation.status.value})")
+            
+            # 예약 취소 처리
+            reservation.status = ReservationStatus.CANCELLED
+            reservation.cancelled_at = datetime.utcnow()
+            if cancel_data.reason:
+                reservation.notes = f"{reservation.notes or ''}\n[취소 사유: {cancel_data.reason}]".strip()
+            
+            # 품목 상태를 사용 가능으로 복원하고 현재 예약 포인터 해제
+            reservation.item.status = ItemStatus.AVAILABLE
+            if reservation.item.current_reservation_id == reservation.id:
+                reservation.item.current_reservation_id = None
+            
+            # 감사 로그 기록
+            audit_log_writer.record_after_commit(
+                db,
+                action="RESERVATION_CANCELLED",
+                table_name="reservations",
+                user_id=user_id,
+                record_id=reservation.id,
+                description=f"예약 취소: {reservation.item.name} (사용자: {reservation.user.student_id})",
+                ip_address=ip_address
+            )
+            after_commit(db, lambda: reservation_expiry_queue.discard(reservation.id))
+            response_cache.invalidate_after_commit(db, ITEMS, item_version(reservation.item_id))
         
-        if reservation.status not in [ReservationStatus.PENDING]:
-            raise ValueError(f"취소할 수 없는 예약 상태입니다 (현재: {reservation.status.value})")
+        return ReservationService._build_reservation_response(reservation)
+    
+    @staticmethod
+    def expire_reservations(
+        db: Session,
+        chunk_size: Optional[int] = None,
+        reservation_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        만료된 예약들을 일괄 처리 (스케줄러/만료 지연 큐용)
         
-        # 예약 취소 처리
-        reservation.status = ReservationStatus.CANCELLED
-        reservation.cancelled_at = datetime.utcnow()
-        if cancel_data.reason:
-            reservation.notes = f"{reservation.notes or ''}\n[취소 사유: {cancel_data.reason}]".strip()
+        청크마다 한 트랜잭션에서 예약 만료(UPDATE ... RETURNING 품목 ID), 품목 상태 복원(UPDATE 한 번),
+        감사 로그 기록(INSERT ... SELECT 한 번)을 수행합니다.
+        PostgreSQL에서는 수령 확인 중인 예약(행 잠금)을 건너뛰므로 confirm_reservation과 경합하지 않습니다.
         
-        # 품목 상태를 사용 가능으로 복원
-        reservation.item.status = ItemStatus.AVAILABLE
+        Args:
+            db: 데이터베이스 세션
+            chunk_size: 한 트랜잭션에서 처리할 최대 예약 수 (기본값: BULK_JOB_CHUNK_SIZE)
+            reservation_ids: 지정하면 이 예약들 중 만료된 것만 처리 (지연 큐에서 꺼낸 예약)
+            
+        Returns:
+            int: 만료 처리된 예약 개수
+        """
+        chunk_size = chunk_size or settings.BULK_JOB_CHUNK_SIZE
+        dialect = db.get_bind().dialect
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        total = 0
+        chunks = 0
         
-        db.commit()
+        try:
+            while True:
+                # 만료 대상 (PENDING 상태에서 만료 시간 초과)
+                target_ids = select(Reservation.id).where(
+                    Reservation.status == ReservationStatus.PENDING,
+                    Reservation.expires_at < now
+                ).order_by(Reservation.id).limit(chunk_size)
+                if reservation_ids is not None:
+                    target_ids = target_ids.where(Reservation.id.in_(reservation_ids))
+                if dialect.name == "postgresql":
+                    target_ids = target_ids.with_for_update(skip_locked=True)
+                
+                if dialect.update_returning:
+                    expired = db.execute(
+                        update(Reservation).where(
+                            Reservation.id.in_(target_ids.scalar_subquery())
+                        ).values(status=ReservationStatus.EXPIRED).returning(Reservation.id, Reservation.item_id),
+                        execution_options={"synchronize_session": False}
+                    ).all()
+                else:
+                    expired = db.execute(
+                        select(Reservation.id, Reservation.item_id).where(Reservation.id.in_(target_ids.scalar_subquery()))
+                    ).all()
+                    if expired:
+                        db.execute(
+                            update(Reservation).where(
+                                Reservation.id.in_([reservation_id for reservation_id, _ in expired])
+                            ).values(status=ReservationStatus.EXPIRED),
+                            execution_options={"synchronize_session": False}
+                        )
+                
+                if not expired:
+                    break
+                
+                chunk_ids = [reservation_id for reservation_id, _ in expired]
+                
+                # 만료된 예약이 잡고 있던 품목을 사용 가능으로 복원하고 현재 예약 포인터 해제
+                expired_item_ids = sorted({item_id for _, item_id in expired})
+                held_by_expired = and_(
+                    Item.id.in_(expired_item_ids),
+                    Item.current_reservation_id.in_(chunk_ids)
+                )
+                restore_items = update(Item).where(
+                    held_by_expired,
+                    Item.status == ItemStatus.RESERVED
+                ).values(status=ItemStatus.AVAILABLE, current_reservation_id=None, version_id=Item.version_id + 1)
+                if dialect.update_returning:
+                    restored_active = sum(db.execute(
+                        restore_items.returning(Item.is_active),
+                        execution_options={"synchronize_session": False}
+                    ).scalars().all())
+                else:
+                    restored_active = db.query(func.count(Item.id)).filter(
+                        restore_items.whereclause, Item.is_active == True
+                    ).scalar()
+                    db.execute(restore_items, execution_options={"synchronize_session": False})
+                
+                # 관리자가 상태를 직접 바꾼 품목은 상태는 두고 포인터만 해제 (대부분 대상 없음)
+                db.execute(
+                    update(Item).where(held_by_expired).values(
+                        current_reservation_id=None, version_id=Item.version_id + 1
+                    ),
+                    execution_options={"synchronize_session": False}
+                )
+                
+                # 감사 로그 일괄 기록
+                db.execute(insert(AuditLog).from_select(
+                    ["action", "table_name", "record_id", "description"],
+                    select(
+                        literal("RESERVATION_EXPIRED"),
+                        literal("reservations"),
+                        Reservation.id,
+                        literal("예약 자동 만료: ") + Item.name
+                    ).join(
+                        Item, Item.id == Reservation.item_id
+                    ).where(Reservation.id.in_(chunk_ids))
+                ))
+                
+                # 일괄 UPDATE는 flush 이벤트를 거치지 않으므로 통계 카운터 증감을 직접 추가 (커밋 시 반영)
+                StatisticsService.add_deltas(db, {
+                    f"reservations.status.{ReservationStatus.PENDING.value}": -len(expired),
+                    f"reservations.status.{ReservationStatus.EXPIRED.value}": len(expired),
+                    f"items.status.{ItemStatus.RESERVED.value}": -restored_active,
+                    f"items.status.{ItemStatus.AVAILABLE.value}": restored_active,
+                })
+                db.commit()
+                reservation_expiry_queue.discard(*chunk_ids)
+                response_cache.invalidate(ITEMS, *[item_version(item_id) for item_id in {item_id for _, item_id in expired}])
+                
+                total += len(expired)
+                chunks += 1
+                if len(expired) < chunk_size:
+                    break
+        except Exception as e:
+            db.rollback()
+            job_stats.record("expire_reservations", total, time.perf_counter() - started, chunks, error=str(e))
+            raise
         
-        # 감사 로그 기록
-        audit_log = AuditLog.create_log(
-            action="RESERVATION_CANCELLED",
-            table_name="reservations",
-            user_id=user_id,
-            record_id=reservation.id,
-            description=f"예약 취소: {reservation.item.name} (사용자: {reservation.user.student_id})",
-            ip_address=ip_address
-        )
-        db.add(audit_log)
-        db.commit()
+        elapsed = time.perf_counter() - started
+        job_stats.record("expire_reservations", total, elapsed, chunks)
+        if total > 0:
+            print(f"⏰ 예약 만료 처리: {total}건 ({chunks}개 청크, {elapsed * 1000:.1f}ms)")
         
-        return ReservationService._build_reservation_response(reservation)
+        return total
     
     @staticmethod
-    def expire_reservations(db: Session) -> int:
+    def release_expired_reservations(db: Session) -> int:
         """
-        만료된 예약들을 일괄 처리 (스케줄러용)
+        만료 시각이 지난 PENDING 예약을 바로 만료 처리 (읽기 경로의 지연 만료)
+        
+        만료 지연 큐나 스케줄러가 처리하기 전이라도 품목 조회/예약 생성에서 만료된 예약을
+        반영해 품목이 즉시 대여 가능으로 보이게 합니다. 만료될 예약이 없는 동안은
+        expiry_horizon으로 DB 확인을 건너뛰므로 대부분의 조회에는 추가 쿼리가 없습니다.
+        처리에 실패하면 트랜잭션을 롤백하고 실패를 작업 통계에 기록한 뒤 조회를 계속 진행합니다
+        (다음 조회에서 다시 시도).
         
         Args:
             db: 데이터베이스 세션
@@ -410,39 +619,58 @@ class ReservationService:
             int: 만료 처리된 예약 개수
         """
         now = datetime.utcnow()
+        if not expiry_horizon.is_due(now):
+            return 0
         
-        # 만료된 예약 조회
-        expired_reservations = db.query(Reservation).options(
-            joinedload(Reservation.item)
-        ).filter(
-            and_(
-                Reservation.status == ReservationStatus.PENDING,
-                Reservation.expires_at < now
-            )
-        ).all()
-        
-        count = 0
-        for reservation in expired_reservations:
-            # 예약 만료 처리
-            reservation.status = ReservationStatus.EXPIRED
-            
-            # 품목 상태를 사용 가능으로 복원
-            reservation.item.status = ItemStatus.AVAILABLE
-            
-            # 감사 로그 기록
-            audit_log = AuditLog.create_log(
-                action="RESERVATION_EXPIRED",
-                table_name="reservations",
-                record_id=reservation.id,
-                description=f"예약 자동 만료: {reservation.item.name}"
-            )
-            db.add(audit_log)
-            count += 1
+        expired = 0
+        started = time.perf_counter()
+        try:
+            earliest = ReservationService._earliest_pending_expiry(db)
+            if earliest is not None and earliest < now:
+                expired = ReservationService.expire_reservations(db)
+                earliest = ReservationService._earliest_pending_expiry(db)
+        except Exception as e:
+            # 실패한 트랜잭션을 정리해야 같은 세션으로 조회를 계속할 수 있음
+            db.rollback()
+            job_stats.record("release_expired_reservations", expired, time.perf_counter() - started, error=str(e))
+            print(f"⚠️  예약 지연 만료 처리 실패: {e}")
+            return 0
+        
+        job_stats.record("release_expired_reservations", expired, time.perf_counter() - started)
+        horizon = now + timedelta(hours=ReservationService.RESERVATION_DURATION_HOURS)
+        expiry_horizon.advance(min(horizon, earliest) if earliest is not None else horizon)
+        return expired
+    
+    @staticmethod
+    def _earliest_pending_expiry(db: Session) -> Optional[datetime]:
+        """PENDING 예약 중 가장 이른 만료 시각 (timezone 없는 UTC)"""
+        earliest = db.query(func.min(Reservation.expires_at)).filter(
+            Reservation.status == ReservationStatus.PENDING
+        ).scalar()
+        if earliest is not None and earliest.tzinfo is not None:
+            earliest = earliest.astimezone(timezone.utc).replace(tzinfo=None)
+        return earliest
+    
+    @staticmethod
+    def schedule_pending_expirations(db: Session) -> int:
+        """
+        PENDING 예약 전체를 만료 지연 큐에 다시 등록 (시작 시 실행)
         
-        if count > 0:
-            db.commit()
+        Redis 재시작이나 반영 전 종료로 큐에서 빠진 예약을 복구합니다.
+        PENDING 예약은 품목 수를 넘지 않으므로 상태 인덱스로 조회합니다.
         
-        return count
+        Args:
+            db: 데이터베이스 세션
+            
+        Returns:
+            int: 등록된 예약 개수
+        """
+        pending = db.query(Reservation.id, Reservation.expires_at).filter(
+            Reservation.status == ReservationStatus.PENDING
+        ).all()
+        for reservation_id, expires_at in pending:
+            reservation_expiry_queue.schedule(reservation_id, expires_at)
+        return len(pending)
     
     @staticmethod
     def get_user_active_reservations(db: Session, user_id: int) -> List[ReservationResponse]:
@@ -456,32 +684,53 @@ class ReservationService:
         Returns:
             List[ReservationResponse]: 활성 예약 목록
         """
-        reservations = db.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.item).joinedload(Item.category)
-        ).filter(
+        rows = ReservationService._list_query(db.query(Reservation)).filter(
             and_(
                 Reservation.user_id == user_id,
                 Reservation.status == ReservationStatus.PENDING
             )
         ).order_by(Reservation.created_at.desc()).all()
         
-        return [ReservationService._build_reservation_response(r) for r in reservations]
+        now = datetime.utcnow()
+        return _RESERVATION_RESPONSES.validate_python(
+            [ReservationService._build_list_entry(row, now) for row in rows]
+        )
     
     @staticmethod
-    def _build_reservation_response(reservation: Reservation) -> ReservationResponse:
-        """예약 응답 데이터 빌드"""
-        now = datetime.utcnow()
-        
-        # 만료 여부 및 남은 시간 계산
-        is_expired = reservation.expires_at < now if reservation.status == ReservationStatus.PENDING else False
+    def _status_helpers(status: ReservationStatus, expires_at: datetime, now: datetime) -> dict:
+        """활성/만료 여부와 남은 시간(분) 계산"""
+        is_expired = expires_at < now if status == ReservationStatus.PENDING else False
         remaining_minutes = None
-        if reservation.status == ReservationStatus.PENDING and not is_expired:
-            remaining_minutes = int((reservation.expires_at - now).total_seconds() / 60)
-        
-        # 활성 상태 계산
-        is_active = reservation.status == ReservationStatus.PENDING and not is_expired
+        if status == ReservationStatus.PENDING and not is_expired:
+            remaining_minutes = int((expires_at - now).total_seconds() / 60)
         
+        return {
+            "is_active": status == ReservationStatus.PENDING and not is_expired,
+            "is_expired": is_expired,
+            "remaining_minutes": remaining_minutes,
+        }
+    
+    @staticmethod
+    def _list_query(query):
+        """예약 쿼리를 목록 응답 컬럼 (예약 + 사용자/품목/카테고리 이름) 튜플 조회로 변환"""
+        return query.with_entities(*_RESERVATION_LIST_COLUMNS).outerjoin(
+            User, User.id == Reservation.user_id
+        ).outerjoin(
+            Item, Item.id == Reservation.item_id
+        ).outerjoin(
+            Category, Category.id == Item.category_id
+        )
+    
+    @staticmethod
+    def _build_list_entry(row, now: datetime) -> dict:
+        """목록 쿼리 행을 응답 dict로 변환 (모델 검증은 목록 단위로 한 번)"""
+        entry = row._asdict()
+        entry.update(ReservationService._status_helpers(row.status, row.expires_at, now))
+        return entry
+    
+    @staticmethod
+    def _build_reservation_response(reservation: Reservation) -> ReservationResponse:
+        """예약 응답 데이터 빌드 (단건 조회/상태 변경 응답)"""
         reservation_data = ReservationResponse.model_validate(reservation)
         
         # 관련 정보 추가
@@ -496,9 +745,9 @@ class ReservationService:
                 reservation_data.category_name = reservation.item.category.name
         
         # 상태 헬퍼 추가
-        reservation_data.is_active = is_active
-        reservation_data.is_expired = is_expired
-        reservation_data.remaining_minutes = remaining_minutes
+        helpers = ReservationService._status_helpers(reservation.status, reservation.expires_at, datetime.utcnow())
+        for field, value in helpers.items():
+            setattr(reservation_data, field, value)
         
         return reservation_data
     
@@ -507,39 +756,12 @@ class ReservationService:
         """
         예약 통계 조회 (관리자용)
         
+        통계 카운터(statistic_counters)에서 읽으므로 데이터 양과 무관하게 일정한 시간에 조회됩니다.
+        
         Args:
             db: 데이터베이스 세션
             
         Returns:
             dict: 예약 통계 정보
         """
-        # 전체 예약 개수
-        total_reservations = db.query(func.count(Reservation.id)).scalar()
-        
-        # 상태별 예약 개수
-        status_counts = db.query(
-            Reservation.status,
-            func.count(Reservation.id)
-        ).group_by(Reservation.status).all()
-        
-        # 오늘 예약 개수
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_reservations = db.query(func.count(Reservation.id)).filter(
-            Reservation.created_at >= today_start
-        ).scalar()
-        
-        # 현재 활성 예약 개수 (만료되지 않은 PENDING)
-        now = datetime.utcnow()
-        active_reservations = db.query(func.count(Reservation.id)).filter(
-            and_(
-                Reservation.status == ReservationStatus.PENDING,
-                Reservation.expires_at >= now
-            )
-        ).scalar()
-        
-        return {
-            "total_reservations": total_reservations,
-            "status_counts": {status.value: count for status, count in status_counts},
-            "today_reservations": today_reservations,
-            "active_reservations": active_reservations
-        }
\ No newline at end of file
+        return StatisticsService.get_reservation_statistics(db)
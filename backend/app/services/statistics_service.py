@@ -0,0 +1,446 @@
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import String, cast, delete, event, func, inspect, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.job_stats import job_stats
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.rental import Rental, RentalStatus
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.statistic_counter import StatisticCounter
+
+_PENDING_KEY = "statistic_counters_pending"
+_DELTAS_KEY = "statistic_counters_deltas"
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _item_counters(values: Dict[str, Any]) -> Dict[str, int]:
+    """품목 통계 (활성 품목만 집계)"""
+    if not values["is_active"]:
+        return {}
+    return {
+        "items.active": 1,
+        f"items.status.{_enum_value(values['status'])}": 1,
+        f"items.category.{values['category_id']}": 1,
+    }
+
+
+def _category_counters(values: Dict[str, Any]) -> Dict[str, int]:
+    counters = {"categories.total": 1}
+    if values["is_active"]:
+        counters["categories.active"] = 1
+    return counters
+
+
+def _rental_counters(values: Dict[str, Any]) -> Dict[str, int]:
+    status = _enum_value(values["status"])
+    counters = {"rentals.total": 1, f"rentals.status.{status}": 1}
+    # 평균 대여 기간 계산용 (반납 완료 대여의 대여 일수 합계)
+    if status == RentalStatus.RETURNED.value and values["return_date"] and values["rental_date"]:
+        counters["rentals.returned_days"] = (values["return_date"] - values["rental_date"]).days
+    return counters
+
+
+def _reservation_counters(values: Dict[str, Any]) -> Dict[str, int]:
+    return {"reservations.total": 1, f"reservations.status.{_enum_value(values['status'])}": 1}
+
+
+# 모델별 (통계에 영향을 주는 속성, 객체 상태 → 카운터 기여분, 일별 생성 카운터 접두사)
+# 속성은 모델에서 active_history=True로 선언해, 만료된 객체를 수정해도 이전 값이 history에 남음
+_TRACKED_MODELS: Dict[type, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Dict[str, int]], Optional[str]]] = {
+    Item: (("is_active", "status", "category_id"), _item_counters, None),
+    Category: (("is_active",), _category_counters, None),
+    Rental: (("status", "rental_date", "return_date"), _rental_counters, "rentals"),
+    Reservation: (("status",), _reservation_counters, "reservations"),
+}
+
+
+def _today() -> str:
+    """일별 생성 카운터 날짜 (created_at과 같은 UTC 기준)"""
+    return datetime.utcnow().date().isoformat()
+
+
+def _created_counter(prefix: str, day: str) -> str:
+    return f"{prefix}.created.{day}"
+
+
+def _category_counter_name(category_id):
+    """카테고리별 활성 품목 카운터 이름 (SQL 식)"""
+    return literal("items.category.") + cast(category_id, String)
+
+
+def _add(deltas: Dict[str, int], counters: Dict[str, int], sign: int) -> None:
+    for name, value in counters.items():
+        deltas[name] = deltas.get(name, 0) + sign * value
+
+
+def _old_values(obj: Any, attrs: Iterable[str]) -> Dict[str, Any]:
+    """flush 전 (DB에 저장된) 속성 값"""
+    state = inspect(obj)
+    values = {}
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if history.added:
+            values[attr] = history.deleted[0] if history.deleted else None
+        else:
+            values[attr] = getattr(obj, attr)
+    return values
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_statistic_changes(session, flush_context, instances):
+    """flush 대상 중 통계에 영향을 주는 객체와 변경 전 카운터 기여분 수집"""
+    pending = []
+    for obj in session.new:
+        if type(obj) in _TRACKED_MODELS:
+            pending.append((obj, "new", {}))
+    for obj in session.dirty:
+        tracked = _TRACKED_MODELS.get(type(obj))
+        if tracked and session.is_modified(obj, include_collections=False):
+            attrs, counters, _ = tracked
+            pending.append((obj, "dirty", counters(_old_values(obj, attrs))))
+    for obj in session.deleted:
+        tracked = _TRACKED_MODELS.get(type(obj))
+        if tracked:
+            attrs, counters, _ = tracked
+            pending.append((obj, "deleted", counters(_old_values(obj, attrs))))
+    session.info[_PENDING_KEY] = pending
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_statistic_deltas(session, flush_context):
+    """flush된 변경의 카운터 증분을 트랜잭션 단위로 모음 (커밋 직전에 한 번에 반영)"""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    deltas: Dict[str, int] = {}
+    for obj, kind, old_counters in pending:
+        attrs, counters, created_prefix = _TRACKED_MODELS[type(obj)]
+        _add(deltas, old_counters, -1)
+        if kind != "deleted":
+            _add(deltas, counters({attr: getattr(obj, attr) for attr in attrs}), 1)
+        if kind == "new" and created_prefix:
+            _add(deltas, {_created_counter(created_prefix, _today()): 1}, 1)
+
+    StatisticsService.add_deltas(session, deltas)
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_statistic_deltas(session):
+    """
+    트랜잭션에서 모은 카운터 증분을 커밋 직전에 한 번 반영
+
+    카운터 행은 여러 트랜잭션이 공유하므로 업무 쓰기 중간에 잠그지 않고 커밋 직전에
+    이름 순서로 한 번에 갱신합니다 (잠금 유지 시간 단축, 트랜잭션 간 잠금 순서 통일로 교착 방지).
+    """
+    # 커밋이 flush할 변경의 증분도 포함되도록 먼저 flush
+    session.flush()
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        StatisticsService.apply_deltas(session, deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_statistic_deltas(session):
+    """롤백된 트랜잭션의 카운터 증분 폐기"""
+    session.info.pop(_DELTAS_KEY, None)
+
+
+class StatisticsService:
+    """
+    대시보드 통계 서비스
+
+    통계는 statistic_counters 테이블의 카운터에서 읽습니다. 카운터 증분은 ORM 객체 변경 시
+    flush 이벤트로, 일괄 UPDATE 작업(연체/만료 처리)에서는 add_deltas로 트랜잭션마다 모았다가
+    커밋 직전에 같은 트랜잭션 안에서 한 번 반영되며, reconcile_counters가 주기적으로 원본 테이블을
+    다시 집계해 어긋난 값을 보정합니다.
+    """
+
+    @staticmethod
+    def add_deltas(db: Session, deltas: Dict[str, int]) -> None:
+        """
+        현재 트랜잭션이 커밋될 때 반영할 카운터 증감 추가 (롤백되면 폐기)
+
+        Args:
+            db: 데이터베이스 세션
+            deltas: 카운터 이름 → 증감값
+        """
+        _add(db.info.setdefault(_DELTAS_KEY, {}), deltas, 1)
+
+    @staticmethod
+    def apply_deltas(db: Session, deltas: Dict[str, int]) -> None:
+        """
+        카운터 증감을 바로 반영 (현재 트랜잭션에서 이름 순서로 실행)
+
+        Args:
+            db: 데이터베이스 세션
+            deltas: 카운터 이름 → 증감값
+        """
+        rows = [{"name": name, "value": value} for name, value in sorted(deltas.items()) if value]
+        if not rows:
+            return
+
+        connection = db.connection()
+        dialect_insert = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+        stmt = dialect_insert(StatisticCounter).values(rows)
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[StatisticCounter.name],
+            set_={"value": StatisticCounter.value + stmt.excluded.value, "updated_at": func.now()}
+        ))
+
+    @staticmethod
+    def _read_counters(db: Session, names: List[str]) -> Dict[str, int]:
+        counters = dict.fromkeys(names, 0)
+        counters.update(db.query(StatisticCounter.name, StatisticCounter.value).filter(
+            StatisticCounter.name.in_(names)
+        ).all())
+        return counters
+
+    @staticmethod
+    def get_item_statistics(db: Session) -> dict:
+        """
+        품목 통계 조회
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            dict: 품목 통계 정보
+        """
+        statuses = [status.value for status in ItemStatus]
+        counters = StatisticsService._read_counters(
+            db, ["items.active"] + [f"items.status.{status}" for status in statuses]
+        )
+
+        # 활성 카테고리별 품목 개수
+        category_counts = db.query(Category.name, StatisticCounter.value).join(
+            StatisticCounter, StatisticCounter.name == _category_counter_name(Category.id)
+        ).filter(
+            Category.is_active == True,
+            StatisticCounter.value > 0
+        ).order_by(Category.id).all()
+
+        return {
+            "total_items": counters["items.active"],
+            "status_counts": {status: counters[f"items.status.{status}"] for status in statuses},
+            "category_counts": [
+                {"category": name, "count": count}
+                for name, count in category_counts
+            ]
+        }
+
+    @staticmethod
+    def get_category_statistics(db: Session) -> dict:
+        """
+        카테고리 통계 조회
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            dict: 카테고리 통계 정보
+        """
+        counters = StatisticsService._read_counters(db, ["categories.total", "categories.active"])
+
+        # 활성 카테고리별 활성 품목 개수
+        category_items = db.query(
+            Category.name,
+            func.coalesce(StatisticCounter.value, 0)
+        ).outerjoin(
+            StatisticCounter, StatisticCounter.name == _category_counter_name(Category.id)
+        ).filter(
+            Category.is_active == True
+        ).order_by(Category.id).all()
+
+        return {
+            "total_categories": counters["categories.total"],
+            "active_categories": counters["categories.active"],
+            "category_item_counts": [
+                {"category": name, "item_count": count}
+                for name, count in category_items
+            ]
+        }
+
+    @staticmethod
+    def get_rental_statistics(db: Session) -> dict:
+        """
+        대여 통계 조회 (관리자용)
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            dict: 대여 통계 정보
+        """
+        statuses = [status.value for status in RentalStatus]
+        today_counter = _created_counter("rentals", _today())
+        counters = StatisticsService._read_counters(
+            db,
+            ["rentals.total", "rentals.returned_days", today_counter]
+            + [f"rentals.status.{status}" for status in statuses]
+        )
+        status_counts = {status: counters[f"rentals.status.{status}"] for status in statuses}
+
+        # 반납 예정일이 지났지만 아직 연체 처리 작업이 돌지 않은 대여
+        unmarked_overdue = StatisticsService.count_unmarked_overdue(db)
+
+        returned = status_counts[RentalStatus.RETURNED.value]
+        return {
+            "total_rentals": counters["rentals.total"],
+            "status_counts": status_counts,
+            "today_rentals": counters[today_counter],
+            "active_rentals": status_counts[RentalStatus.ACTIVE.value] + status_counts[RentalStatus.OVERDUE.value],
+            "overdue_rentals": status_counts[RentalStatus.OVERDUE.value] + unmarked_overdue,
+            "average_rental_days": counters["rentals.returned_days"] / returned if returned else None
+        }
+
+    @staticmethod
+    def get_reservation_statistics(db: Session) -> dict:
+        """
+        예약 통계 조회 (관리자용)
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            dict: 예약 통계 정보
+        """
+        statuses = [status.value for status in ReservationStatus]
+        today_counter = _created_counter("reservations", _today())
+        counters = StatisticsService._read_counters(
+            db,
+            ["reservations.total", today_counter] + [f"reservations.status.{status}" for status in statuses]
+        )
+        status_counts = {status: counters[f"reservations.status.{status}"] for status in statuses}
+
+        # 만료 시간이 지났지만 아직 만료 처리 작업이 돌지 않은 예약은 활성에서 제외
+        unmarked_expired = StatisticsService.count_unmarked_expired(db)
+
+        return {
+            "total_reservations": counters["reservations.total"],
+            "status_counts": status_counts,
+            "today_reservations": counters[today_counter],
+            "active_reservations": status_counts[ReservationStatus.PENDING.value] - unmarked_expired
+        }
+
+    @staticmethod
+    def count_unmarked_overdue(db: Session) -> int:
+        """반납 예정일이 지났지만 아직 OVERDUE로 바뀌지 않은 대여 수 (연체 처리 작업의 남은 대상)"""
+        return db.query(func.count(Rental.id)).filter(
+            Rental.status == RentalStatus.ACTIVE,
+            Rental.due_date < date.today()
+        ).scalar()
+
+    @staticmethod
+    def count_unmarked_expired(db: Session) -> int:
+        """만료 시간이 지났지만 아직 PENDING인 예약 수 (예약 만료 작업의 남은 대상)"""
+        return db.query(func.count(Reservation.id)).filter(
+            Reservation.status == ReservationStatus.PENDING,
+            Reservation.expires_at < datetime.utcnow()
+        ).scalar()
+
+    @staticmethod
+    def compute_counters(db: Session) -> Dict[str, int]:
+        """원본 테이블을 전체 집계한 카운터 값 (보정 기준)"""
+        counters: Dict[str, int] = {}
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        today = today_start.date().isoformat()
+
+        # 품목 (활성 품목만)
+        item_counts = db.query(Item.status, Item.category_id, func.count(Item.id)).filter(
+            Item.is_active == True
+        ).group_by(Item.status, Item.category_id).all()
+        for status, category_id, count in item_counts:
+            _add(counters, _item_counters({"is_active": True, "status": status, "category_id": category_id}), count)
+
+        # 카테고리
+        for is_active, count in db.query(Category.is_active, func.count(Category.id)).group_by(Category.is_active).all():
+            _add(counters, _category_counters({"is_active": is_active}), count)
+
+        # 대여
+        for status, count in db.query(Rental.status, func.count(Rental.id)).group_by(Rental.status).all():
+            _add(counters, {"rentals.total": 1, f"rentals.status.{status.value}": 1}, count)
+        if db.get_bind().dialect.name == "postgresql":
+            rental_days = Rental.return_date - Rental.rental_date
+        else:
+            rental_days = func.julianday(Rental.return_date) - func.julianday(Rental.rental_date)
+        returned_days = db.query(func.sum(rental_days)).filter(
+            Rental.status == RentalStatus.RETURNED,
+            Rental.return_date.isnot(None)
+        ).scalar()
+        counters["rentals.returned_days"] = int(round(returned_days or 0))
+        counters[_created_counter("rentals", today)] = db.query(func.count(Rental.id)).filter(
+            Rental.created_at >= today_start
+        ).scalar()
+
+        # 예약
+        for status, count in db.query(Reservation.status, func.count(Reservation.id)).group_by(Reservation.status).all():
+            _add(counters, {"reservations.total": 1, f"reservations.status.{status.value}": 1}, count)
+        counters[_created_counter("reservations", today)] = db.query(func.count(Reservation.id)).filter(
+            Reservation.created_at >= today_start
+        ).scalar()
+
+        return counters
+
+    @staticmethod
+    def reconcile_counters(db: Session) -> int:
+        """
+        카운터 보정 (스케줄러용)
+
+        원본 테이블을 다시 집계해 어긋난 카운터를 고치고, 지난 날짜의 일별 카운터를 정리합니다.
+        저장된 카운터와 재집계 값은 잠금 없이 같은 스냅샷에서 읽고 (PostgreSQL은 REPEATABLE READ),
+        차이만 증감으로 반영하므로 재집계 중에 커밋된 증분 갱신도 덮어써지지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            int: 값이 보정된 카운터 개수
+        """
+        started = time.perf_counter()
+        try:
+            if not db.in_transaction() and db.get_bind().dialect.name == "postgresql":
+                db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            stored = dict(db.execute(select(StatisticCounter.name, StatisticCounter.value)).all())
+            actual = StatisticsService.compute_counters(db)
+            # 읽기 트랜잭션 종료 후 보정은 짧은 트랜잭션으로 반영
+            db.commit()
+
+            # 지난 날짜의 일별 카운터와 0이 된 카운터는 0으로 맞춘 뒤 삭제
+            stale = [name for name in stored if name not in actual]
+            corrections = {
+                name: actual.get(name, 0) - stored.get(name, 0)
+                for name in set(stored) | set(actual)
+            }
+            StatisticsService.apply_deltas(db, corrections)
+            if stale:
+                db.execute(delete(StatisticCounter).where(
+                    StatisticCounter.name.in_(stale),
+                    StatisticCounter.value == 0
+                ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            job_stats.record("reconcile_statistics", 0, time.perf_counter() - started, error=str(e))
+            raise
+
+        # 지난 일별 카운터 정리는 보정 건수에서 제외
+        drifted = [
+            name for name, value in corrections.items()
+            if value and not (name in stale and ".created." in name)
+        ]
+
+        elapsed = time.perf_counter() - started
+        job_stats.record("reconcile_statistics", len(drifted), elapsed)
+        if drifted:
+            print(f"📊 통계 보정: 카운터 {len(drifted)}개 ({', '.join(sorted(drifted)[:5])}{' ...' if len(drifted) > 5 else ''})")
+
+        return len(drifted)
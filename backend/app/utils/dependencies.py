@@ -1,9 +1,10 @@
+import hmac
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
 
-from app.db.database import get_db
+from app.core.config import settings
+from app.db.database import get_db_session, DBSession
 from app.services.auth_service import AuthService
 from app.models.user import User, UserRole
 
@@ -18,12 +19,12 @@ def get_auth_service() -> AuthService:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> User:
     """현재 인증된 사용자 조회"""
     token = credentials.credentials
-    user = auth_service.get_current_user(token, db)
+    user = await auth_service.get_current_user(token, db)
     
     if not user:
         raise HTTPException(
@@ -59,9 +60,21 @@ async def get_current_admin_user(
     return current_user
 
 
-def get_optional_current_user(
+async def require_metrics_access(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: DBSession = Depends(get_db_session),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> None:
+    """/metrics 접근 확인 (METRICS_TOKEN이 설정되어 있으면 그 토큰, 아니면 관리자 로그인 토큰)"""
+    if settings.METRICS_TOKEN and hmac.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        return
+    current_user = await get_current_user(credentials, db, auth_service)
+    await get_current_admin_user(await get_current_active_user(current_user))
+
+
+async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_db_session),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Optional[User]:
     """선택적 사용자 인증 (토큰이 없어도 에러 발생하지 않음)"""
@@ -69,7 +82,7 @@ def get_optional_current_user(
         return None
     
     token = credentials.credentials
-    return auth_service.get_current_user(token, db)
+    return await auth_service.get_current_user(token, db)
 
 
 def get_client_ip(request: Request) -> str:
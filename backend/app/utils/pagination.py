@@ -0,0 +1,92 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import DateTime, String, literal, tuple_
+from sqlalchemy.types import TypeDecorator
+
+
+class _CursorDateTime(TypeDecorator):
+    """
+    커서 시각 바인딩 타입
+
+    SQLite는 server_default(CURRENT_TIMESTAMP)로 채운 시각을 초 단위 문자열로 저장하므로,
+    같은 형식으로 바인딩해야 같은 시각의 행을 id로 올바르게 구분할 수 있습니다.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == "sqlite":
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+        return value
+
+
+def datetime_literal(value: datetime):
+    """시각 바인딩 값 (SQLite에서는 created_at 저장 형식과 같은 문자열로 비교)"""
+    return literal(value, _CursorDateTime())
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """(created_at, id) 정렬 키를 불투명한 커서 문자열로 인코딩"""
+    payload = json.dumps([created_at.isoformat() if created_at else None, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+
+
+def keyset_condition(created_at_column, id_column, cursor: str, descending: bool = True):
+    """
+    커서 이후 행만 남기는 조건 ((created_at, id) 행 값 비교)
+
+    (created_at, id) 복합 인덱스를 그대로 탐색하므로 페이지 깊이와 무관하게 일정한 비용으로 조회합니다.
+    """
+    created_at, record_id = decode_cursor(cursor)
+    key = tuple_(created_at_column, id_column)
+    bound = tuple_(datetime_literal(created_at), literal(record_id))
+    if descending:
+        return key < bound
+    return key > bound
+
+
+def keyset_order_by(created_at_column, id_column, descending: bool = True) -> tuple:
+    """커서 정렬 키와 일치하는 ORDER BY 절"""
+    if descending:
+        return created_at_column.desc(), id_column.desc()
+    return created_at_column.asc(), id_column.asc()
+
+
+def split_page(rows: List[Any], limit: int, key=lambda row: row) -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1개로 조회한 결과를 페이지와 다음 페이지 커서로 분리
+
+    Args:
+        rows: limit + 1개까지 조회한 행
+        limit: 페이지 크기
+        key: 행에서 created_at/id를 가진 모델 객체를 꺼내는 함수
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = key(page[-1])
+    return page, encode_cursor(last.created_at, last.id)
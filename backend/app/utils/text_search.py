@@ -0,0 +1,50 @@
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+# 한글은 형태소 분석 없이도 부분 검색이 되도록 글자 단위 n-gram으로 색인
+NGRAM_SIZE = 2
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """검색용 정규화 (NFKC + 소문자) - ILIKE와 같은 대소문자 무시 비교"""
+    if not text:
+        return ""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _unique(tokens: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(tokens))
+
+
+def query_tokens(term: str) -> List[str]:
+    """
+    검색어 토큰
+
+    단어마다 bigram을 만들고, 한 글자 단어는 그대로 사용합니다.
+    검색어가 포함된 품목은 반드시 이 토큰들을 모두 가집니다.
+    """
+    tokens = []
+    for word in _WORD_RE.findall(normalize_text(term)):
+        if len(word) < NGRAM_SIZE:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return _unique(tokens)
+
+
+def index_tokens(*fields: Optional[str]) -> List[str]:
+    """색인 토큰 (각 단어의 bigram + 한 글자 검색을 위한 unigram)"""
+    tokens = []
+    for field in fields:
+        for word in _WORD_RE.findall(normalize_text(field)):
+            tokens.extend(word)
+            tokens.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return _unique(tokens)
+
+
+def build_search_tokens(*fields: Optional[str]) -> str:
+    """items.search_tokens 컬럼에 저장할 공백 구분 토큰 문자열"""
+    return " ".join(index_tokens(*fields))
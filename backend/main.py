@@ -1,10 +1,25 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
 
+from app.core.audit_writer import audit_log_writer
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.core.delay_queue import reservation_expiry_queue
+from app.core.scheduler import scheduler
+from app.core.session_touch import session_touch_buffer
 from app.api.api_v1.api import api_router
-from app.db.database import create_tables
+from app.db.database import SessionLocal, create_tables, dispose_engines
+from app.services.audit_log_service import AuditLogService
+from app.services.item_search import backfill_search_tokens
+from app.services.item_service import reconcile_current_pointers
+from app.services.rental_service import RentalService
+from app.services.reservation_service import ReservationService
+from app.services.statistics_service import StatisticsService
+from app.utils.dependencies import require_metrics_access
 
 
 @asynccontextmanager
@@ -13,8 +28,63 @@ async def lifespan(app: FastAPI):
     # Startup
     await create_tables()
     print("Database tables created")
+    # 이전 프로세스가 기록하지 못한 감사 로그 복구
+    audit_log_writer.recover()
+    with SessionLocal() as db:
+        backfilled = backfill_search_tokens(db)
+    if backfilled:
+        print(f"Search tokens backfilled for {backfilled} items")
+    with SessionLocal() as db:
+        repaired = reconcile_current_pointers(db)
+    if repaired:
+        print(f"Current rental/reservation pointers repaired for {repaired} items")
+    background_tasks = [
+        asyncio.create_task(session_touch_buffer.run()),
+        asyncio.create_task(audit_log_writer.run()),
+    ]
+    if settings.SCHEDULER_ENABLED:
+        scheduler.add_job(
+            "expire_reservations",
+            ReservationService.expire_reservations,
+            settings.RESERVATION_EXPIRE_INTERVAL_SECONDS,
+            backlog=StatisticsService.count_unmarked_expired
+        )
+        scheduler.add_job(
+            "mark_overdue_rentals",
+            RentalService.mark_overdue_rentals,
+            settings.RENTAL_OVERDUE_INTERVAL_SECONDS,
+            backlog=StatisticsService.count_unmarked_overdue
+        )
+        scheduler.add_job(
+            "reconcile_statistics",
+            StatisticsService.reconcile_counters,
+            settings.STATISTICS_RECONCILE_SECONDS
+        )
+        # 다음 달 파티션 생성 및 보존 기간이 지난 감사 로그 보관
+        scheduler.add_job(
+            "audit_log_retention",
+            AuditLogService.apply_retention,
+            settings.AUDIT_LOG_RETENTION_INTERVAL_SECONDS
+        )
+        scheduler.start()
+        
+        # 예약별 만료 시각에 맞춘 만료 처리 (스케줄러 작업은 큐가 놓친 예약만 처리)
+        with SessionLocal() as db:
+            ReservationService.schedule_pending_expirations(db)
+        background_tasks.append(asyncio.create_task(reservation_expiry_queue.run(
+            lambda db, reservation_ids: ReservationService.expire_reservations(db, reservation_ids=reservation_ids)
+        )))
     yield
     # Shutdown
+    await scheduler.stop()
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await reservation_expiry_queue.flush()
+    await session_touch_buffer.flush()
+    audit_log_writer.close()
+    await dispose_engines()
     print("Application shutdown")
 
 
@@ -35,6 +105,7 @@ app = FastAPI(
     - `/items`: 품목 관리
     - `/reservations`: 예약 관리
     - `/rentals`: 대여 관리
+    - `/audit-logs`: 감사 로그 조회 및 내보내기 (관리자 전용)
 
     ### 권한 구조
     - **학생**: 품목 조회, 예약 생성/취소, 본인 대여 이력 조회
@@ -54,6 +125,8 @@ app = FastAPI(
         "name": "MIT License"
     },
     lifespan=lifespan,
+    # response_model 직렬화 결과를 json.dumps 대신 orjson으로 인코딩
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -65,6 +138,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (경로별 압축률/CPU 시간은 /metrics의 compression 항목)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -75,6 +158,12 @@ async def health_check():
     return {"status": "healthy", "message": "렌탈 관리 시스템이 정상 작동 중입니다."}
 
 
+@app.get("/metrics", dependencies=[Depends(require_metrics_access)])
+async def metrics():
+    """현재 워커 프로세스의 런타임 메트릭 (DB 커넥션 풀 등, 관리자 또는 METRICS_TOKEN 필요)"""
+    return metrics_registry.collect()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+동기/비동기 DB 경로 부하 벤치마크 스크립트
+실행 중인 API 서버의 조회 엔드포인트에 동시 요청을 보내 처리량과 지연 시간을 측정합니다.
+
+사용 예:
+    # 1) 동기 경로 (기본값)
+    USE_ASYNC_DB=False uvicorn main:app --workers 1
+    python3 scripts/benchmark_db_path.py --token <JWT> --label sync
+
+    # 2) 비동기 경로
+    USE_ASYNC_DB=True uvicorn main:app --workers 1
+    python3 scripts/benchmark_db_path.py --token <JWT> --label async
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_ENDPOINTS = ["/api/v1/items/available", "/api/v1/reservations"]
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def run_endpoint(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    """단일 엔드포인트에 대해 동시 요청 실행"""
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": total,
+        "errors": errors,
+        "rps": total / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 경로 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API 서버 주소")
+    parser.add_argument("--token", required=True, help="Bearer 토큰")
+    parser.add_argument("--requests", type=int, default=2000, help="엔드포인트별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--endpoint", action="append", help="측정할 경로 (여러 번 지정 가능)")
+    parser.add_argument("--label", default="", help="결과 표시용 라벨 (예: sync, async)")
+    args = parser.parse_args()
+
+    endpoints = args.endpoint or DEFAULT_ENDPOINTS
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    print(f"🚀 벤치마크 시작 [{args.label or args.base_url}] - 동시성 {args.concurrency}, 요청 {args.requests}개")
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {args.token}"},
+        limits=limits,
+        timeout=60,
+    ) as client:
+        # 워밍업 (연결 풀 및 캐시 준비)
+        for path in endpoints:
+            await client.get(path)
+
+        for path in endpoints:
+            result = await run_endpoint(client, path, args.requests, args.concurrency)
+            print(
+                f"  {result['path']:<32} {result['rps']:>8.1f} req/s  "
+                f"p50 {result['p50_ms']:>7.1f}ms  p95 {result['p95_ms']:>7.1f}ms  "
+                f"p99 {result['p99_ms']:>7.1f}ms  errors {result['errors']}"
+            )
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
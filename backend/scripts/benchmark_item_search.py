@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+품목 검색 벤치마크 스크립트
+ILIKE 단독 조회와 검색 색인(PostgreSQL GIN / SQLite 프로세스 내 색인) 조회의 지연 시간을 비교합니다.
+
+품목 수별로 벤치마크 전용 카테고리 아래에 품목을 대량 생성하고, 측정이 끝나면 삭제합니다.
+운영 DB에서는 실행하지 마세요.
+
+사용 예:
+    python3 scripts/benchmark_item_search.py --sizes 10000 100000
+    python3 scripts/benchmark_item_search.py --sizes 10000 --terms 배터리 우산 PWR
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import os
+import time
+
+from sqlalchemy import func, insert, or_
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.db.database import SessionLocal, create_tables
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.services.item_search import search_condition, search_index
+from app.utils.text_search import build_search_tokens
+
+BENCH_CATEGORY = "search-benchmark"
+BENCH_SERIAL_PREFIX = "BENCH-SEARCH-"
+
+BRANDS = ["삼성", "엘지", "애플", "샤오미", "로지텍", "앤커", "소니", "캐논"]
+NOUNS = ["보조배터리", "충전기", "노트북", "우산", "농구공", "보드게임", "텐트", "계산기", "카메라", "삼각대", "멀티탭", "마우스"]
+ADJECTIVES = ["대용량", "휴대용", "고속", "접이식", "무선", "방수", "경량", "학습용"]
+DEFAULT_TERMS = ["보조배터리", "우산", "무선 마우스", "충전", "PWR0012", "존재하지않는품목"]
+
+
+def setup(db, size: int) -> None:
+    """벤치마크 카테고리와 품목 생성 (검색 토큰 포함)"""
+    category = Category(name=BENCH_CATEGORY, is_active=False)
+    db.add(category)
+    db.flush()
+
+    rng = random.Random(size)
+    rows = []
+    for n in range(size):
+        name = f"{rng.choice(BRANDS)} {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"
+        description = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} 대여 물품 {n}"
+        serial_number = f"{BENCH_SERIAL_PREFIX}PWR{n:07d}"
+        rows.append({
+            "category_id": category.id,
+            "name": name,
+            "description": description,
+            "serial_number": serial_number,
+            "status": ItemStatus.AVAILABLE,
+            "is_active": True,
+            # Core insert는 매퍼 이벤트를 거치지 않으므로 토큰을 직접 계산
+            "search_tokens": build_search_tokens(name, description, serial_number),
+        })
+    for offset in range(0, len(rows), 5000):
+        db.execute(insert(Item), rows[offset:offset + 5000])
+    db.commit()
+
+
+def cleanup(db) -> None:
+    """벤치마크 데이터 삭제"""
+    db.query(Item).filter(Item.serial_number.like(f"{BENCH_SERIAL_PREFIX}%")).delete(synchronize_session=False)
+    db.query(Category).filter(Category.name == BENCH_CATEGORY).delete(synchronize_session=False)
+    db.commit()
+
+
+def like_condition(term: str):
+    """색인 도입 전 검색 조건 (ILIKE 3개)"""
+    search_term = f"%{term}%"
+    return or_(
+        Item.name.ilike(search_term),
+        Item.description.ilike(search_term),
+        Item.serial_number.ilike(search_term)
+    )
+
+
+def run_query(db, condition) -> int:
+    """목록 화면과 같은 형태의 조회 (총 개수 + 첫 페이지 20개)"""
+    total = db.query(func.count(Item.id)).filter(condition).scalar()
+    db.query(Item.id).filter(condition).order_by(Item.id).limit(20).all()
+    return total
+
+
+def measure(db, build_condition, term: str, repeat: int) -> dict:
+    """같은 검색을 반복 실행해 지연 시간 측정 (조건 생성 시간 포함)"""
+    latencies = []
+    total = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        total = run_query(db, build_condition(term))
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": statistics.median(latencies), "max_ms": max(latencies), "total": total}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="품목 검색 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="품목 수 목록")
+    parser.add_argument("--terms", nargs="+", default=DEFAULT_TERMS, help="검색어 목록")
+    parser.add_argument("--repeat", type=int, default=10, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    asyncio.run(create_tables())
+
+    db = SessionLocal()
+    dialect = db.get_bind().dialect.name
+    print(f"🗄️  데이터베이스: {dialect}")
+    try:
+        for size in args.sizes:
+            cleanup(db)
+            print(f"\n📦 품목 {size}개 생성 중...")
+            setup(db, size)
+            if dialect == "sqlite":
+                search_index.rebuild(db)
+                print(f"   프로세스 내 색인 구성: {search_index.stats()['last_build_ms']:.1f}ms")
+
+            for term in args.terms:
+                baseline = measure(db, like_condition, term, args.repeat)
+                indexed = measure(db, lambda t: search_condition(db, t), term, args.repeat)
+                if baseline["total"] != indexed["total"]:
+                    print(f"  ❌ 결과 불일치: '{term}' ILIKE {baseline['total']}건 / 색인 {indexed['total']}건")
+                speedup = baseline["median_ms"] / indexed["median_ms"] if indexed["median_ms"] else 0.0
+                print(
+                    f"  {term:<14} {baseline['total']:>7}건  "
+                    f"ILIKE {baseline['median_ms']:>9.3f}ms  색인 {indexed['median_ms']:>9.3f}ms  (x{speedup:.1f})"
+                )
+    finally:
+        print("\n🧹 벤치마크 데이터 정리 중...")
+        cleanup(db)
+        db.close()
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 벤치마크 스크립트
+품목/대여/예약 목록 한 페이지(기본 1000행)를 응답 바이트로 만드는 시간을 두 경로로 비교합니다.
+
+- ORM 경로: ORM 객체 조회(joinedload) → 행마다 model_validate 후 속성 대입
+            → FastAPI 기본 응답 처리 (response_model 재검증 → dict 변환 → json.dumps)
+- 튜플 경로: 필요한 컬럼만 튜플로 조회 → 행 dict를 목록 모델 생성 시 한 번에 검증
+            → pydantic 직렬화기로 바로 JSON 바이트 생성 (목록 엔드포인트의 현재 경로)
+
+벤치마크 전용 사용자/카테고리/품목과 대여/예약 이력을 만들고, 측정이 끝나면 모두 삭제합니다
+(--keep 지정 시 유지). 운영 DB에서는 실행하지 마세요.
+
+사용 예:
+    python3 scripts/benchmark_list_serialization.py --rows 1000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+from datetime import date, datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.responses import json_response
+from app.db.database import SessionLocal, create_tables
+from app.models.user import User
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.rental import Rental, RentalStatus
+from app.models.reservation import Reservation, ReservationStatus
+from app.schemas.item import ItemList, ItemResponse
+from app.schemas.rental import RentalList
+from app.schemas.reservation import ReservationList
+from app.services.item_service import ItemService
+from app.services.rental_service import RentalService
+from app.services.reservation_service import ReservationService
+from app.utils.pagination import keyset_order_by
+
+BENCH_STUDENT_ID = "BENCH-SERIAL"
+BENCH_NAME = "serialization-benchmark"
+
+_ITEM_PAGE = TypeAdapter(ItemList)
+_RENTAL_PAGE = TypeAdapter(RentalList)
+_RESERVATION_PAGE = TypeAdapter(ReservationList)
+
+
+def setup(db, rows: int) -> tuple:
+    """벤치마크용 사용자/카테고리/품목과 대여/예약 이력 생성 후 (사용자 ID, 카테고리 ID) 반환"""
+    user = User(student_id=BENCH_STUDENT_ID, name=BENCH_NAME, department=BENCH_NAME, is_active=False)
+    category = Category(name=BENCH_NAME, is_active=False)
+    db.add_all([user, category])
+    db.flush()
+
+    db.execute(insert(Item), [
+        {
+            "category_id": category.id,
+            "name": f"{BENCH_NAME} {n}",
+            "description": "직렬화 벤치마크용 품목",
+            "serial_number": f"{BENCH_STUDENT_ID}-{n:06d}",
+            "status": ItemStatus.MAINTENANCE,
+            "is_active": False,
+            "item_metadata": {"color": "black", "index": n},
+        }
+        for n in range(rows)
+    ])
+    item_ids = [item_id for (item_id,) in db.query(Item.id).filter(Item.category_id == category.id)]
+
+    today = date.today()
+    db.execute(insert(Rental), [
+        {
+            "user_id": user.id,
+            "item_id": item_id,
+            "rental_date": today - timedelta(days=n % 10),
+            "due_date": today + timedelta(days=3 - n % 7),
+            "status": RentalStatus.ACTIVE if n % 2 else RentalStatus.RETURNED,
+            "return_date": None if n % 2 else today,
+            "notes": "벤치마크 대여",
+        }
+        for n, item_id in enumerate(item_ids)
+    ])
+    db.execute(insert(Reservation), [
+        {
+            "user_id": user.id,
+            "item_id": item_id,
+            "expires_at": datetime.utcnow() + timedelta(hours=1),
+            "status": ReservationStatus.PENDING if n % 2 else ReservationStatus.CANCELLED,
+            "notes": "벤치마크 예약",
+        }
+        for n, item_id in enumerate(item_ids)
+    ])
+    db.commit()
+    return user.id, category.id
+
+
+def cleanup(db) -> None:
+    """벤치마크 데이터 삭제"""
+    user = db.query(User).filter(User.student_id == BENCH_STUDENT_ID).first()
+    if user:
+        db.query(Rental).filter(Rental.user_id == user.id).delete(synchronize_session=False)
+        db.query(Reservation).filter(Reservation.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+    category = db.query(Category).filter(Category.name == BENCH_NAME).first()
+    if category:
+        db.query(Item).filter(Item.category_id == category.id).delete(synchronize_session=False)
+        db.delete(category)
+    db.commit()
+
+
+def fastapi_default_body(adapter: TypeAdapter, value) -> bytes:
+    """엔드포인트가 모델을 반환할 때 FastAPI가 거치는 단계 (재검증 → JSON 호환 dict → json.dumps)"""
+    content = adapter.dump_python(adapter.validate_python(value), mode="json")
+    return JSONResponse(content).body
+
+
+def orm_items(db, category_id: int, rows: int) -> ItemList:
+    items = db.query(Item).options(joinedload(Item.category)).filter(
+        Item.category_id == category_id
+    ).order_by(*keyset_order_by(Item.created_at, Item.id, descending=False)).limit(rows).all()
+    responses = []
+    for item in items:
+        item_data = ItemResponse.model_validate(item)
+        item_data.category_name = item.category.name if item.category else None
+        responses.append(item_data)
+    return ItemList(
+        items=responses, total=len(responses),
+        available_count=0, rented_count=0, reserved_count=0, maintenance_count=len(responses)
+    )
+
+
+def tuple_items(db, category_id: int, rows: int) -> ItemList:
+    page = ItemService._listing_page_query(db).filter(Item.category_id == category_id).limit(rows).all()
+    return ItemList(
+        items=[row._asdict() for row in page], total=len(page),
+        available_count=0, rented_count=0, reserved_count=0, maintenance_count=len(page)
+    )
+
+
+def orm_rentals(db, user_id: int, rows: int) -> RentalList:
+    rentals = db.query(Rental).options(
+        joinedload(Rental.user),
+        joinedload(Rental.item).joinedload(Item.category)
+    ).filter(Rental.user_id == user_id).order_by(
+        *keyset_order_by(Rental.created_at, Rental.id)
+    ).limit(rows).all()
+    responses = [RentalService._build_rental_response(rental) for rental in rentals]
+    return RentalList(
+        rentals=responses, total=len(responses),
+        active_count=0, returned_count=0, overdue_count=0, lost_count=0
+    )
+
+
+def tuple_rentals(db, user_id: int, rows: int) -> RentalList:
+    page = RentalService._list_query(db.query(Rental).filter(Rental.user_id == user_id)).order_by(
+        *keyset_order_by(Rental.created_at, Rental.id)
+    ).limit(rows).all()
+    today = date.today()
+    return RentalList(
+        rentals=[RentalService._build_list_entry(row, today) for row in page], total=len(page),
+        active_count=0, returned_count=0, overdue_count=0, lost_count=0
+    )
+
+
+def orm_reservations(db, user_id: int, rows: int) -> ReservationList:
+    reservations = db.query(Reservation).options(
+        joinedload(Reservation.user),
+        joinedload(Reservation.item).joinedload(Item.category)
+    ).filter(Reservation.user_id == user_id).order_by(
+        *keyset_order_by(Reservation.created_at, Reservation.id)
+    ).limit(rows).all()
+    responses = [ReservationService._build_reservation_response(reservation) for reservation in reservations]
+    return ReservationList(
+        reservations=responses, total=len(responses),
+        pending_count=0, confirmed_count=0, cancelled_count=0, expired_count=0
+    )
+
+
+def tuple_reservations(db, user_id: int, rows: int) -> ReservationList:
+    page = ReservationService._list_query(db.query(Reservation).filter(Reservation.user_id == user_id)).order_by(
+        *keyset_order_by(Reservation.created_at, Reservation.id)
+    ).limit(rows).all()
+    now = datetime.utcnow()
+    return ReservationList(
+        reservations=[ReservationService._build_list_entry(row, now) for row in page], total=len(page),
+        pending_count=0, confirmed_count=0, cancelled_count=0, expired_count=0
+    )
+
+
+def measure(db, build, encode, repeat: int) -> dict:
+    """조회+모델 생성 / 인코딩 시간을 반복 측정"""
+    build_ms, encode_ms = [], []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = build()
+        built = time.perf_counter()
+        body = encode(value)
+        build_ms.append((built - started) * 1000)
+        encode_ms.append((time.perf_counter() - built) * 1000)
+        # 요청마다 세션을 새로 여는 API와 같은 조건이 되도록 identity map 초기화
+        db.expunge_all()
+    totals = sorted(b + e for b, e in zip(build_ms, encode_ms))
+    return {
+        "build_ms": statistics.median(build_ms),
+        "encode_ms": statistics.median(encode_ms),
+        "total_ms": statistics.median(totals),
+        "p95_ms": totals[min(len(totals) - 1, int(len(totals) * 0.95))],
+        "bytes": len(body),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="페이지 행 수 (목록 API 최대 limit은 1000)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 데이터 유지")
+    args = parser.parse_args()
+
+    asyncio.run(create_tables())
+
+    db = SessionLocal()
+    try:
+        cleanup(db)
+        print(f"📦 품목/대여/예약 각 {args.rows}건 생성 중...")
+        user_id, category_id = setup(db, args.rows)
+
+        cases = [
+            ("items", _ITEM_PAGE,
+             lambda: orm_items(db, category_id, args.rows), lambda: tuple_items(db, category_id, args.rows)),
+            ("rentals", _RENTAL_PAGE,
+             lambda: orm_rentals(db, user_id, args.rows), lambda: tuple_rentals(db, user_id, args.rows)),
+            ("reservations", _RESERVATION_PAGE,
+             lambda: orm_reservations(db, user_id, args.rows), lambda: tuple_reservations(db, user_id, args.rows)),
+        ]
+
+        print(f"⏱️  {args.rows}행 페이지, {args.repeat}회 반복 (중앙값)")
+        print(f"  {'목록':<14} {'경로':<6} {'조회+모델 ms':>12} {'인코딩 ms':>10} {'합계 ms':>9} {'p95 ms':>9} {'KB':>8}")
+        for name, adapter, orm_build, tuple_build in cases:
+            orm = measure(db, orm_build, lambda value: fastapi_default_body(adapter, value), args.repeat)
+            compact = measure(db, tuple_build, lambda value: json_response(adapter, value).body, args.repeat)
+            if orm["bytes"] != compact["bytes"]:
+                print(f"  ⚠️  {name}: 응답 크기가 다릅니다 ({orm['bytes']} / {compact['bytes']} bytes)")
+            for label, result in (("ORM", orm), ("튜플", compact)):
+                print(
+                    f"  {name:<14} {label:<6} {result['build_ms']:>12.2f} {result['encode_ms']:>10.2f} "
+                    f"{result['total_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['bytes'] / 1024:>8.1f}"
+                )
+            print(f"  {name:<14} {'배율':<6} {'':>12} {'':>10} {orm['total_ms'] / compact['total_ms']:>8.1f}x")
+    finally:
+        if not args.keep:
+            print("🧹 벤치마크 데이터 정리 중...")
+            cleanup(db)
+        db.close()
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+offset / keyset 페이지네이션 벤치마크 스크립트
+대여 이력 테이블에서 1페이지와 깊은 페이지(기본 500페이지)의 조회 지연 시간을 비교합니다.
+
+벤치마크 전용 사용자/카테고리/품목을 만들고 그 아래에 대여 이력을 대량 생성한 뒤,
+측정이 끝나면 모두 삭제합니다 (--keep 지정 시 유지). 운영 DB에서는 실행하지 마세요.
+
+사용 예:
+    python3 scripts/benchmark_pagination.py --rentals 50000 --page-size 50 --deep-page 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.db.database import SessionLocal, create_tables
+from app.models.user import User
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.rental import Rental, RentalStatus
+from app.utils.pagination import keyset_condition, keyset_order_by, split_page
+
+BENCH_STUDENT_ID = "BENCH-PAGE"
+BENCH_NAME = "pagination-benchmark"
+
+
+def setup(db, rentals: int) -> int:
+    """벤치마크용 사용자/품목과 대여 이력 생성 후 사용자 ID 반환"""
+    user = User(student_id=BENCH_STUDENT_ID, name=BENCH_NAME, department=BENCH_NAME, is_active=False)
+    category = Category(name=BENCH_NAME, is_active=False)
+    db.add_all([user, category])
+    db.flush()
+    item = Item(
+        name=BENCH_NAME, serial_number=BENCH_STUDENT_ID, category_id=category.id,
+        status=ItemStatus.MAINTENANCE, is_active=False
+    )
+    db.add(item)
+    db.flush()
+
+    start = date.today() - timedelta(days=365)
+    rows = [
+        {
+            "user_id": user.id,
+            "item_id": item.id,
+            "rental_date": start,
+            "due_date": start + timedelta(days=7),
+            "return_date": start + timedelta(days=3),
+            "status": RentalStatus.RETURNED,
+        }
+        for _ in range(rentals)
+    ]
+    for offset in range(0, len(rows), 5000):
+        db.execute(insert(Rental), rows[offset:offset + 5000])
+    db.commit()
+    return user.id
+
+
+def cleanup(db) -> None:
+    """벤치마크 데이터 삭제"""
+    user = db.query(User).filter(User.student_id == BENCH_STUDENT_ID).first()
+    if user:
+        db.query(Rental).filter(Rental.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+    db.query(Item).filter(Item.serial_number == BENCH_STUDENT_ID).delete(synchronize_session=False)
+    db.query(Category).filter(Category.name == BENCH_NAME).delete(synchronize_session=False)
+    db.commit()
+
+
+def base_query(db, user_id: int):
+    return db.query(Rental).filter(Rental.user_id == user_id)
+
+
+def fetch_offset(db, user_id: int, page: int, page_size: int) -> list:
+    """offset 방식 페이지 조회 (RentalService.get_rentals의 offset 모드와 같은 쿼리)"""
+    return base_query(db, user_id).order_by(
+        *keyset_order_by(Rental.created_at, Rental.id)
+    ).offset((page - 1) * page_size).limit(page_size + 1).all()
+
+
+def fetch_keyset(db, user_id: int, cursor, page_size: int) -> list:
+    """keyset 방식 페이지 조회 (RentalService.get_rentals의 cursor 모드와 같은 쿼리)"""
+    query = base_query(db, user_id)
+    if cursor:
+        query = query.filter(keyset_condition(Rental.created_at, Rental.id, cursor))
+    return query.order_by(
+        *keyset_order_by(Rental.created_at, Rental.id)
+    ).limit(page_size + 1).all()
+
+
+def cursor_for_page(db, user_id: int, page: int, page_size: int):
+    """커서를 따라가며 지정 페이지의 시작 커서를 구함"""
+    cursor = None
+    for _ in range(page - 1):
+        rows, cursor = split_page(fetch_keyset(db, user_id, cursor, page_size), page_size)
+        db.expunge_all()
+        if cursor is None:
+            raise SystemExit(f"❌ 데이터가 {page}페이지보다 적습니다. --rentals 값을 늘리세요.")
+    return cursor
+
+
+def measure(db, func, repeat: int) -> dict:
+    """같은 조회를 반복 실행해 지연 시간 측정"""
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - started) * 1000)
+        db.expunge_all()
+    latencies.sort()
+    return {
+        "median_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지네이션 벤치마크")
+    parser.add_argument("--rentals", type=int, default=50_000, help="생성할 대여 이력 수")
+    parser.add_argument("--page-size", type=int, default=50, help="페이지 크기")
+    parser.add_argument("--deep-page", type=int, default=500, help="비교할 깊은 페이지 번호")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 데이터 유지")
+    args = parser.parse_args()
+
+    if args.rentals < args.page_size * args.deep_page:
+        parser.error("--rentals 값은 --page-size × --deep-page 이상이어야 합니다")
+
+    asyncio.run(create_tables())
+
+    db = SessionLocal()
+    try:
+        cleanup(db)
+        print(f"📦 대여 이력 {args.rentals}건 생성 중...")
+        user_id = setup(db, args.rentals)
+
+        deep_cursor = cursor_for_page(db, user_id, args.deep_page, args.page_size)
+        cases = [
+            ("offset  page 1", lambda: fetch_offset(db, user_id, 1, args.page_size)),
+            (f"offset  page {args.deep_page}", lambda: fetch_offset(db, user_id, args.deep_page, args.page_size)),
+            ("keyset  page 1", lambda: fetch_keyset(db, user_id, None, args.page_size)),
+            (f"keyset  page {args.deep_page}", lambda: fetch_keyset(db, user_id, deep_cursor, args.page_size)),
+        ]
+
+        print(f"⏱️  페이지 크기 {args.page_size}, {args.repeat}회 반복")
+        for label, func in cases:
+            result = measure(db, func, args.repeat)
+            print(f"  {label:<18} median {result['median_ms']:>8.3f}ms  p95 {result['p95_ms']:>8.3f}ms")
+    finally:
+        if not args.keep:
+            print("🧹 벤치마크 데이터 정리 중...")
+            cleanup(db)
+        db.close()
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+응답 인코딩 벤치마크 스크립트
+app/schemas의 목록 응답 스키마마다 한 페이지(기본 1000개 항목)를 응답 바이트로 만드는
+시간과 최대 메모리 사용량을 인코딩 방식별로 비교합니다.
+
+- JSONResponse: 이전 기본 응답 클래스 (response_model 재검증 → JSON 호환 dict → json.dumps)
+- ORJSONResponse: 현재 기본 응답 클래스 (재검증 → JSON 호환 dict → orjson.dumps)
+- dump_json: json_response (pydantic 직렬화기로 바로 JSON 바이트 생성)
+- stream: json_list_response의 스트리밍 경로 (LIST_STREAM_CHUNK_SIZE개씩 인코딩)
+
+항목은 각 응답 스키마의 예시 값(json_schema_extra)을 복제해 만들며 DB는 사용하지 않습니다.
+메모리는 tracemalloc으로 따로 한 번 측정합니다 (측정 중에는 속도가 느려지므로 시간과 분리).
+
+사용 예:
+    python3 scripts/benchmark_response_encoding.py --rows 1000 --repeat 20 --chunk-size 200
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+import tracemalloc
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.responses import iter_list_json, json_response
+from app.schemas.audit_log import AuditLogList
+from app.schemas.category import CategoryList
+from app.schemas.item import ItemList
+from app.schemas.rental import RentalList
+from app.schemas.reservation import ReservationList
+from app.schemas.user import UserList
+
+# (스키마, 항목 목록 필드)
+LIST_SCHEMAS = [
+    (CategoryList, "categories"),
+    (ItemList, "items"),
+    (RentalList, "rentals"),
+    (ReservationList, "reservations"),
+    (AuditLogList, "audit_logs"),
+    (UserList, "users"),
+]
+
+# 예시 값이 없는 응답 스키마용 항목
+FALLBACK_EXAMPLES = {
+    "User": {
+        "id": 1,
+        "student_id": "20231234",
+        "name": "김학생",
+        "department": "컴퓨터공학과",
+        "email": "student@example.com",
+        "phone": "010-1234-5678",
+        "role": "STUDENT",
+        "is_active": True,
+        "last_login_at": "2025-08-29T10:30:00Z",
+        "created_at": "2025-03-02T09:00:00Z",
+        "updated_at": None,
+    },
+}
+
+
+def build_page(schema, field: str, rows: int):
+    """응답 스키마 예시 항목을 rows개 복제한 목록 응답 생성 (정수 필드는 rows, 나머지는 기본값)"""
+    entry_model = schema.model_fields[field].annotation.__args__[0]
+    example = (entry_model.model_config.get("json_schema_extra") or {}).get("example")
+    example = example or FALLBACK_EXAMPLES[entry_model.__name__]
+    data = {field: [dict(example, id=n + 1) for n in range(rows)]}
+    for name, info in schema.model_fields.items():
+        if name != field and info.is_required():
+            data[name] = rows
+    return schema.model_validate(data)
+
+
+def streamed_body(value, field: str, chunk_size: int) -> bytes:
+    """스트리밍 응답 본문 전체 (바이트 비교용)"""
+    return b"".join(iter_list_json(value, field, chunk_size))
+
+
+def drain_stream(value, field: str, chunk_size: int) -> int:
+    """조각을 전송하듯 하나씩 버리며 본문 크기 반환"""
+    return sum(len(chunk) for chunk in iter_list_json(value, field, chunk_size))
+
+
+def encoders(adapter: TypeAdapter, field: str, chunk_size: int) -> list:
+    """(이름, 인코딩 함수) 목록 - 인코딩 함수는 응답 본문 크기를 반환"""
+    def default_body(response_class):
+        # serialize_response가 하는 재검증과 JSON 호환 dict 변환을 거친 뒤 응답 클래스로 인코딩
+        return lambda value: len(response_class(
+            adapter.dump_python(adapter.validate_python(value), mode="json")
+        ).body)
+
+    return [
+        ("JSONResponse", default_body(JSONResponse)),
+        ("ORJSONResponse", default_body(ORJSONResponse)),
+        ("dump_json", lambda value: len(json_response(adapter, value).body)),
+        ("stream", lambda value: drain_stream(value, field, chunk_size)),
+    ]
+
+
+def measure(encode, value, repeat: int) -> dict:
+    """인코딩 시간 반복 측정 후 최대 메모리 사용량을 한 번 측정"""
+    encode(value)  # 워밍업 (직렬화기/스키마 캐시)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = encode(value)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+
+    tracemalloc.start()
+    encode(value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "peak_kb": peak / 1024,
+        "bytes": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 인코딩 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="페이지 항목 수 (목록 API 최대 limit은 1000)")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--chunk-size", type=int, default=200, help="스트리밍 조각당 항목 수 (LIST_STREAM_CHUNK_SIZE)")
+    args = parser.parse_args()
+
+    print(f"⏱️  {args.rows}개 항목 페이지, {args.repeat}회 반복 (중앙값), 스트리밍 조각 {args.chunk_size}개")
+    print(f"  {'스키마':<16} {'인코딩':<15} {'ms':>9} {'p95 ms':>9} {'최대 KB':>10} {'본문 KB':>9}")
+    for schema, field in LIST_SCHEMAS:
+        value = build_page(schema, field, args.rows)
+        adapter = TypeAdapter(schema)
+        if streamed_body(value, field, args.chunk_size) != adapter.dump_json(value):
+            print(f"  ⚠️  {schema.__name__}: 스트리밍 본문이 dump_json 결과와 다릅니다")
+
+        results = [(name, measure(encode, value, args.repeat)) for name, encode in encoders(adapter, field, args.chunk_size)]
+        baseline = results[0][1]["median_ms"]
+        for name, result in results:
+            print(
+                f"  {schema.__name__:<16} {name:<15} {result['median_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                f"{result['peak_kb']:>10.1f} {result['bytes'] / 1024:>9.1f}  ({baseline / result['median_ms']:.1f}x)"
+            )
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
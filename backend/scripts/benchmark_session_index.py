@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+세션 전체 삭제(logout-everywhere) 벤치마크 스크립트
+KEYS 패턴 검색 방식과 사용자별 세션 인덱스 방식의 조회 지연 시간을 비교합니다.
+
+벤치마크용 세션은 운영 사용자와 겹치지 않는 사용자 ID 대역에 생성되고 종료 시 삭제됩니다.
+운영 Redis가 아닌 별도 인스턴스/DB에서 실행하세요.
+
+사용 예:
+    python3 scripts/benchmark_session_index.py --redis-url redis://localhost:6379/15 --sessions 100000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import os
+import time
+
+import redis
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.security import get_session_key, get_session_index_key
+
+BENCH_USER_ID_BASE = 900_000_000  # 벤치마크 전용 사용자 ID 대역
+SESSION_TTL_SECONDS = 3600
+
+
+def populate(client: redis.Redis, sessions: int, users: int) -> None:
+    """세션 해시와 사용자별 인덱스를 파이프라인으로 생성"""
+    now_epoch = time.time()
+    pipe = client.pipeline(transaction=False)
+    for n in range(sessions):
+        user_id = BENCH_USER_ID_BASE + (n % users)
+        token = f"benchmark-token-{n:012d}"
+        session_key = get_session_key(user_id, token)
+        index_key = get_session_index_key(user_id)
+        pipe.hset(session_key, mapping={"user_id": str(user_id), "token": token})
+        pipe.expire(session_key, SESSION_TTL_SECONDS)
+        pipe.zadd(index_key, {session_key: now_epoch + SESSION_TTL_SECONDS})
+        pipe.expire(index_key, SESSION_TTL_SECONDS)
+        if n % 5000 == 4999:
+            pipe.execute()
+    pipe.execute()
+
+
+def measure(label: str, func, user_ids: list) -> dict:
+    """사용자별 세션 키 조회 지연 시간 측정"""
+    latencies = []
+    found = 0
+    for user_id in user_ids:
+        started = time.perf_counter()
+        found += len(func(user_id))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    return {
+        "label": label,
+        "mean_ms": statistics.fmean(latencies),
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "keys_found": found,
+    }
+
+
+def cleanup(client: redis.Redis, users: int) -> None:
+    """벤치마크 데이터 삭제 (인덱스 기반)"""
+    for offset in range(users):
+        index_key = get_session_index_key(BENCH_USER_ID_BASE + offset)
+        session_keys = client.zrange(index_key, 0, -1)
+        client.delete(index_key, *session_keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 인덱스 벤치마크")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15", help="벤치마크용 Redis 주소")
+    parser.add_argument("--sessions", type=int, default=100_000, help="생성할 세션 수")
+    parser.add_argument("--users", type=int, default=20_000, help="세션을 나눠 가질 사용자 수")
+    parser.add_argument("--samples", type=int, default=200, help="측정할 사용자 수")
+    args = parser.parse_args()
+
+    client = redis.from_url(args.redis_url, decode_responses=True)
+
+    print(f"📦 세션 {args.sessions}개 생성 중 (사용자 {args.users}명)...")
+    populate(client, args.sessions, args.users)
+    print(f"   Redis 전체 키 수: {client.dbsize()}")
+
+    user_ids = [BENCH_USER_ID_BASE + random.randrange(args.users) for _ in range(args.samples)]
+    try:
+        results = [
+            measure("KEYS session:{user_id}:*", lambda uid: client.keys(f"session:{uid}:*"), user_ids),
+            measure("ZRANGE user_sessions:{user_id}", lambda uid: client.zrange(get_session_index_key(uid), 0, -1), user_ids),
+        ]
+        for result in results:
+            print(
+                f"  {result['label']:<34} mean {result['mean_ms']:>8.3f}ms  "
+                f"p99 {result['p99_ms']:>8.3f}ms  (찾은 키 {result['keys_found']}개)"
+            )
+    finally:
+        print("🧹 벤치마크 데이터 정리 중...")
+        cleanup(client, args.users)
+
+    print("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+쓰기 경로 지연 시간 벤치마크 스크립트
+품목 생성/수정, 예약 생성/확인, 대여 연장/반납을 서비스 계층에서 반복 실행하며
+작업별 지연 시간과 작업 1회당 커밋 수, SQL 문 수를 측정합니다.
+
+점검용 카테고리/사용자/품목을 생성하고 종료 시 삭제합니다. 운영 DB에서는 실행하지 마세요.
+커밋 비용(fsync)이 결과에 반영되도록 파일 기반 SQLite 또는 PostgreSQL에서 실행하세요.
+
+사용 예:
+    DATABASE_URL=sqlite:///./bench.db python3 scripts/benchmark_write_paths.py
+    python3 scripts/benchmark_write_paths.py --iterations 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.audit_writer import audit_log_writer
+from app.core.config import settings
+from app.db.database import SessionLocal, create_tables, engine
+from app.models.audit_log import AuditLog
+from app.models.category import Category
+from app.models.item import Item
+from app.models.rental import Rental
+from app.models.reservation import Reservation
+from app.models.user import User, UserRole
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.rental import RentalExtend, RentalReturn
+from app.schemas.reservation import ReservationConfirm, ReservationCreate
+from app.services.item_service import ItemService
+from app.services.rental_service import RentalService
+from app.services.reservation_service import ReservationService
+from app.services.statistics_service import StatisticsService
+
+BENCH_PREFIX = "BENCH-WRITE-"
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class WriteCounter:
+    """엔진 이벤트로 커밋/SQL 실행 횟수 집계"""
+
+    def __init__(self):
+        self.commits = 0
+        self.statements = 0
+
+    def on_commit(self, conn):
+        self.commits += 1
+
+    def on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+    @contextmanager
+    def listening(self):
+        event.listen(engine, "commit", self.on_commit)
+        event.listen(engine, "before_cursor_execute", self.on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "commit", self.on_commit)
+            event.remove(engine, "before_cursor_execute", self.on_execute)
+
+
+def setup(db, run_id: str):
+    """점검용 카테고리, 관리자, 학생 생성"""
+    category = Category(name=f"{BENCH_PREFIX}{run_id}")
+    admin = User(student_id=f"A{run_id}", name="벤치관리자", department="벤치", role=UserRole.ADMIN)
+    student = User(student_id=f"S{run_id}", name="벤치학생", department="벤치", role=UserRole.STUDENT)
+    db.add_all([category, admin, student])
+    db.commit()
+    return category.id, admin.id, student.id
+
+
+def cleanup(db, run_id: str) -> None:
+    """점검 데이터 삭제"""
+    item_ids = db.query(Item.id).filter(Item.serial_number.like(f"{BENCH_PREFIX}{run_id}-%"))
+    user_ids = db.query(User.id).filter(User.student_id.in_([f"A{run_id}", f"S{run_id}"]))
+    db.query(AuditLog).filter(AuditLog.user_id.in_(user_ids)).delete(synchronize_session=False)
+    # 품목의 현재 대여/예약 포인터가 대여/예약을 참조하므로 먼저 해제
+    db.query(Item).filter(Item.id.in_(item_ids)).update(
+        {"current_rental_id": None, "current_reservation_id": None}, synchronize_session=False
+    )
+    db.query(Rental).filter(Rental.item_id.in_(item_ids)).delete(synchronize_session=False)
+    db.query(Reservation).filter(Reservation.item_id.in_(item_ids)).delete(synchronize_session=False)
+    db.query(Item).filter(Item.serial_number.like(f"{BENCH_PREFIX}{run_id}-%")).delete(synchronize_session=False)
+    db.query(User).filter(User.student_id.in_([f"A{run_id}", f"S{run_id}"])).delete(synchronize_session=False)
+    db.query(Category).filter(Category.name == f"{BENCH_PREFIX}{run_id}").delete(synchronize_session=False)
+    db.commit()
+
+
+def run_iteration(db, run_id: str, n: int, category_id: int, admin_id: int, student_id: int):
+    """품목 하나로 생성 → 수정 → 예약 → 수령 확인(대여 생성) → 연장 → 반납 순서의 (작업명, 함수) 목록"""
+    state = {}
+
+    def create_item():
+        state["item"] = ItemService.create_item(db, ItemCreate(
+            name=f"벤치 품목 {n}",
+            serial_number=f"{BENCH_PREFIX}{run_id}-{n}",
+            category_id=category_id
+        ), admin_id)
+
+    def update_item():
+        ItemService.update_item(db, state["item"].id, ItemUpdate(description=f"수정 {n}"), admin_id)
+
+    def create_reservation():
+        state["reservation"] = ReservationService.create_reservation(
+            db, ReservationCreate(item_id=state["item"].id), student_id
+        )
+
+    def confirm_reservation():
+        ReservationService.confirm_reservation(db, state["reservation"].id, ReservationConfirm(), admin_id)
+        state["rental_id"] = db.query(Rental.id).filter(Rental.item_id == state["item"].id).scalar()
+
+    def extend_rental():
+        RentalService.extend_rental(db, state["rental_id"], RentalExtend(extend_days=1), admin_id)
+
+    def return_rental():
+        RentalService.return_rental(db, state["rental_id"], RentalReturn(), admin_id)
+
+    return [
+        ("create_item", create_item),
+        ("update_item", update_item),
+        ("create_reservation", create_reservation),
+        ("confirm_reservation", confirm_reservation),
+        ("extend_rental", extend_rental),
+        ("return_rental", return_rental),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쓰기 경로 지연 시간 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="작업별 반복 횟수 (반복마다 새 품목 사용)")
+    args = parser.parse_args()
+
+    asyncio.run(create_tables())
+
+    run_id = uuid.uuid4().hex[:8].upper()
+    latencies = defaultdict(list)
+    commits = defaultdict(int)
+    statements = defaultdict(int)
+    errors = defaultdict(int)
+    counter = WriteCounter()
+
+    db = SessionLocal()
+    try:
+        category_id, admin_id, student_id = setup(db, run_id)
+
+        with counter.listening():
+            for n in range(args.iterations):
+                # 요청마다 세션을 새로 여는 API와 같은 조건이 되도록 세션 비움 (identity map 초기화)
+                db.close()
+                for name, operation in run_iteration(db, run_id, n, category_id, admin_id, student_id):
+                    counter.commits = counter.statements = 0
+                    started = time.perf_counter()
+                    try:
+                        operation()
+                    except Exception as e:
+                        db.rollback()
+                        errors[name] += 1
+                        if errors[name] == 1:
+                            print(f"  ⚠️  {name}: {type(e).__name__}: {e}")
+                        break
+                    latencies[name].append((time.perf_counter() - started) * 1000)
+                    commits[name] += counter.commits
+                    statements[name] += counter.statements
+    finally:
+        db.rollback()
+        # 큐에 남은 감사 로그를 기록한 뒤 정리 (정리 후 기록되면 점검 로그가 남음)
+        audit_log_writer.close()
+        cleanup(db, run_id)
+        StatisticsService.reconcile_counters(db)
+        db.close()
+
+    print(f"📊 쓰기 경로 {args.iterations}회 ({settings.DATABASE_URL.split(':', 1)[0]})")
+    print(f"  {'작업':<20} {'p50 ms':>8} {'p95 ms':>8} {'평균 ms':>8} {'커밋/회':>8} {'SQL/회':>8} {'오류':>5}")
+    for name, values in latencies.items():
+        values.sort()
+        runs = len(values)
+        print(
+            f"  {name:<20} {percentile(values, 50):>8.2f} {percentile(values, 95):>8.2f} "
+            f"{statistics.fmean(values):>8.2f} {commits[name] / runs:>8.1f} {statements[name] / runs:>8.1f} "
+            f"{errors[name]:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+감사 로그 파티션 마이그레이션 스크립트
+기존 audit_logs 테이블의 단일 컬럼 인덱스를 제거하고 복합 인덱스를 만듭니다.
+PostgreSQL에서는 일반 테이블을 created_at 기준 월별 범위 파티션 테이블로 변환합니다.
+
+변환은 트랜잭션 하나로 실행되며 그동안 audit_logs에 대한 쓰기가 막힙니다 (감사 로그 기록기는 재시도함).
+여러 번 실행해도 결과가 같습니다 (멱등). 실행 전에 DB를 백업하세요.
+
+사용 예:
+    python3 scripts/migrate_audit_log_partitions.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import settings
+from app.db.audit_partitions import (
+    AUDIT_TABLE, add_months, ensure_partitions, is_partitioned, month_start, partitioned_table,
+    supports_partitioning
+)
+from app.db.database import create_tables, engine
+
+LEGACY_TABLE = f"{AUDIT_TABLE}_legacy"
+
+# 복합 인덱스로 대체된 단일 컬럼 인덱스
+LEGACY_INDEXES = [
+    "ix_audit_logs_id",
+    "ix_audit_logs_user_id",
+    "ix_audit_logs_action",
+    "ix_audit_logs_table_name",
+    "ix_audit_logs_record_id",
+]
+
+
+def drop_legacy_indexes(connection: Connection) -> int:
+    """단일 컬럼 인덱스 제거"""
+    existing = {index["name"] for index in inspect(connection).get_indexes(AUDIT_TABLE)}
+    dropped = 0
+    for name in LEGACY_INDEXES:
+        if name in existing:
+            connection.execute(text(f"DROP INDEX {name}"))
+            dropped += 1
+    return dropped
+
+
+def convert_to_partitioned(connection: Connection) -> int:
+    """
+    일반 테이블을 월별 파티션 테이블로 변환 (PostgreSQL) → 옮긴 행 수
+
+    기존 테이블 이름을 바꾸고 인덱스/기본 키/시퀀스 이름을 비운 뒤, 같은 이름의 파티션 테이블을 만들어
+    모든 행을 복사합니다. id는 그대로 유지하고 시퀀스는 최대 id 다음부터 이어집니다.
+    """
+    connection.execute(text(f"ALTER TABLE {AUDIT_TABLE} RENAME TO {LEGACY_TABLE}"))
+
+    # 인덱스/기본 키/시퀀스 이름은 스키마 전체에서 유일해야 하므로 새 테이블과 겹치지 않게 정리
+    inspector = inspect(connection)
+    for index in inspector.get_indexes(LEGACY_TABLE):
+        connection.execute(text(f"DROP INDEX {index['name']}"))
+    primary_key = inspector.get_pk_constraint(LEGACY_TABLE).get("name")
+    if primary_key:
+        connection.execute(text(f"ALTER TABLE {LEGACY_TABLE} DROP CONSTRAINT {primary_key}"))
+    sequence = connection.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": LEGACY_TABLE}
+    ).scalar()
+    if sequence:
+        connection.execute(text(f"ALTER SEQUENCE {sequence} RENAME TO {LEGACY_TABLE}_id_seq"))
+
+    connection.execute(CreateTable(partitioned_table()))
+
+    # 파티션 경계는 UTC 기준
+    oldest = connection.execute(text(f"SELECT MIN(created_at) FROM {LEGACY_TABLE}")).scalar()
+    current = month_start(datetime.utcnow())
+    first_month = add_months(current, -1)
+    if oldest:
+        first_month = min(first_month, month_start(oldest.astimezone(timezone.utc)))
+    ensure_partitions(connection, first_month, add_months(current, settings.AUDIT_LOG_PARTITION_PREMAKE_MONTHS))
+
+    columns = ", ".join(column.name for column in partitioned_table().columns if column.name != "created_at")
+    copied = connection.execute(text(
+        f"INSERT INTO {AUDIT_TABLE} ({columns}, created_at) "
+        f"SELECT {columns}, COALESCE(created_at, now()) FROM {LEGACY_TABLE}"
+    )).rowcount
+    connection.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{AUDIT_TABLE}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {AUDIT_TABLE}), 0) + 1, false)"
+    ))
+    connection.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+    return copied
+
+
+def main():
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        if not inspect(connection).has_table(AUDIT_TABLE):
+            print("audit_logs 테이블이 없습니다 (앱 시작 시 새 구조로 생성됨)")
+            return
+
+        if supports_partitioning(connection) and not is_partitioned(connection):
+            copied = convert_to_partitioned(connection)
+            print(f"✅ 월별 파티션 테이블로 변환: {copied}건 복사")
+        else:
+            dropped = drop_legacy_indexes(connection)
+            print(f"✅ 단일 컬럼 인덱스 {dropped}개 제거")
+
+    # 복합 인덱스와 앞으로 쓸 월 파티션 생성
+    asyncio.run(create_tables())
+    print(f"완료 ({time.perf_counter() - started:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+세션 인덱스 마이그레이션 스크립트
+사용자별 세션 인덱스(user_sessions:{user_id}) 도입 이전에 생성된 세션 키를 인덱스에 등록합니다.
+
+KEYS 대신 SCAN으로 점진적으로 순회하므로 운영 중에도 Redis를 막지 않으며,
+여러 번 실행해도 결과가 같습니다 (멱등).
+
+사용 예:
+    python3 scripts/migrate_session_index.py
+    python3 scripts/migrate_session_index.py --redis-url redis://localhost:6379 --batch-size 1000
+"""
+
+import argparse
+import sys
+import os
+import time
+
+import redis
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import settings
+from app.core.security import get_session_index_key
+
+
+def migrate(client: redis.Redis, batch_size: int) -> dict:
+    """기존 session:* 키를 사용자별 인덱스에 등록"""
+    scanned = 0
+    indexed = 0
+    skipped = 0
+    now_epoch = time.time()
+
+    keys = []
+    for session_key in client.scan_iter(match="session:*", count=batch_size):
+        keys.append(session_key)
+        if len(keys) >= batch_size:
+            result = _index_batch(client, keys, now_epoch)
+            indexed += result[0]
+            skipped += result[1]
+            scanned += len(keys)
+            keys = []
+            print(f"  ... {scanned}개 키 처리")
+
+    if keys:
+        result = _index_batch(client, keys, now_epoch)
+        indexed += result[0]
+        skipped += result[1]
+        scanned += len(keys)
+
+    return {"scanned": scanned, "indexed": indexed, "skipped": skipped}
+
+
+def _index_batch(client: redis.Redis, keys: list, now_epoch: float) -> tuple:
+    """키 묶음의 TTL을 조회한 뒤 인덱스에 일괄 등록"""
+    pipe = client.pipeline(transaction=False)
+    for session_key in keys:
+        pipe.ttl(session_key)
+    ttls = pipe.execute()
+
+    indexed = 0
+    skipped = 0
+    pipe = client.pipeline(transaction=False)
+    for session_key, ttl in zip(keys, ttls):
+        parts = session_key.split(":")
+        # session:{user_id}:{token_suffix} 형식이 아니거나 이미 만료된 키는 건너뜀
+        if len(parts) != 3 or not parts[1].isdigit() or ttl == -2:
+            skipped += 1
+            continue
+
+        index_key = get_session_index_key(int(parts[1]))
+        if ttl == -1:
+            # TTL 없는 세션은 기본 만료 시간으로 간주
+            ttl = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+            pipe.expire(session_key, ttl)
+
+        pipe.zadd(index_key, {session_key: now_epoch + ttl})
+        pipe.expire(index_key, ttl, nx=True)
+        pipe.expire(index_key, ttl, gt=True)
+        indexed += 1
+    pipe.execute()
+
+    return indexed, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 인덱스 마이그레이션")
+    parser.add_argument("--redis-url", default=settings.REDIS_URL, help="Redis 주소")
+    parser.add_argument("--batch-size", type=int, default=1000, help="SCAN/파이프라인 묶음 크기")
+    args = parser.parse_args()
+
+    client = redis.from_url(args.redis_url, decode_responses=True)
+
+    print("🔄 세션 인덱스 마이그레이션 시작...")
+    started = time.perf_counter()
+    result = migrate(client, args.batch_size)
+    elapsed = time.perf_counter() - started
+    print(
+        f"✅ 완료: {result['scanned']}개 키 확인, {result['indexed']}개 인덱싱, "
+        f"{result['skipped']}개 건너뜀 ({elapsed:.2f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+예약 생성 동시성 스트레스 테스트 스크립트
+점검용 품목 하나에 여러 사용자가 동시에 예약을 요청했을 때 정확히 하나만 성공하는지 확인하고
+처리량과 지연 시간을 출력합니다.
+
+스레드마다 별도 DB 연결(NullPool)을 사용하므로 실제 동시 트랜잭션과 같은 조건에서 실행됩니다.
+성공한 예약이 하나가 아니면 종료 코드 1로 끝나므로 CI에서 그대로 사용할 수 있습니다.
+점검용 카테고리/품목/사용자는 종료 시 삭제합니다. 운영 DB에서는 실행하지 마세요.
+
+사용 예:
+    python3 scripts/stress_reservations.py
+    python3 scripts/stress_reservations.py --requests 500 --workers 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.audit_writer import audit_log_writer
+from app.core.config import settings
+from app.db.database import create_tables
+from app.models.audit_log import AuditLog
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.reservation import Reservation
+from app.models.user import User, UserRole
+from app.schemas.reservation import ReservationCreate
+from app.services.reservation_service import ReservationService
+from app.services.statistics_service import StatisticsService
+
+STRESS_PREFIX = "STRESS-RSV-"
+
+
+def percentile(values: list, pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def build_session_factory() -> sessionmaker:
+    """스레드마다 자기 연결을 쓰는 세션 팩토리 (앱 엔진의 SQLite StaticPool은 연결 하나를 공유함)"""
+    if settings.DATABASE_URL.startswith("sqlite"):
+        stress_engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False, "timeout": 30},
+            poolclass=NullPool,
+        )
+    else:
+        stress_engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    return sessionmaker(autocommit=False, autoflush=False, bind=stress_engine)
+
+
+def setup(db, run_id: str, users: int):
+    """점검용 카테고리, 예약 가능한 품목 1개, 사용자 생성"""
+    category = Category(name=f"{STRESS_PREFIX}{run_id}")
+    db.add(category)
+    db.flush()
+
+    item = Item(
+        category_id=category.id,
+        name=f"스트레스 테스트 품목 {run_id}",
+        serial_number=f"{STRESS_PREFIX}{run_id}",
+        status=ItemStatus.AVAILABLE,
+    )
+    db.add(item)
+
+    db.execute(insert(User), [
+        {
+            "student_id": f"S{run_id}{n:05d}",
+            "name": f"부하테스트{n}",
+            "department": "부하테스트",
+            "role": UserRole.STUDENT,
+            "is_active": True,
+        }
+        for n in range(users)
+    ])
+    db.commit()
+
+    user_ids = [user_id for (user_id,) in db.query(User.id).filter(
+        User.student_id.like(f"S{run_id}%")
+    ).order_by(User.id)]
+    return category.id, item.id, user_ids
+
+
+def cleanup(db, run_id: str) -> None:
+    """점검 데이터 삭제"""
+    user_ids = db.query(User.id).filter(User.student_id.like(f"S{run_id}%"))
+    db.query(AuditLog).filter(AuditLog.user_id.in_(user_ids)).delete(synchronize_session=False)
+    # 품목의 현재 예약 포인터가 예약을 참조하므로 먼저 해제
+    db.query(Item).filter(Item.serial_number == f"{STRESS_PREFIX}{run_id}").update(
+        {"current_reservation_id": None}, synchronize_session=False
+    )
+    db.query(Reservation).filter(Reservation.user_id.in_(user_ids)).delete(synchronize_session=False)
+    db.query(User).filter(User.student_id.like(f"S{run_id}%")).delete(synchronize_session=False)
+    db.query(Item).filter(Item.serial_number == f"{STRESS_PREFIX}{run_id}").delete(synchronize_session=False)
+    db.query(Category).filter(Category.name == f"{STRESS_PREFIX}{run_id}").delete(synchronize_session=False)
+    db.commit()
+
+
+def reserve(session_factory: sessionmaker, item_id: int, user_id: int):
+    """예약 1건 요청 → (결과, 지연 시간 ms)"""
+    started = time.perf_counter()
+    with session_factory() as db:
+        try:
+            ReservationService.create_reservation(db, ReservationCreate(item_id=item_id), user_id)
+            outcome = "success"
+        except ValueError:
+            outcome = "rejected"
+        except Exception as e:
+            outcome = f"error: {type(e).__name__}: {e}".splitlines()[0]
+    return outcome, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 생성 동시성 스트레스 테스트")
+    parser.add_argument("--requests", type=int, default=500, help="동시 예약 요청 수 (요청마다 다른 사용자)")
+    parser.add_argument("--workers", type=int, default=100, help="동시 실행 스레드 수")
+    args = parser.parse_args()
+
+    asyncio.run(create_tables())
+
+    session_factory = build_session_factory()
+    run_id = uuid.uuid4().hex[:8].upper()
+    db = session_factory()
+    try:
+        _, item_id, user_ids = setup(db, run_id, args.requests)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(lambda user_id: reserve(session_factory, item_id, user_id), user_ids))
+        elapsed = time.perf_counter() - started
+
+        outcomes = [outcome for outcome, _ in results]
+        latencies = sorted(latency for _, latency in results)
+        successes = outcomes.count("success")
+        rejected = outcomes.count("rejected")
+        errors = [outcome for outcome in outcomes if outcome.startswith("error")]
+
+        reservation_ids = [
+            reservation_id for reservation_id, in db.query(Reservation.id).filter(Reservation.item_id == item_id)
+        ]
+        reservations = len(reservation_ids)
+        item = db.get(Item, item_id)
+        item_status = item.status
+        # 품목의 현재 예약 포인터는 성공한 예약을 가리켜야 함
+        pointer_ok = reservation_ids == [item.current_reservation_id]
+
+        print(f"📊 예약 요청 {len(outcomes)}건 ({args.workers} 스레드, {settings.DATABASE_URL.split(':', 1)[0]})")
+        print(f"  성공: {successes}  거절: {rejected}  오류: {len(errors)}")
+        print(
+            f"  생성된 예약: {reservations}  품목 상태: {item_status.value}  품목 버전: {item.version_id}  "
+            f"현재 예약 ID: {item.current_reservation_id}"
+        )
+        print(f"  처리량: {len(outcomes) / elapsed:,.1f} req/s (총 {elapsed:.2f}초)")
+        print(
+            f"  지연 시간: p50 {percentile(latencies, 50):.1f} ms  p99 {percentile(latencies, 99):.1f} ms  "
+            f"평균 {statistics.fmean(latencies):.1f} ms"
+        )
+        for error in sorted(set(errors))[:5]:
+            print(f"  ⚠️  {error}")
+    finally:
+        # 큐에 남은 감사 로그를 기록한 뒤 정리 (정리 후 기록되면 점검 로그가 남음)
+        audit_log_writer.close()
+        cleanup(db, run_id)
+        StatisticsService.reconcile_counters(db)
+        db.close()
+
+    if successes != 1 or reservations != 1 or item_status != ItemStatus.RESERVED or not pointer_ok:
+        print("❌ 동시 예약 중 정확히 하나만 성공해야 합니다")
+        sys.exit(1)
+
+    print("✅ 동시 예약 중 정확히 하나만 성공했습니다")
+
+
+if __name__ == "__main__":
+    main()
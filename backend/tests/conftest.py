@@ -0,0 +1,32 @@
+import asyncio
+import os
+import sys
+import tempfile
+
+import pytest
+
+# 앱 모듈을 import하기 전에 테스트용 설정 지정 (임시 SQLite DB, 연결되지 않는 Redis)
+_DB_DIR = tempfile.mkdtemp(prefix="rental-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ.setdefault("REDIS_URL", "redis://localhost:1")
+os.environ["USE_ASYNC_DB"] = "False"
+os.environ["SCHEDULER_ENABLED"] = "False"
+os.environ["DEBUG"] = "False"
+os.environ["AUDIT_LOG_WAL_DIR"] = ""
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.db.database import Base, SessionLocal, create_tables, engine  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """테스트마다 빈 테이블을 만든 세션"""
+    asyncio.run(create_tables())
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
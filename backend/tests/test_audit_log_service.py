@@ -0,0 +1,63 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.core.config import settings
+from app.models.audit_log import AuditLog
+from app.services import audit_log_service
+from app.services.audit_log_service import AuditLogService
+
+OLD_DATES = [datetime(2025, 3, day, 9) for day in (3, 10, 17)]
+LIVE_DATES = [datetime(2026, 9, day, 9) for day in (1, 5, 10, 15, 20)]
+
+
+@pytest.fixture
+def archived_logs(db, tmp_path, monkeypatch):
+    """보존 기간이 지난 3건은 보관 파일로, 최근 5건은 DB에 있는 감사 로그"""
+    monkeypatch.setattr(settings, "AUDIT_LOG_ARCHIVE_DIR", str(tmp_path))
+    db.add_all([
+        AuditLog(action="ITEM_UPDATED", table_name="items", record_id=n, created_at=created_at)
+        for n, created_at in enumerate(OLD_DATES + LIVE_DATES)
+    ])
+    db.commit()
+    result = AuditLogService.apply_retention(db, now=datetime(2026, 10, 15))
+    assert result["rows_archived"] == len(OLD_DATES)
+
+    opened = []
+    read_archive = audit_log_service._read_archive
+
+    def spy(month):
+        opened.append(month)
+        return read_archive(month)
+
+    monkeypatch.setattr(audit_log_service, "_read_archive", spy)
+    return opened
+
+
+def _record_ids(logs):
+    return [log["record_id"] for log in logs]
+
+
+def test_newest_first_page_does_not_open_archives(db, archived_logs):
+    logs = AuditLogService.query_logs(db, limit=3)
+
+    assert _record_ids(logs) == [7, 6, 5]
+    assert archived_logs == []
+
+
+def test_reads_archives_after_live_rows(db, archived_logs):
+    assert _record_ids(AuditLogService.query_logs(db, limit=100)) == [7, 6, 5, 4, 3, 2, 1, 0]
+    assert archived_logs == [date(2025, 3, 1)]
+    assert _record_ids(AuditLogService.iter_logs(db, descending=False)) == [0, 1, 2, 3, 4, 5, 6, 7]
+
+
+def test_skips_rows_present_in_both_archive_and_table(db, archived_logs):
+    # 보관 파일을 쓴 뒤 DB에서 삭제하기 전에 중단된 월
+    rows = [
+        {column.name: getattr(log, column.name) for column in AuditLog.__table__.columns}
+        for log in db.query(AuditLog).order_by(AuditLog.created_at, AuditLog.id)
+    ]
+    audit_log_service._write_archive(date(2026, 9, 1), rows)
+
+    assert _record_ids(AuditLogService.query_logs(db, limit=100)) == [7, 6, 5, 4, 3, 2, 1, 0]
+    assert _record_ids(AuditLogService.iter_logs(db, descending=False)) == [0, 1, 2, 3, 4, 5, 6, 7]
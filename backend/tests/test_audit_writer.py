@@ -0,0 +1,86 @@
+import json
+
+from sqlalchemy.exc import OperationalError
+
+from app.core import audit_writer
+from app.core.audit_writer import AuditLogWriter
+from app.models.audit_log import AuditLog
+
+
+def _writer(tmp_path, **overrides) -> AuditLogWriter:
+    options = {"batch_size": 500, "flush_seconds": 60.0, "max_pending": 1000, "wal_dir": str(tmp_path)}
+    options.update(overrides)
+    return AuditLogWriter(**options)
+
+
+def test_flush_moves_failing_rows_to_dead_letter(db, tmp_path):
+    writer = _writer(tmp_path)
+    for n in range(9):
+        # action NOT NULL 위반 - 몇 번 재시도해도 기록할 수 없는 로그
+        writer.record(action=None if n in (2, 6) else "ITEM_UPDATED", table_name="items", record_id=n)
+
+    assert writer.flush() == 7
+    assert writer.written == 7
+    assert writer.dead_lettered == 2
+    assert writer.stats()["pending"] == 0
+    assert [record_id for (record_id,) in db.query(AuditLog.record_id).order_by(AuditLog.id)] == [0, 1, 3, 4, 5, 7, 8]
+    dead = [json.loads(line) for line in (tmp_path / "dead-letter.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [row["record_id"] for row in dead] == [2, 6]
+
+    # 다음 로그는 막히지 않고 기록됨
+    writer.record(action="ITEM_UPDATED", table_name="items", record_id=9)
+    assert writer.flush() == 1
+    writer.close()
+
+
+def test_backpressure_flush_is_rate_limited_and_spills_oldest_to_wal(db, tmp_path, monkeypatch):
+    writer = _writer(tmp_path, max_pending=3)
+    attempts = []
+
+    def failing_insert(rows):
+        attempts.append(len(rows))
+        raise OperationalError("INSERT", {}, Exception("database is down"))
+
+    monkeypatch.setattr(writer, "_insert", failing_insert)
+    for n in range(10):
+        writer.record(action="ITEM_UPDATED", table_name="items", record_id=n)
+
+    assert len(attempts) == 1
+    assert writer.backpressure_flushes == 1
+    assert writer.spilled == 7
+    assert writer.dropped == 0
+    assert writer.stats()["pending"] == 3
+    # 큐가 가득 찬 동안은 넘친 로그를 다시 기록하지 않음
+    assert writer.replay_overflow() == 0
+
+    monkeypatch.undo()
+    assert writer.flush() == 3
+    assert writer.replay_overflow() == 7
+    assert [record_id for (record_id,) in db.query(AuditLog.record_id).order_by(AuditLog.id)] == [7, 8, 9, 0, 1, 2, 3, 4, 5, 6]
+    assert not list(tmp_path.glob("audit-*.wal"))
+    writer.close()
+
+
+def test_overflow_is_dropped_without_wal(db, monkeypatch):
+    writer = AuditLogWriter(batch_size=500, flush_seconds=60.0, max_pending=3, wal_dir=None)
+
+    def failing_insert(rows):
+        raise OperationalError("INSERT", {}, Exception("database is down"))
+
+    monkeypatch.setattr(writer, "_insert", failing_insert)
+    for n in range(5):
+        writer.record(action="ITEM_UPDATED", table_name="items", record_id=n)
+
+    assert writer.dropped == 2
+    assert writer.spilled == 0
+    assert writer.replay_overflow() == 0
+
+
+def test_wal_is_disabled_without_fcntl(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_writer, "fcntl", None)
+    writer = _writer(tmp_path)
+    writer.record(action="ITEM_UPDATED", table_name="items", record_id=1)
+
+    assert writer.wal_dir is None
+    assert not list(tmp_path.iterdir())
+    assert writer.flush() == 1
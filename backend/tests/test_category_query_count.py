@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.services.category_service import CategoryService
+
+ITEMS_PER_CATEGORY = 3
+
+
+@contextmanager
+def count_queries(db):
+    """블록 안에서 실행된 SQL 문 목록"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _seed(db, size: int) -> list:
+    """카테고리 size개와 카테고리당 품목 생성 (마지막 품목은 비활성)"""
+    categories = [Category(name=f"카테고리 {n:04d}") for n in range(size)]
+    db.add_all(categories)
+    db.flush()
+    db.execute(insert(Item), [
+        {
+            "category_id": category.id,
+            "name": f"품목 {category.id}-{n}",
+            "serial_number": f"QC{category.id}-{n}",
+            "status": ItemStatus.AVAILABLE,
+            "is_active": n < ITEMS_PER_CATEGORY - 1,
+        }
+        for category in categories
+        for n in range(ITEMS_PER_CATEGORY)
+    ])
+    db.commit()
+    db.expire_all()
+    return [category.id for category in categories]
+
+
+@pytest.mark.parametrize("size", [1, 10, 50])
+def test_get_categories_query_count_is_constant(db, size):
+    _seed(db, size)
+
+    # 개수 조회 + 활성 품목 개수를 포함한 목록 조회 (카테고리 수와 무관, N+1 없음)
+    with count_queries(db) as statements:
+        result = CategoryService.get_categories(db, skip=0, limit=size + 10)
+
+    assert len(statements) == 2
+    assert len(result.categories) == size
+    assert all(category.active_items_count == ITEMS_PER_CATEGORY - 1 for category in result.categories)
+
+
+def test_get_category_uses_single_query(db):
+    [category_id] = _seed(db, 1)
+
+    with count_queries(db) as statements:
+        category = CategoryService.get_category(db, category_id)
+
+    assert len(statements) == 1
+    assert category.active_items_count == ITEMS_PER_CATEGORY - 1
@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from app.core.delay_queue import DelayQueue
+
+
+def test_changes_are_not_buffered_without_consumer():
+    # 소비 루프가 없으면 모아 둔 변경을 반영할 곳이 없으므로 바로 Redis에 씀
+    # (conftest의 REDIS_URL은 연결되지 않는 주소)
+    queue = DelayQueue("test:expiry", max_wait_seconds=1.0)
+    queue.schedule(1, datetime.utcnow())
+    queue.discard(2)
+
+    stats = queue.stats()
+    assert stats["pending_writes"] == 0
+    assert stats["redis_errors"] == 2
@@ -0,0 +1,33 @@
+from app.models.category import Category
+from app.models.item import Item
+from app.services.item_search import search_index
+from app.utils.text_search import query_tokens
+
+
+def _candidates(db, term: str) -> set:
+    return search_index.candidates(db, query_tokens(term))
+
+
+def test_search_index_follows_committed_changes_only(db):
+    category = Category(name="테스트")
+    db.add(category)
+    db.commit()
+    search_index.rebuild(db)
+
+    # 롤백된 품목은 색인에 남지 않음
+    db.add(Item(name="무선마우스", serial_number="SRCH001", category_id=category.id))
+    db.flush()
+    db.rollback()
+    assert _candidates(db, "무선마우스") == set()
+
+    item = Item(name="무선마우스", serial_number="SRCH002", category_id=category.id)
+    db.add(item)
+    db.flush()
+    assert _candidates(db, "무선마우스") == set()  # 커밋 전에는 반영하지 않음
+    db.commit()
+    assert _candidates(db, "무선마우스") == {item.id}
+
+    item_id = item.id
+    db.delete(item)
+    db.commit()
+    assert item_id not in _candidates(db, "무선마우스")
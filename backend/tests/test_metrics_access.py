@@ -0,0 +1,15 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from main import app
+
+
+def test_metrics_requires_token_or_admin(db, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong-token"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert "unit_of_work" in response.json()
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.core.job_stats import job_stats
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.user import User
+from app.schemas.reservation import ReservationCancel
+from app.services.reservation_service import ReservationService, expiry_horizon
+
+
+def _seed_overdue_reservations(db, count: int) -> list:
+    """만료 시각이 지난 PENDING 예약 count건 생성 후 ID 목록 반환"""
+    user = User(student_id="T0001", name="테스트", department="테스트학과")
+    category = Category(name="테스트")
+    db.add_all([user, category])
+    db.flush()
+    items = [
+        Item(name=f"품목 {n}", serial_number=f"EXP{n:03d}", category_id=category.id, status=ItemStatus.RESERVED)
+        for n in range(count)
+    ]
+    db.add_all(items)
+    db.flush()
+    reservations = [
+        Reservation(
+            user_id=user.id, item_id=item.id, status=ReservationStatus.PENDING,
+            expires_at=datetime.utcnow() - timedelta(minutes=5)
+        )
+        for item in items
+    ]
+    db.add_all(reservations)
+    db.flush()
+    for item, reservation in zip(items, reservations):
+        item.current_reservation_id = reservation.id
+    db.commit()
+    return [reservation.id for reservation in reservations]
+
+
+@pytest.mark.parametrize("by_id", [False, True])
+def test_expire_reservations_processes_every_chunk(db, by_id):
+    reservation_ids = _seed_overdue_reservations(db, 5)
+
+    expired = ReservationService.expire_reservations(
+        db, chunk_size=2, reservation_ids=reservation_ids if by_id else None
+    )
+
+    assert expired == 5
+    db.expire_all()
+    assert {status for (status,) in db.query(Reservation.status)} == {ReservationStatus.EXPIRED}
+    items = db.query(Item).all()
+    assert {item.status for item in items} == {ItemStatus.AVAILABLE}
+    assert all(item.current_reservation_id is None for item in items)
+
+
+def test_release_expired_reservations_rolls_back_on_failure(db, monkeypatch):
+    _seed_overdue_reservations(db, 1)
+    failures = job_stats.snapshot().get("release_expired_reservations", {}).get("failures", 0)
+
+    def fail_midway(db):
+        db.add(Category(name="롤백 대상"))
+        db.flush()
+        raise RuntimeError("expire failed")
+
+    monkeypatch.setattr(expiry_horizon, "_due_at", None)
+    monkeypatch.setattr(ReservationService, "expire_reservations", staticmethod(fail_midway))
+    assert ReservationService.release_expired_reservations(db) == 0
+
+    # 실패한 트랜잭션은 롤백되고 세션은 계속 사용 가능
+    assert db.query(Category).filter(Category.name == "롤백 대상").count() == 0
+    assert job_stats.snapshot()["release_expired_reservations"]["failures"] == failures + 1
+
+
+def test_cancel_rechecks_status_of_locked_row(db):
+    [reservation_id] = _seed_overdue_reservations(db, 1)
+    reservation = db.get(Reservation, reservation_id)
+    assert reservation.status == ReservationStatus.PENDING
+
+    # 세션에 로드된 뒤 상태가 바뀐 경우 (만료 처리가 먼저 커밋됨)
+    db.execute(
+        update(Reservation.__table__).where(Reservation.id == reservation_id).values(status=ReservationStatus.EXPIRED)
+    )
+
+    with pytest.raises(ValueError):
+        ReservationService.cancel_reservation(
+            db, reservation_id, ReservationCancel(reason="취소"), user_id=reservation.user_id, is_admin=True
+        )
+    assert db.get(Reservation, reservation_id).status == ReservationStatus.PENDING  # 롤백됨
@@ -0,0 +1,16 @@
+import asyncio
+
+from app.core.scheduler import JobScheduler
+
+
+def test_job_is_skipped_when_lock_backend_is_unavailable():
+    # conftest의 REDIS_URL은 연결되지 않는 주소
+    calls = []
+    scheduler = JobScheduler()
+    scheduler.add_job("noop", calls.append, 60)
+    job = scheduler._jobs["noop"]
+
+    assert asyncio.run(scheduler.run_job(job)) is False
+    assert calls == []
+    assert job.lock_errors == 1
+    assert job.runs == 0
@@ -0,0 +1,106 @@
+from sqlalchemy import event
+
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.statistic_counter import StatisticCounter
+from app.services.statistics_service import StatisticsService
+
+
+def _counters(db) -> dict:
+    db.expire_all()
+    return {counter.name: counter.value for counter in db.query(StatisticCounter)}
+
+
+def test_counters_follow_changes_to_expired_objects(db):
+    category = Category(name="테스트")
+    db.add(category)
+    db.flush()
+    item = Item(name="품목", serial_number="STAT001", category_id=category.id)
+    db.add(item)
+    db.commit()
+    assert _counters(db)["items.status.AVAILABLE"] == 1
+
+    # 속성이 만료된 상태에서 수정해도 변경 전 값으로 카운터를 옮김
+    db.expire(item)
+    item.status = ItemStatus.RENTED
+    db.commit()
+    counters = _counters(db)
+    assert counters["items.status.AVAILABLE"] == 0
+    assert counters["items.status.RENTED"] == 1
+
+    db.expire(item)
+    item.is_active = False
+    db.commit()
+    counters = _counters(db)
+    assert counters["items.status.RENTED"] == 0
+    assert counters["items.active"] == 0
+    assert counters[f"items.category.{category.id}"] == 0
+
+
+def test_counter_deltas_are_written_once_at_commit(db):
+    category = Category(name="테스트")
+    db.add(category)
+    db.commit()
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "statistic_counters" in statement:
+            statements.append(parameters)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        item = Item(name="품목", serial_number="STAT002", category_id=category.id)
+        db.add(item)
+        db.flush()
+        item.status = ItemStatus.RESERVED
+        db.flush()
+        assert statements == []
+
+        db.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # 두 번의 flush 증분이 합쳐져 한 문장으로, 이름 순서대로 반영됨
+    assert len(statements) == 1
+    names = [value for value in statements[0] if isinstance(value, str)]
+    assert names == sorted(names)
+    counters = _counters(db)
+    assert counters["items.status.RESERVED"] == 1
+    # 같은 트랜잭션에서 상쇄된 증분은 기록하지 않음
+    assert "items.status.AVAILABLE" not in counters
+
+
+def test_counter_deltas_are_discarded_on_rollback(db):
+    category = Category(name="테스트")
+    db.add(category)
+    db.commit()
+
+    db.add(Item(name="품목", serial_number="STAT003", category_id=category.id))
+    db.flush()
+    db.rollback()
+    db.add(Category(name="다른 카테고리"))
+    db.commit()
+
+    counters = _counters(db)
+    assert counters.get("items.active", 0) == 0
+    assert counters["categories.total"] == 2
+
+
+def test_reconcile_applies_corrections_as_deltas(db):
+    category = Category(name="테스트")
+    db.add(category)
+    db.flush()
+    db.add(Item(name="품목", serial_number="STAT004", category_id=category.id))
+    db.commit()
+
+    # 어긋난 카운터와 지난 날짜의 일별 카운터
+    db.query(StatisticCounter).filter(StatisticCounter.name == "items.active").update({"value": 5})
+    db.add(StatisticCounter(name="rentals.created.2000-01-01", value=3))
+    db.commit()
+
+    assert StatisticsService.reconcile_counters(db) == 1
+    counters = _counters(db)
+    assert counters["items.active"] == 1
+    assert "rentals.created.2000-01-01" not in counters